@@ -1,8 +1,17 @@
 """CLI entrypoint for AI Journal Kit."""
 
+import sys
+
 
 def main():
     """Main CLI entrypoint."""
+    # Answer a bare --version before Typer, Rich, and the commands are imported
+    if sys.argv[1:] in (["--version"], ["-v"]):
+        from ai_journal_kit import __version__
+
+        print(f"ai-journal-kit version {__version__}")
+        return
+
     from ai_journal_kit.cli.app import app
 
     app()
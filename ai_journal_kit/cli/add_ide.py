@@ -7,6 +7,21 @@ from ai_journal_kit.core.templates import copy_ide_configs
 from ai_journal_kit.core.validation import validate_ide
 from ai_journal_kit.utils.ui import ask_ide, console, show_error, show_success
 
+IDE_NAMES = {
+    "cursor": "Cursor",
+    "windsurf": "Windsurf",
+    "claude-code": "Claude Code (Cline)",
+    "copilot": "GitHub Copilot",
+}
+
+# What each IDE's install adds, shown in the success message
+IDE_SUCCESS_LINES = {
+    "cursor": "• Cursor: .cursor/rules/*.mdc\n",
+    "windsurf": "• Windsurf: .windsurf/rules/*.md\n",
+    "claude-code": "• Claude Code: CLAUDE.md, SYSTEM-PROTECTION.md\n",
+    "copilot": "• GitHub Copilot: .github/instructions/*.md\n",
+}
+
 
 def add_ide(
     ide: str = typer.Argument(
@@ -49,18 +64,9 @@ def add_ide(
     # Show what will be installed
     if ide == "all":
         console.print("\n[cyan]Installing configs for:[/cyan]")
-        console.print("  • Cursor")
-        console.print("  • Windsurf")
-        console.print("  • Claude Code (Cline)")
-        console.print("  • GitHub Copilot\n")
+        console.print("".join(f"  • {name}\n" for name in IDE_NAMES.values()))
     else:
-        ide_names = {
-            "cursor": "Cursor",
-            "windsurf": "Windsurf",
-            "claude-code": "Claude Code (Cline)",
-            "copilot": "GitHub Copilot",
-        }
-        console.print(f"\n[cyan]Installing {ide_names.get(ide, ide)} configuration...[/cyan]\n")
+        console.print(f"\n[cyan]Installing {IDE_NAMES.get(ide, ide)} configuration...[/cyan]\n")
 
     # Install IDE configs
     try:
@@ -75,14 +81,8 @@ def add_ide(
         "[bold]What was added:[/bold]\n"
     )
 
-    if ide == "all" or ide == "cursor":
-        success_msg += "• Cursor: .cursor/rules/*.mdc\n"
-    if ide == "all" or ide == "windsurf":
-        success_msg += "• Windsurf: .windsurf/rules/*.md\n"
-    if ide == "all" or ide == "claude-code":
-        success_msg += "• Claude Code: CLAUDE.md, SYSTEM-PROTECTION.md\n"
-    if ide == "all" or ide == "copilot":
-        success_msg += "• GitHub Copilot: .github/instructions/*.md\n"
+    targets = IDE_SUCCESS_LINES if ide == "all" else [ide]
+    success_msg += "".join(IDE_SUCCESS_LINES[target] for target in targets)
 
     success_msg += "\n[dim]Your journal content and settings remain untouched.[/dim]"
 
@@ -1,30 +1,64 @@
 """Typer application instance and CLI setup."""
 
+import importlib
+
 import typer
+from typer.core import TyperGroup
+from typer.models import CommandInfo
+
+# Command name -> "module:function". Command modules are only imported when
+# Click resolves the command, so `--version` and each subcommand skip the
+# import graphs of every other command.
+COMMANDS = {
+    "setup": "ai_journal_kit.cli.setup:setup",
+    "use": "ai_journal_kit.cli.use_journal:use_journal",
+    "list": "ai_journal_kit.cli.list_journals:list_journals",
+    "search": "ai_journal_kit.cli.search:search",
+    "add-ide": "ai_journal_kit.cli.add_ide:add_ide",
+    "switch-framework": "ai_journal_kit.cli.switch_framework:switch_framework",
+    "customize-template": "ai_journal_kit.cli.customize_template:customize_template",
+    "status": "ai_journal_kit.cli.status:status",
+    "doctor": "ai_journal_kit.cli.doctor:doctor",
+    "update": "ai_journal_kit.cli.update:update",
+    "move": "ai_journal_kit.cli.move:move",
+}
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that imports command modules on first use."""
+
+    def list_commands(self, ctx) -> list[str]:
+        """List all commands in registration order without importing them."""
+        return list(COMMANDS)
+
+    def get_command(self, ctx, cmd_name: str):
+        """Import and build the Click command for `cmd_name` on demand."""
+        command = self.commands.get(cmd_name)
+        if command is None and cmd_name in COMMANDS:
+            module_name, func_name = COMMANDS[cmd_name].split(":")
+            callback = getattr(importlib.import_module(module_name), func_name)
+            command = typer.main.get_command_from_info(
+                CommandInfo(name=cmd_name, callback=callback),
+                pretty_exceptions_short=app.pretty_exceptions_short,
+                rich_markup_mode=self.rich_markup_mode,
+            )
+            self.commands[cmd_name] = command
+        return command
 
-from ai_journal_kit import __version__
-from ai_journal_kit.cli.add_ide import add_ide as add_ide_command
-from ai_journal_kit.cli.customize_template import customize_template as customize_template_command
-from ai_journal_kit.cli.doctor import doctor as doctor_command
-from ai_journal_kit.cli.list_journals import list_journals as list_journals_command
-from ai_journal_kit.cli.move import move as move_command
-from ai_journal_kit.cli.search import search as search_command
-from ai_journal_kit.cli.setup import setup as setup_command
-from ai_journal_kit.cli.status import status as status_command
-from ai_journal_kit.cli.switch_framework import switch_framework as switch_framework_command
-from ai_journal_kit.cli.update import update as update_command
-from ai_journal_kit.cli.use_journal import use_journal as use_journal_command
 
 app = typer.Typer(
     name="ai-journal-kit",
     help="AI-powered journaling system with beautiful CLI",
     add_completion=False,
+    cls=LazyTyperGroup,
 )
 
 
 def version_callback(value: bool):
     """Show version and exit."""
     if value:
+        from ai_journal_kit import __version__
+
         typer.echo(f"ai-journal-kit version {__version__}")
         raise typer.Exit()
 
@@ -42,17 +76,3 @@ def main(
 ):
     """AI Journal Kit - Setup, customize, and update your AI-powered journal."""
     pass
-
-
-# Register commands
-app.command(name="setup")(setup_command)
-app.command(name="use")(use_journal_command)
-app.command(name="list")(list_journals_command)
-app.command(name="search")(search_command)
-app.command(name="add-ide")(add_ide_command)
-app.command(name="switch-framework")(switch_framework_command)
-app.command(name="customize-template")(customize_template_command)
-app.command(name="status")(status_command)
-app.command(name="doctor")(doctor_command)
-app.command(name="update")(update_command)
-app.command(name="move")(move_command)
@@ -1,7 +1,5 @@
 """Customize template command for safely overriding framework templates."""
 
-import shutil
-
 import typer
 
 from ai_journal_kit.core.config import load_config
@@ -38,7 +36,7 @@ def customize_template(
         raise typer.Exit(1)
 
     # Ensure manifest exists (auto-migrate old journals)
-    ensure_manifest_exists()
+    ensure_manifest_exists(config)
 
     journal_path = config.journal_location
 
@@ -75,6 +73,8 @@ def customize_template(
         raise typer.Exit(0)
 
     # Copy template to safe zone
+    import shutil
+
     shutil.copy2(source_template, dest_template)
 
     # Success message
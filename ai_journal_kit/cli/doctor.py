@@ -1,15 +1,19 @@
 """Doctor command for diagnosing and fixing common issues."""
 
+import os
 from pathlib import Path
 
 import typer
 
 from ai_journal_kit.core.config import load_config
-from ai_journal_kit.core.journal import create_structure, validate_structure
+from ai_journal_kit.core.journal import REQUIRED_FOLDERS, create_structure
 from ai_journal_kit.core.symlinks import create_link, is_broken
 from ai_journal_kit.core.templates import copy_ide_configs
 from ai_journal_kit.utils.ui import console, show_error, show_success
 
+# IDE config directories whose contents the IDE check looks at
+IDE_CONFIG_DIRS = (".cursor", ".windsurf", ".github")
+
 
 def doctor(
     fix: bool = typer.Option(False, "--fix", help="Automatically fix issues"),
@@ -36,14 +40,19 @@ def doctor(
     # Check 1: Config file
     _print_check("Config file valid", True, verbose)
 
+    # One directory read answers the existence, structure and IDE checks
+    scan = _scan_journal(config.journal_location)
+    entries = scan["entries"]
+
     # Check 2: Journal location exists
-    journal_exists = config.journal_location.exists()
+    journal_exists = entries is not None
     _print_check("Journal location exists", journal_exists, verbose)
     if not journal_exists:
         issues.append(("journal_missing", "Journal location does not exist"))
 
     # Check 3: Journal structure
-    structure_valid, missing = validate_structure(config.journal_location)
+    missing = [folder for folder in REQUIRED_FOLDERS if folder not in (entries or {})]
+    structure_valid = not missing
     _print_check("Journal structure complete", structure_valid, verbose)
     if not structure_valid:
         issues.append(("missing_folders", f"Missing folders: {', '.join(missing)}"))
@@ -51,7 +60,7 @@ def doctor(
             console.print(f"  [dim]Missing: {', '.join(missing)}[/dim]")
 
     # Check 4: IDE configs
-    ide_configs_exist = _check_ide_configs(config)
+    ide_configs_exist = _check_ide_configs(config, scan)
     _print_check("IDE configurations installed", ide_configs_exist, verbose)
     if not ide_configs_exist:
         issues.append(("missing_ide_configs", f"IDE configs missing for {config.ide}"))
@@ -64,7 +73,10 @@ def doctor(
             issues.append(("broken_symlink", f"Symlink broken: {config.symlink_source}"))
 
     # Check 6: Permissions
-    writable = config.journal_location.exists() and _is_writable(config.journal_location)
+    writable = scan["writable"]
+    if writable and verbose:
+        # os.access can't see ACLs or root-squashed mounts; verbose does a real write
+        writable = _can_write(config.journal_location)
     _print_check("Permissions OK", writable, verbose)
     if not writable:
         issues.append(("permissions", "Journal location not writable"))
@@ -132,32 +144,60 @@ def doctor(
         console.print("See suggestions above for manual fixes.\n")
 
 
-def _check_ide_configs(config) -> bool:
-    """Check if IDE configs are installed."""
+def _scan_journal(path: Path) -> dict:
+    """Read the journal root, plus any IDE config directories, once for all doctor checks.
+
+    Returns:
+        Dict with "entries" (child name -> DirEntry, or None if the journal
+        can't be read), "children" (IDE config dir name -> set of its entry
+        names) and "writable"
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = {entry.name: entry for entry in it}
+    except OSError:
+        return {"entries": None, "children": {}, "writable": False}
+
+    children = {}
+    for name in IDE_CONFIG_DIRS:
+        entry = entries.get(name)
+        if entry is not None and entry.is_dir():
+            try:
+                with os.scandir(entry.path) as it:
+                    children[name] = {child.name for child in it}
+            except OSError:
+                pass
+
+    return {"entries": entries, "children": children, "writable": os.access(path, os.W_OK)}
+
+
+def _can_write(path: Path) -> bool:
+    """Confirm a directory is writable by creating an anonymous temporary file."""
+    import tempfile
+
+    try:
+        with tempfile.TemporaryFile(dir=path):
+            return True
+    except OSError:
+        return False
+
+
+def _check_ide_configs(config, scan: dict) -> bool:
+    """Check if IDE configs are installed, using the scanned journal."""
+    children = scan["children"]
     if config.ide == "cursor":
-        return (config.journal_location / ".cursor" / "rules").exists()
+        return "rules" in children.get(".cursor", ())
     elif config.ide == "windsurf":
-        return (config.journal_location / ".windsurf" / "rules").exists()
+        return "rules" in children.get(".windsurf", ())
     elif config.ide == "claude-code":
-        return (config.journal_location / "CLAUDE.md").exists()
+        return "CLAUDE.md" in (scan["entries"] or {})
     elif config.ide == "copilot":
-        return (config.journal_location / ".github" / "copilot-instructions.md").exists()
+        return "copilot-instructions.md" in children.get(".github", ())
     elif config.ide == "all":
         return True
     return False
 
 
-def _is_writable(path: Path) -> bool:
-    """Check if path is writable."""
-    try:
-        test_file = path / ".write_test"
-        test_file.touch()
-        test_file.unlink()
-        return True
-    except (OSError, PermissionError):
-        return False
-
-
 def _print_check(label: str, passed: bool, verbose: bool):
     """Print a check result."""
     if verbose or not passed:
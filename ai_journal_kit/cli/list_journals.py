@@ -1,9 +1,6 @@
 """List command to show all configured journals."""
 
-import json
-
 import typer
-from rich.table import Table
 
 from ai_journal_kit.core.config import get_active_journal_name, load_multi_journal_config
 from ai_journal_kit.utils.ui import console, show_error
@@ -31,6 +28,10 @@ def list_journals(
 
     if json_output:
         # JSON output
+        import sys
+
+        from ai_journal_kit.utils import jsonio
+
         output = {
             "active_journal": active_name,
             "journals": {},
@@ -48,30 +49,40 @@ def list_journals(
                 "is_active": name == active_name,
             }
 
-        print(json.dumps(output, indent=2))
+        jsonio.dump(output, sys.stdout, indent=True)
     else:
-        # Rich table output
-        table = Table(title="Configured Journals", show_header=True)
-        table.add_column("Name", style="cyan")
-        table.add_column("Location")
-        table.add_column("Framework")
-        table.add_column("IDE")
-        table.add_column("Status", justify="center")
-
-        for name, profile in multi_config.journals.items():
-            status = "✓ Active" if name == active_name else ""
-            status_style = "green bold" if name == active_name else "dim"
-
-            table.add_row(
+        rows = [
+            (
                 name,
                 str(profile.location),
                 profile.framework,
                 profile.ide,
-                f"[{status_style}]{status}[/{status_style}]",
+                "[green bold]✓ Active[/green bold]" if name == active_name else "",
             )
+            for name, profile in multi_config.journals.items()
+        ]
+
+        if len(rows) == 1:
+            # A single journal reads fine as one line; skip building a table
+            name, location, framework, ide, status = rows[0]
+            console.print("\n[bold]Configured Journals[/bold]")
+            console.print(f"  [cyan]{name}[/cyan]  {location}  ({framework}, {ide})  {status}")
+        else:
+            # Rich table output
+            from rich.table import Table
+
+            table = Table(title="Configured Journals", show_header=True)
+            table.add_column("Name", style="cyan")
+            table.add_column("Location")
+            table.add_column("Framework")
+            table.add_column("IDE")
+            table.add_column("Status", justify="center")
+            for row in rows:
+                table.add_row(*row)
+
+            console.print()
+            console.print(table)
 
-        console.print()
-        console.print(table)
         console.print()
         console.print("[dim]Switch journals with: [cyan]ai-journal-kit use <name>[/cyan][/dim]")
         console.print(
@@ -1,12 +1,17 @@
 """Move command for relocating journal to a new location."""
 
+import os
 import shutil
+import sys
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import typer
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ai_journal_kit.core.config import get_config_path, load_config, save_config
+from ai_journal_kit.core.fastcopy import copy_file
 from ai_journal_kit.core.symlinks import update_link_target
 from ai_journal_kit.core.validation import validate_path
 from ai_journal_kit.utils.ui import (
@@ -86,7 +91,7 @@ def move(
         raise typer.Exit(1)
 
     # Check if destination already has files
-    if new_path.exists() and any(new_path.iterdir()):
+    if _nonempty_dir(new_path):
         console.print(f"\n[yellow]Warning: {new_path} already contains files.[/yellow]\n")
         console.print("Options:")
         console.print("  1. Cancel (recommended)")
@@ -125,21 +130,47 @@ def move(
             raise typer.Exit(0)
 
     # Execute move
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    # Where the journal lives and the config points, as each step completes
+    location = current_location
+    config_saved = False
     try:
         with Progress(
             SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
         ) as progress:
             # Move files
             task1 = progress.add_task("Moving files...", total=None)
-            if not new_path.exists():
-                new_path.mkdir(parents=True, exist_ok=True)
-            shutil.copytree(current_location, new_path, dirs_exist_ok=True)
+            renamed = _same_filesystem(current_location, new_path) and not _nonempty_dir(new_path)
+            if renamed:
+                # Same filesystem and nothing to merge: one rename moves everything
+                if new_path.exists():
+                    new_path.rmdir()
+                os.rename(current_location, new_path)
+                location = new_path
+            else:
+                if not new_path.exists():
+                    new_path.mkdir(parents=True, exist_ok=True)
+
+                def show_copied(copied: int, total: int) -> None:
+                    progress.update(task1, description=f"Copying files... ({copied}/{total})")
+
+                _parallel_copytree(current_location, new_path, on_copy=show_copied)
             progress.update(task1, completed=True)
 
             # Update config
             task2 = progress.add_task("Updating configuration...", total=None)
             config.journal_location = new_path
-            save_config(config)
+            try:
+                save_config(config)
+            except Exception:
+                # The config still points at the old path, so put the journal back
+                if renamed:
+                    os.rename(new_path, current_location)
+                    location = current_location
+                raise
+            location = new_path
+            config_saved = True
             progress.update(task2, completed=True)
 
             # Update symlink if applicable
@@ -148,14 +179,132 @@ def move(
                 update_link_target(config.symlink_source, new_path)
                 progress.update(task3, completed=True)
 
-            # Clean up old location
-            task4 = progress.add_task("Cleaning up old location...", total=None)
-            shutil.rmtree(current_location)
-            progress.update(task4, completed=True)
+            # Clean up old location (a rename leaves nothing behind). The
+            # move has succeeded by now, so failing here only earns a warning
+            if not renamed:
+                task4 = progress.add_task("Cleaning up old location...", total=None)
+                try:
+                    _remove_in_background(current_location, on_error=_warn_leftover)
+                except OSError as e:
+                    _warn_leftover(current_location, e)
+                progress.update(task4, completed=True)
 
         show_success("Journal moved successfully!")
         console.print(f"\nNew location: [cyan]{new_path}[/cyan]\n")
 
     except Exception as e:
-        show_error(f"Move failed: {e}", "Your journal is still at the original location.")
+        if location == current_location:
+            show_error(f"Move failed: {e}", "Your journal is still at the original location.")
+        elif config_saved:
+            show_error(
+                f"Move failed: {e}",
+                f"Your journal was moved to {new_path} and the configuration updated.",
+            )
+        else:
+            show_error(
+                f"Move failed: {e}",
+                f"Your journal is now at {new_path}, but the configuration still "
+                f"points to {current_location}. Move it back there by hand.",
+            )
         raise typer.Exit(1)
+
+
+def _nonempty_dir(path: Path) -> bool:
+    """Check if path is a directory with at least one entry, reading only one."""
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def _same_filesystem(source: Path, destination: Path) -> bool:
+    """Check if destination would live on the same filesystem as source."""
+    try:
+        return source.stat().st_dev == destination.parent.stat().st_dev
+    except OSError:
+        return False
+
+
+def _parallel_copytree(source: Path, destination: Path, on_copy=None) -> int:
+    """Copy a directory tree, overlapping per-file copies on a thread pool.
+
+    File copies are bound by syscall latency rather than CPU, so running them
+    concurrently hides most of that latency on slow or networked disks.
+
+    Args:
+        source: Directory to copy
+        destination: Directory to copy into (merged if it already exists)
+        on_copy: Optional callback called with (copied, total) after each file
+
+    Returns:
+        Number of files copied
+    """
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    copied_dirs = []
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = []
+        for root, _dirs, files in os.walk(source, followlinks=True):
+            source_dir = Path(root)
+            target_dir = destination / source_dir.relative_to(source)
+            target_dir.mkdir(parents=True, exist_ok=True)
+            copied_dirs.append((source_dir, target_dir))
+            for name in files:
+                futures.append(pool.submit(copy_file, source_dir / name, target_dir / name))
+
+        for copied, future in enumerate(as_completed(futures), start=1):
+            future.result()
+            if on_copy:
+                on_copy(copied, len(futures))
+
+    # Directory metadata last, so file writes don't bump the copied mtimes
+    for source_dir, target_dir in reversed(copied_dirs):
+        shutil.copystat(source_dir, target_dir)
+
+    return len(futures)
+
+
+def _remove_in_background(path: Path, on_error=None) -> threading.Thread:
+    """Rename a directory out of the way and delete it on a background thread.
+
+    The rename is a single syscall, so the old location disappears at once
+    while the per-file unlinks happen off the critical path. The thread is
+    non-daemon, so the interpreter waits for the delete before exiting.
+
+    Args:
+        path: Directory to remove
+        on_error: Optional callback called with (leftover path, error) if
+            anything could not be deleted
+
+    Returns:
+        The thread doing the delete
+    """
+    trash = path.with_name(f".{path.name}.old-{uuid.uuid4().hex}")
+    os.rename(path, trash)
+
+    def remove():
+        errors = []
+
+        def record(_func, _path, exc):
+            errors.append(exc)
+
+        # rmtree keeps going past failures; onexc replaces onerror in 3.12
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(trash, onexc=record)
+        else:
+            shutil.rmtree(trash, onerror=lambda func, p, info: record(func, p, info[1]))
+        if errors and on_error:
+            on_error(trash, errors[0])
+
+    thread = threading.Thread(target=remove)
+    thread.start()
+    return thread
+
+
+def _warn_leftover(path: Path, error: BaseException):
+    """Tell the user the old journal copy at path could not be removed."""
+    console.print(
+        f"[yellow]Warning: could not remove the old copy at {path} ({error}). "
+        "Your journal was moved; delete it by hand.[/yellow]"
+    )
@@ -6,21 +6,39 @@ using text search and filters.
 Issue: #6 - Search & Filter Enhancement
 """
 
+import functools
+import time
+from collections.abc import Iterable
 from datetime import date
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
 
-from ai_journal_kit.core.config import load_config
 from ai_journal_kit.core.date_utils import parse_date
-from ai_journal_kit.core.search_engine import SearchEngine
-from ai_journal_kit.core.search_result import EntryType, SearchQuery
+from ai_journal_kit.core.search_result import EntryType, SearchQuery, SearchResult
 from ai_journal_kit.utils.ui import console, show_error, show_success
 
+if TYPE_CHECKING:
+    from ai_journal_kit.core.search_engine import SearchEngine
+
 # Typer app for search command
 app = typer.Typer()
 
+# Results rendered per terminal write when streaming
+RESULT_BATCH_SIZE = 32
+
+# Rule printed between results
+RESULT_SEPARATOR = f"[dim]{'─' * 80}[/dim]"
+
+# Number of entry types, for telling whether a type filter narrows anything
+TOTAL_ENTRY_TYPES = len(EntryType)
+
+# Lowercase --type token -> EntryType, built once for O(1) parsing
+ENTRY_TYPE_LOOKUP = {entry_type.value: entry_type for entry_type in EntryType}
+
 
 def search(
     query: str = typer.Argument(..., help="Text to search for in journal entries"),
@@ -57,7 +75,7 @@ def search(
     limit: int | None = typer.Option(
         None,
         "--limit",
-        help="Limit results to N matches",
+        help="Stop searching after N matches",
     ),
 ):
     """
@@ -75,17 +93,6 @@ def search(
             show_error("Search query cannot be empty")
             raise typer.Exit(1)
 
-        # Get journal path from config
-        config = load_config()
-        if not config:
-            show_error("No journal configuration found. Please run setup first.")
-            raise typer.Exit(1)
-        journal_path = config.journal_location
-
-        if not journal_path.exists():
-            show_error(f"Journal path does not exist: {journal_path}")
-            raise typer.Exit(1)
-
         # Parse date filters
         date_after = None
         date_before = None
@@ -120,14 +127,27 @@ def search(
                 show_error(str(e))
                 raise typer.Exit(1)
 
-        # Create SearchEngine
-        engine = SearchEngine(journal_path)
+        # Get journal path from config, once the arguments are known to be valid
+        from ai_journal_kit.core.config import load_config
 
-        # Execute search (cross-reference or regular)
+        config = load_config()
+        if not config:
+            show_error("No journal configuration found. Please run setup first.")
+            raise typer.Exit(1)
+        journal_path = config.journal_location
+
+        if not journal_path.exists():
+            show_error(f"Journal path does not exist: {journal_path}")
+            raise typer.Exit(1)
+
+        # Reuse this process's engine (and its open index) for the journal
+        engine = _get_engine(str(journal_path))
+
+        # Build the query (cross-reference or regular)
         if ref:
             # Cross-reference search
             try:
-                result_set = engine.search_cross_references(
+                search_query = engine.cross_reference_query(
                     reference=ref,
                     entry_types=entry_types,
                     date_after=date_after,
@@ -147,7 +167,16 @@ def search(
                 case_sensitive=case_sensitive,
                 limit=limit,
             )
-            result_set = engine.search(search_query)
+
+        if not export:
+            # Show results as they're found; the count and time come last
+            start_time = time.perf_counter()
+            display_search_header(search_query)
+            result_count = stream_search_results(engine.search_iter(search_query), console)
+            display_search_summary(result_count, (time.perf_counter() - start_time) * 1000)
+            return
+
+        result_set = engine.search(search_query)
 
         # Display header
         display_search_header(
@@ -158,16 +187,15 @@ def search(
         format_search_results(result_set, console)
 
         # Export if requested
-        if export:
-            if confirm_file_overwrite(export):
-                try:
-                    result_set.export_to_markdown(export)
-                    show_success(f"Results exported to {export}")
-                except Exception as e:
-                    show_error(f"Failed to export results: {e}")
-                    raise typer.Exit(1)
-            else:
-                console.print("[yellow]Export cancelled[/yellow]")
+        if confirm_file_overwrite(export):
+            try:
+                result_set.export_to_markdown(export)
+                show_success(f"Results exported to {export}")
+            except Exception as e:
+                show_error(f"Failed to export results: {e}")
+                raise typer.Exit(1)
+        else:
+            console.print("[yellow]Export cancelled[/yellow]")
 
     except typer.Exit:
         raise
@@ -176,6 +204,27 @@ def search(
         raise typer.Exit(1)
 
 
+@functools.lru_cache(maxsize=4)
+def _get_engine(path_str: str) -> "SearchEngine":
+    """
+    Get the search engine for a journal, building it once per process.
+
+    Repeated searches of the same journal reuse the engine and its open
+    index. Nothing about the journal's contents is cached here: every search
+    rescans the files and the index refreshes changed ones itself. Call
+    _get_engine.cache_clear() to drop every cached engine.
+
+    Args:
+        path_str: Journal directory path
+
+    Returns:
+        SearchEngine for the journal
+    """
+    from ai_journal_kit.core.search_engine import SearchEngine
+
+    return SearchEngine(Path(path_str))
+
+
 def format_search_results(result_set, console: Console) -> None:
     """
     Format and display search results with Rich.
@@ -184,30 +233,56 @@ def format_search_results(result_set, console: Console) -> None:
         result_set: SearchResultSet to display
         console: Rich Console instance
     """
-    if result_set.is_empty:
-        console.print("[yellow]No results found[/yellow]")
-        return
+    stream_search_results(result_set.results, console)
+
+
+def stream_search_results(
+    results: Iterable[SearchResult], console: Console, batch_size: int = RESULT_BATCH_SIZE
+) -> int:
+    """
+    Display search results with Rich as they arrive.
 
-    # Display each result
-    for i, result in enumerate(result_set.results):
-        if i > 0:
-            console.print("[dim]" + "─" * 80 + "[/dim]")
+    Results are rendered in batches so the terminal is written once per
+    batch rather than once per line.
 
-        # Display result with formatting
-        display_text = result.format_display(highlight=True)
-        console.print(display_text)
+    Args:
+        results: Search results, e.g. from SearchEngine.search_iter
+        console: Rich Console instance
+        batch_size: Number of results to render per terminal write
+
+    Returns:
+        Number of results displayed
+    """
+    count = 0
+    results = iter(results)
+    while batch := list(islice(results, batch_size)):
+        # Console buffers output until the with block exits
+        with console:
+            for result in batch:
+                if count > 0:
+                    console.print(RESULT_SEPARATOR)
+
+                # Display result with formatting
+                console.print(result.format_display(highlight=True))
+                count += 1
+
+    if count == 0:
+        console.print("[yellow]No results found[/yellow]")
+    return count
 
 
-def display_search_header(query: SearchQuery, result_count: int, execution_time: float) -> None:
+def display_search_header(
+    query: SearchQuery, result_count: int | None = None, execution_time: float | None = None
+) -> None:
     """
     Display search header with query and filters.
 
     Args:
         query: SearchQuery that was executed
-        result_count: Number of results found
+        result_count: Number of results found (omitted when results are streamed)
         execution_time: Execution time in milliseconds
     """
-    console.print(f"\n🔍 [bold cyan]Search:[/bold cyan] {query.search_text}")
+    lines = [f"\n🔍 [bold cyan]Search:[/bold cyan] {query.search_text}"]
 
     # Display filters if any
     filters = []
@@ -215,7 +290,7 @@ def display_search_header(query: SearchQuery, result_count: int, execution_time:
         filters.append(f"After: {query.date_after}")
     if query.date_before:
         filters.append(f"Before: {query.date_before}")
-    if query.entry_types and len(query.entry_types) < len(EntryType):
+    if query.entry_types and len(query.entry_types) < TOTAL_ENTRY_TYPES:
         type_names = ", ".join(t.display_name() for t in query.entry_types)
         filters.append(f"Types: {type_names}")
     if query.case_sensitive:
@@ -224,11 +299,31 @@ def display_search_header(query: SearchQuery, result_count: int, execution_time:
         filters.append(f"Limit: {query.limit}")
 
     if filters:
-        console.print(f"[dim]Filters: {' | '.join(filters)}[/dim]")
+        lines.append(f"[dim]Filters: {' | '.join(filters)}[/dim]")
+
+    if result_count is None:
+        lines.append("")
+    else:
+        lines.append(_summary_line(result_count, execution_time or 0.0))
+
+    # One print means one markup parse and one terminal write
+    console.print("\n".join(lines))
+
+
+def display_search_summary(result_count: int, execution_time: float) -> None:
+    """
+    Display the number of results found and how long the search took.
 
-    console.print(
-        f"[bold green]Found {result_count} results[/bold green] [dim]({execution_time:.0f}ms)[/dim]\n"
-    )
+    Args:
+        result_count: Number of results found
+        execution_time: Execution time in milliseconds
+    """
+    console.print(_summary_line(result_count, execution_time))
+
+
+def _summary_line(result_count: int, execution_time: float) -> str:
+    """Format the results-found line, followed by a blank line."""
+    return f"[bold green]Found {result_count} results[/bold green] [dim]({execution_time:.0f}ms)[/dim]\n"
 
 
 def parse_entry_types(type_str: str) -> list[EntryType]:
@@ -248,10 +343,11 @@ def parse_entry_types(type_str: str) -> list[EntryType]:
     for type_part in type_str.split(","):
         type_part = type_part.strip()
         if type_part:
-            try:
-                types.append(EntryType.from_string(type_part))
-            except ValueError as e:
-                raise ValueError(f"Invalid entry type: '{type_part}'. {e}") from e
+            entry_type = ENTRY_TYPE_LOOKUP.get(type_part.lower())
+            if entry_type is None:
+                valid_types = ", ".join(ENTRY_TYPE_LOOKUP)
+                raise ValueError(f"Invalid entry type: '{type_part}'. Valid types: {valid_types}")
+            types.append(entry_type)
 
     if not types:
         raise ValueError("No entry types specified")
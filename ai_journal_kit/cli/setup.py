@@ -1,20 +1,18 @@
 """Setup command for first-time journal installation."""
 
+import os
 from pathlib import Path
 
 import typer
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ai_journal_kit import __version__
-from ai_journal_kit.core.config import (
-    JournalProfile,
-    load_multi_journal_config,
-    save_multi_journal_config,
+from ai_journal_kit.core.manifest import TEMPLATE_SUFFIX, Manifest, find_templates
+from ai_journal_kit.core.validation import (
+    FRAMEWORK_DISPLAY_NAMES,
+    validate_framework,
+    validate_ide,
+    validate_path,
 )
-from ai_journal_kit.core.journal import create_structure
-from ai_journal_kit.core.manifest import Manifest
-from ai_journal_kit.core.templates import copy_ide_configs
-from ai_journal_kit.core.validation import validate_framework, validate_ide, validate_path
 from ai_journal_kit.utils.ui import (
     ask_framework,
     ask_ide,
@@ -26,6 +24,34 @@ from ai_journal_kit.utils.ui import (
     show_success,
 )
 
+# Detection key, IDE name and the journal entries that mark its config, in the
+# order a re-install prefers them
+IDE_MARKERS = (
+    ("ide_cursor", "cursor", (".cursor",)),
+    ("ide_windsurf", "windsurf", (".windsurf",)),
+    ("ide_claude_code", "claude-code", ("CLAUDE.md", "SYSTEM-PROTECTION.md")),
+    ("ide_copilot", "copilot", (".github/instructions",)),
+)
+
+# Panel text around the list of what an existing journal contains
+EXISTING_JOURNAL_HEADER = """[bold yellow]⚠️  Existing Journal Detected[/bold yellow]
+
+The path [cyan]{path}[/cyan] already contains:
+"""
+
+EXISTING_JOURNAL_OPTIONS = """
+
+[bold]What will happen if you proceed:[/bold]
+• Journal folders will be preserved (your content is safe)
+• IDE configurations will be reinstalled (any customizations should be in .ai-instructions/)
+• Templates will be overwritten with selected framework templates
+• User customizations in .ai-instructions/ will be preserved
+
+[bold]Options:[/bold]
+1. Proceed with re-installation (update this journal)
+2. Cancel and change the path to create a new journal elsewhere
+"""
+
 
 def _detect_existing_journal(path: Path) -> dict[str, bool]:
     """Detect existing journal content at the specified path.
@@ -38,28 +64,34 @@ def _detect_existing_journal(path: Path) -> dict[str, bool]:
     """
     detected = {}
 
+    # One directory read answers every top-level check
+    try:
+        with os.scandir(path) as it:
+            names = {entry.name for entry in it}
+    except OSError:
+        return detected
+
     # Check for journal structure folders
     journal_folders = ["daily", "projects", "people", "memories", "areas", "resources", "archive"]
     for folder in journal_folders:
-        if (path / folder).exists():
+        if folder in names:
             detected[f"folder_{folder}"] = True
 
-    # Check for IDE configurations
-    if (path / ".cursor").exists():
-        detected["ide_cursor"] = True
-    if (path / ".windsurf").exists():
-        detected["ide_windsurf"] = True
-    if (path / "CLAUDE.md").exists() or (path / "SYSTEM-PROTECTION.md").exists():
-        detected["ide_claude_code"] = True
-    if (path / ".github" / "instructions").exists():
-        detected["ide_copilot"] = True
+    # Check for IDE configurations; nested markers are only probed when
+    # their top-level folder exists
+    for key, _ide, markers in IDE_MARKERS:
+        for marker in markers:
+            top, _, rest = marker.partition("/")
+            if top in names and (not rest or (path / marker).exists()):
+                detected[key] = True
+                break
 
     # Check for templates
-    if list(path.glob("*-template.md")):
+    if any(name.endswith(TEMPLATE_SUFFIX) for name in names):
         detected["templates"] = True
 
     # Check for .ai-instructions (user customizations)
-    if (path / ".ai-instructions").exists():
+    if ".ai-instructions" in names:
         detected["customizations"] = True
 
     return detected
@@ -110,29 +142,12 @@ def _handle_existing_journal(
     if detected.get("customizations"):
         found_items.append("user customizations (.ai-instructions/)")
 
-    message = f"""[bold yellow]⚠️  Existing Journal Detected[/bold yellow]
-
-The path [cyan]{path}[/cyan] already contains:
-"""
-
-    for item in found_items:
-        message += f"\n• {item}"
-
-    message += """
-
-[bold]What will happen if you proceed:[/bold]
-• Journal folders will be preserved (your content is safe)
-• IDE configurations will be reinstalled (any customizations should be in .ai-instructions/)
-• Templates will be overwritten with selected framework templates
-• User customizations in .ai-instructions/ will be preserved
-
-[bold]Options:[/bold]
-1. Proceed with re-installation (update this journal)
-2. Cancel and change the path to create a new journal elsewhere
-"""
-
+    parts = [EXISTING_JOURNAL_HEADER.format(path=path)]
+    parts.extend(f"\n• {item}" for item in found_items)
+    parts.append(EXISTING_JOURNAL_OPTIONS)
     if detected.get("customizations"):
-        message += "\n[dim]Note: Your .ai-instructions/ customizations will be preserved[/dim]"
+        parts.append("\n[dim]Note: Your .ai-instructions/ customizations will be preserved[/dim]")
+    message = "".join(parts)
 
     show_panel(message, title="Existing Journal", border_style="yellow")
 
@@ -155,15 +170,7 @@ The path [cyan]{path}[/cyan] already contains:
             raise typer.Exit(0)
 
     # Detect existing IDE (if any) and return it
-    detected_ide = None
-    if detected.get("ide_cursor"):
-        detected_ide = "cursor"
-    elif detected.get("ide_windsurf"):
-        detected_ide = "windsurf"
-    elif detected.get("ide_claude_code"):
-        detected_ide = "claude-code"
-    elif detected.get("ide_copilot"):
-        detected_ide = "copilot"
+    detected_ide = next((ide for key, ide, _markers in IDE_MARKERS if detected.get(key)), None)
 
     return {"detected_ide": detected_ide, "is_reinstall": True}
 
@@ -199,7 +206,23 @@ def setup(
     - Creating journal structure
     - Installing AI coach configurations
     """
+    # Reject malformed options before reading config or touching the disk
+    try:
+        if ide is not None:
+            ide = validate_ide(ide)
+        if framework is not None:
+            framework = validate_framework(framework)
+    except ValueError as e:
+        show_error(str(e))
+        raise typer.Exit(1)
+
     # Load existing multi-journal config
+    from ai_journal_kit.core.config import (
+        JournalProfile,
+        load_multi_journal_config,
+        save_multi_journal_config,
+    )
+
     multi_config = load_multi_journal_config()
     if multi_config is None:
         # First journal setup - create new multi-config
@@ -240,34 +263,36 @@ def setup(
     try:
         journal_path = Path(location).expanduser().resolve()
 
-        # Check if parent exists, offer to create
-        if not journal_path.parent.exists():
+        # Check if parent exists, offer to create. This is the only stat of
+        # the parent; mkdir(exist_ok=True) below needs no re-check
+        parent = journal_path.parent
+        parent_exists = parent.exists()
+        if not parent_exists:
             if dry_run:
-                console.print(f"[dim][DRY RUN] Would create parent: {journal_path.parent}[/dim]")
+                console.print(f"[dim][DRY RUN] Would create parent: {parent}[/dim]")
             elif no_confirm:
                 # Auto-create parent when no-confirm is set
-                journal_path.parent.mkdir(parents=True, exist_ok=True)
+                parent.mkdir(parents=True, exist_ok=True)
+                parent_exists = True
             else:
-                create_parent = confirm(
-                    f"Parent directory doesn't exist. Create {journal_path.parent}?"
-                )
+                create_parent = confirm(f"Parent directory doesn't exist. Create {parent}?")
                 if create_parent:
-                    journal_path.parent.mkdir(parents=True, exist_ok=True)
+                    parent.mkdir(parents=True, exist_ok=True)
+                    parent_exists = True
                 else:
                     show_error("Setup cancelled")
                     raise typer.Exit(1)
 
-        # Validate path
-        validate_path(journal_path)
+        # Validate path; it's already resolved and its parent checked
+        validate_path(journal_path, parent_exists=parent_exists)
 
-        # Check for existing journal content
+        # Check for existing journal content (a missing journal reads as empty)
         existing_info = {"detected_ide": None, "is_reinstall": False}
-        if journal_path.exists():
-            existing_content = _detect_existing_journal(journal_path)
-            if existing_content and not dry_run:
-                existing_info = _handle_existing_journal(
-                    journal_path, existing_content, no_confirm, location, name
-                )
+        existing_content = _detect_existing_journal(journal_path)
+        if existing_content and not dry_run:
+            existing_info = _handle_existing_journal(
+                journal_path, existing_content, no_confirm, location, name
+            )
 
     except ValueError as e:
         show_error(str(e), "Please provide a valid filesystem path.")
@@ -313,15 +338,6 @@ def setup(
     # Show summary
     from ai_journal_kit.core.config import get_config_path
 
-    # Get framework display name
-    framework_names = {
-        "default": "Default (flexible)",
-        "gtd": "GTD (Getting Things Done)",
-        "para": "PARA (Projects, Areas, Resources, Archive)",
-        "bullet-journal": "Bullet Journal",
-        "zettelkasten": "Zettelkasten",
-    }
-
     # Determine action message based on whether it's a reinstall
     action_message = (
         "This will update your journal structure and reinstall AI coaching configurations."
@@ -332,7 +348,7 @@ def setup(
     summary = f"""[bold cyan]Setup Configuration[/bold cyan]
 
 • Journal Location: [yellow]{journal_path}[/yellow]
-• Framework: [yellow]{framework_names.get(framework, framework)}[/yellow]
+• Framework: [yellow]{FRAMEWORK_DISPLAY_NAMES.get(framework, framework)}[/yellow]
 • AI Editor: [yellow]{ide}[/yellow]
 • Config File: [yellow]{get_config_path()}[/yellow]
 
@@ -345,13 +361,17 @@ def setup(
     show_panel(summary.strip(), border_style="blue")
 
     if dry_run:
-        console.print("\n[dim][DRY RUN] Would create:")
-        for folder in ["daily", "projects", "areas", "resources", "people", "memories", "archive"]:
-            console.print(f"[dim]  {journal_path / folder}/[/dim]")
-        console.print(f"[dim]  {journal_path / '.ai-instructions'}/[/dim]")
-        console.print(f"\n[dim][DRY RUN] Would install {ide} configuration[/dim]")
-        console.print(f"[dim][DRY RUN] Would create config at: {get_config_path()}[/dim]\n")
-        console.print("[yellow]No changes made.[/yellow]")
+        from ai_journal_kit.core.journal import REQUIRED_FOLDERS
+
+        lines = ["\n[dim][DRY RUN] Would create:[/dim]"]
+        for folder in REQUIRED_FOLDERS:
+            lines.append(f"[dim]  {journal_path / folder}/[/dim]")
+        lines.append(f"[dim]  {journal_path / '.ai-instructions'}/[/dim]")
+        lines.append(f"\n[dim][DRY RUN] Would install {ide} configuration[/dim]")
+        lines.append(f"[dim][DRY RUN] Would create config at: {get_config_path()}[/dim]\n")
+        lines.append("[yellow]No changes made.[/yellow]")
+        # One print means one markup parse and one terminal write
+        console.print("\n".join(lines))
         return
 
     # Confirmation
@@ -362,19 +382,30 @@ def setup(
             raise typer.Exit(0)
 
     # Execute setup with progress
+    from concurrent.futures import ThreadPoolExecutor
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from ai_journal_kit.core.journal import create_structure
+    from ai_journal_kit.core.templates import copy_ide_configs
+
     try:
         with Progress(
             SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
         ) as progress:
-            # Create journal structure
+            # Create journal structure and install IDE configs. They write
+            # different files, so their filesystem latency can overlap once
+            # the journal root exists
             task1 = progress.add_task("Creating journal structure...", total=None)
-            create_structure(journal_path, framework=framework)
-            progress.update(task1, completed=True)
-
-            # Install IDE configs
             task2 = progress.add_task(f"Installing {ide} configuration...", total=None)
-            copy_ide_configs(ide, journal_path, framework=framework)
-            progress.update(task2, completed=True)
+            journal_path.mkdir(parents=True, exist_ok=True)
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                structure = pool.submit(create_structure, journal_path, framework=framework)
+                ide_configs = pool.submit(copy_ide_configs, ide, journal_path, framework=framework)
+                structure.result()
+                progress.update(task1, completed=True)
+                ide_configs.result()
+                progress.update(task2, completed=True)
 
             # Create journal profile
             task3 = progress.add_task("Saving configuration...", total=None)
@@ -399,13 +430,12 @@ def setup(
             manifest = Manifest(version=__version__, framework=framework)
 
             # Track all installed templates
-            for template_file in journal_path.glob("*-template.md"):
-                manifest.add_file(
-                    template_file,
-                    source=f"framework:{framework}",
-                    customized=False,
-                    relative_to=journal_path,
-                )
+            manifest.add_files(
+                find_templates(journal_path),
+                source=f"framework:{framework}",
+                customized=False,
+                relative_to=journal_path,
+            )
 
             # Save manifest
             manifest_path = journal_path / ".system-manifest.json"
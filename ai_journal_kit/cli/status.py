@@ -1,15 +1,23 @@
 """Status command to display journal configuration and health."""
 
-import json
+import sys
+from typing import TYPE_CHECKING
 
 import typer
-from rich.table import Table
 
-from ai_journal_kit.core.config import get_config_path, load_config
-from ai_journal_kit.core.journal import get_folder_stats, validate_structure
-from ai_journal_kit.core.migration import ensure_manifest_exists
 from ai_journal_kit.utils.ui import console
 
+if TYPE_CHECKING:
+    from ai_journal_kit.core.journal import JournalScan
+
+# IDE name -> journal-relative path whose presence shows its config is installed
+IDE_CONFIG_MARKERS = {
+    "cursor": ".cursor/rules",
+    "windsurf": ".windsurf/rules",
+    "claude-code": "CLAUDE.md",
+    "copilot": ".github/copilot-instructions.md",
+}
+
 
 def status(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed information"),
@@ -22,26 +30,41 @@ def status(
     - Journal health checks
     - Latest version info (if available)
     """
+    from ai_journal_kit.core.config import load_config
+
     config = load_config()
 
     if not config:
         if json_output:
-            print(json.dumps({"status": "not_setup"}))
+            from ai_journal_kit.utils import jsonio
+
+            jsonio.dump({"status": "not_setup"}, sys.stdout)
         else:
             console.print("[yellow]Status: Not set up[/yellow]\n")
             console.print("AI Journal Kit is installed but not configured.")
             console.print("Run [cyan]'ai-journal-kit setup'[/cyan] to get started.\n")
         raise typer.Exit(0)
 
-    # Ensure manifest exists (auto-migrate old journals)
-    ensure_manifest_exists()
+    from ai_journal_kit.core.journal import scan_journal
+    from ai_journal_kit.core.migration import ensure_manifest_exists
 
-    # Health checks
-    structure_valid, missing = validate_structure(config.journal_location)
-    ide_configs_exist = _check_ide_configs(config)
+    # Ensure manifest exists (auto-migrate old journals)
+    ensure_manifest_exists(config)
+
+    # Health checks, all answered from one read of the journal
+    scan = scan_journal(
+        config.journal_location,
+        markers=_ide_markers(config.ide),
+        count_files=verbose and not json_output,
+    )
+    missing = scan.missing
+    structure_valid = not missing
+    ide_configs_exist = _check_ide_configs(config, scan)
 
     if json_output:
         # JSON output
+        from ai_journal_kit.utils import jsonio
+
         output = {
             "version": config.version,
             "journal_location": str(config.journal_location),
@@ -49,15 +72,19 @@ def status(
             "created_at": config.created_at.isoformat(),
             "last_updated": config.last_updated.isoformat(),
             "health": {
-                "journal_exists": config.journal_location.exists(),
+                "journal_exists": scan.exists,
                 "structure_valid": structure_valid,
                 "ide_configs": ide_configs_exist,
                 "config_valid": True,
             },
         }
-        print(json.dumps(output, indent=2))
+        jsonio.dump(output, sys.stdout, indent=True)
     else:
         # Rich table output
+        from rich.table import Table
+
+        from ai_journal_kit.core.config import get_config_path
+
         table = Table(title="AI Journal Kit Status", show_header=False, box=None)
         table.add_column("Setting", style="cyan", width=20)
         table.add_column("Value", style="white")
@@ -74,7 +101,7 @@ def status(
 
         # Health checks
         console.print("[bold]Health Checks:[/bold]")
-        _print_check("Journal folder exists", config.journal_location.exists())
+        _print_check("Journal folder exists", scan.exists)
         _print_check("All required folders present", structure_valid)
         if not structure_valid:
             console.print(f"  [dim]Missing: {', '.join(missing)}[/dim]")
@@ -85,25 +112,33 @@ def status(
         # Verbose mode
         if verbose:
             console.print("[bold]Journal Structure:[/bold]")
-            stats = get_folder_stats(config.journal_location)
-            for folder, count in stats.items():
+            for folder, count in scan.stats.items():
                 console.print(f"  ✓ {folder}/ ([cyan]{count} files[/cyan])")
             console.print()
 
 
-def _check_ide_configs(config) -> bool:
-    """Check if IDE configs are installed."""
-    if config.ide == "cursor":
-        return (config.journal_location / ".cursor" / "rules").exists()
-    elif config.ide == "windsurf":
-        return (config.journal_location / ".windsurf" / "rules").exists()
-    elif config.ide == "claude-code":
-        return (config.journal_location / "CLAUDE.md").exists()
-    elif config.ide == "copilot":
-        return (config.journal_location / ".github" / "copilot-instructions.md").exists()
-    elif config.ide == "all":
-        return True  # At least one should exist
-    return False
+def _ide_markers(ide: str) -> list[str]:
+    """Get the marker paths that show an IDE's config is installed."""
+    if ide == "all":
+        return list(IDE_CONFIG_MARKERS.values())
+    if ide in IDE_CONFIG_MARKERS:
+        return [IDE_CONFIG_MARKERS[ide]]
+    return []
+
+
+def _check_ide_configs(config, scan: "JournalScan | None" = None) -> bool:
+    """Check if IDE configs are installed ("all" passes if any IDE's config is).
+
+    Args:
+        config: Journal config
+        scan: Journal scan that already checked this IDE's markers (scanned if None)
+    """
+    markers = _ide_markers(config.ide)
+    if scan is None:
+        from ai_journal_kit.core.journal import scan_journal
+
+        scan = scan_journal(config.journal_location, markers=markers)
+    return any(marker in scan.markers for marker in markers)
 
 
 def _print_check(label: str, passed: bool):
@@ -1,20 +1,20 @@
 """Switch framework command for changing journaling methodology."""
 
-import shutil
-from datetime import datetime
+import sys
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import questionary
 import typer
-from rich.table import Table
 
-from ai_journal_kit.core.config import load_config, update_config
-from ai_journal_kit.core.journal import copy_framework_templates
-from ai_journal_kit.core.manifest import Manifest
-from ai_journal_kit.core.migration import ensure_manifest_exists
-from ai_journal_kit.core.validation import validate_framework
+from ai_journal_kit.core.fastcopy import copy_file
+from ai_journal_kit.core.validation import FRAMEWORK_DISPLAY_NAMES, validate_framework
 from ai_journal_kit.utils.ui import ask_framework, console, show_error, show_success
 
+if TYPE_CHECKING:
+    from ai_journal_kit.core.manifest import Manifest
+
 
 def switch_framework(
     framework: str = typer.Argument(
@@ -33,6 +33,10 @@ def switch_framework(
         ai-journal-kit switch-framework para
         ai-journal-kit switch-framework  # Interactive selection
     """
+    from ai_journal_kit.core.config import load_config, update_config
+    from ai_journal_kit.core.manifest import Manifest, find_templates
+    from ai_journal_kit.core.migration import ensure_manifest_exists
+
     # Check if journal is set up
     config = load_config()
     if not config:
@@ -42,14 +46,22 @@ def switch_framework(
         )
         raise typer.Exit(1)
 
+    journal_path = config.journal_location
+    if not journal_path.is_dir():
+        show_error(
+            f"Journal path does not exist: {journal_path}",
+            "Run 'ai-journal-kit doctor' to check your journal location",
+        )
+        raise typer.Exit(1)
+
     # Ensure manifest exists (auto-migrate old journals)
-    ensure_manifest_exists()
+    ensure_manifest_exists(config)
 
-    journal_path = config.journal_location
     current_framework = config.framework
 
     # Interactive framework selection if not provided
     if framework is None:
+        require_terminal("Pass the framework to switch to, e.g. 'switch-framework gtd'")
         framework = ask_framework()
 
     # Validate framework
@@ -70,39 +82,27 @@ def switch_framework(
     manifest = Manifest.load(manifest_path)
 
     # Detect customized templates
-    template_files = list(journal_path.glob("*-template.md"))
-    customized_templates = []
-
-    for template_file in template_files:
-        if manifest.is_customized(template_file, relative_to=journal_path):
-            customized_templates.append(template_file)
+    template_files = find_templates(journal_path)
+    customized_templates = manifest.customized_files(template_files, relative_to=journal_path)
 
     # Show framework switch summary
-    framework_names = {
-        "default": "Default (flexible)",
-        "gtd": "GTD (Getting Things Done)",
-        "para": "PARA (Projects, Areas, Resources, Archive)",
-        "bullet-journal": "Bullet Journal",
-        "zettelkasten": "Zettelkasten",
-    }
+    current_name = FRAMEWORK_DISPLAY_NAMES.get(current_framework, current_framework)
+    framework_name = FRAMEWORK_DISPLAY_NAMES.get(framework, framework)
 
-    console.print(
-        f"\n[bold cyan]Framework Switch: {framework_names.get(current_framework, current_framework)} → {framework_names.get(framework, framework)}[/bold cyan]\n"
-    )
+    console.print(f"\n[bold cyan]Framework Switch: {current_name} → {framework_name}[/bold cyan]\n")
 
     # Show interactive checklist
     if not no_confirm:
+        require_terminal("Pass --no-confirm to back up and replace templates without prompting")
         show_interactive_checklist(
             framework=framework,
-            framework_name=framework_names.get(framework, framework),
+            framework_name=framework_name,
             customized_count=len(customized_templates),
         )
 
         # If customized templates exist, offer resolution options
         if customized_templates:
-            action = ask_customization_resolution(
-                customized_templates, framework_names.get(framework, framework)
-            )
+            action = ask_customization_resolution(customized_templates, framework_name)
             if action == "cancel":
                 console.print("[yellow]Framework switch cancelled.[/yellow]")
                 raise typer.Exit(0)
@@ -118,8 +118,7 @@ def switch_framework(
         action = "replace"
 
     # Create timestamped backup directory
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
-    backup_dir = journal_path / ".framework-backups" / timestamp
+    backup_dir = journal_path / ".framework-backups" / backup_timestamp()
     backup_dir.mkdir(parents=True, exist_ok=True)
 
     # Execute the switch based on chosen action
@@ -130,6 +129,7 @@ def switch_framework(
         customized_templates=customized_templates,
         backup_dir=backup_dir,
         manifest=manifest,
+        all_templates=template_files,
     )
 
     # Update config
@@ -141,44 +141,68 @@ def switch_framework(
 
     # Success message
     show_success("Framework switched successfully!")
-    console.print(
-        f"\n[bold]New framework:[/bold] [green]{framework_names.get(framework, framework)}[/green]"
-    )
+    console.print(f"\n[bold]New framework:[/bold] [green]{framework_name}[/green]")
     console.print("\n[dim]Your journal notes (daily/, projects/, etc.) are untouched.[/dim]\n")
 
 
+def require_terminal(hint: str):
+    """Exit with an error if stdin can't answer prompts (CI, pipes).
+
+    Checked before any prompt is built, so non-interactive runs fail fast
+    with a hint instead of inside the prompt library.
+
+    Args:
+        hint: How to run the command without prompting
+    """
+    if not sys.stdin.isatty():
+        show_error("switch-framework needs an interactive terminal to prompt", hint)
+        raise typer.Exit(1)
+
+
+def backup_timestamp(ns: int | None = None) -> str:
+    """Name for a backup directory: local time to the second plus nanoseconds.
+
+    Built from time.time_ns() without constructing a datetime; the nanosecond
+    suffix keeps names from back-to-back switches apart.
+
+    Args:
+        ns: Nanoseconds since the epoch (defaults to now)
+
+    Returns:
+        Timestamp like "20250101-120000-123456789"
+    """
+    if ns is None:
+        ns = time.time_ns()
+    seconds, remainder = divmod(ns, 1_000_000_000)
+    return f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(seconds))}-{remainder:09d}"
+
+
 def show_interactive_checklist(framework: str, framework_name: str, customized_count: int):
     """Show interactive checklist of what will happen during framework switch."""
-    # Create checklist table
-    table = Table(show_header=False, box=None, padding=(0, 2))
-    table.add_column("Status", style="green")
-    table.add_column("Description")
-
     # What WILL happen
-    console.print("\n[bold]What will happen:[/bold]")
-    table.add_row("✓", f"Templates will be replaced with {framework_name} templates")
-    table.add_row("✓", "Your journal notes (daily/, projects/, people/) stay untouched")
-    table.add_row("✓", "Old templates backed up to .framework-backups/")
-
+    will = [
+        f"Templates will be replaced with {framework_name} templates",
+        "Your journal notes (daily/, projects/, people/) stay untouched",
+        "Old templates backed up to .framework-backups/",
+    ]
     if customized_count > 0:
-        table.add_row(
-            "✓", f"{customized_count} customized template(s) detected - you'll choose what to do"
+        will.append(
+            f"{customized_count} customized template(s) detected - you'll choose what to do"
         )
 
-    console.print(table)
-
     # What will NOT happen
-    console.print("\n[bold]What will NOT happen:[/bold]")
-    table_not = Table(show_header=False, box=None, padding=(0, 2))
-    table_not.add_column("Status", style="red")
-    table_not.add_column("Description")
-
-    table_not.add_row("✗", "Your journal content will NOT be reorganized")
-    table_not.add_row("✗", "Your existing notes will NOT be modified")
-    table_not.add_row("✗", "Your .ai-instructions/ customizations will NOT be touched")
+    will_not = [
+        "Your journal content will NOT be reorganized",
+        "Your existing notes will NOT be modified",
+        "Your .ai-instructions/ customizations will NOT be touched",
+    ]
 
-    console.print(table_not)
-    console.print()
+    # Plain markup laid out like the two-column checklist, in one write
+    lines = ["\n[bold]What will happen:[/bold]"]
+    lines.extend(f"  [green]✓[/green]    {item}" for item in will)
+    lines.append("\n[bold]What will NOT happen:[/bold]")
+    lines.extend(f"  [red]✗[/red]    {item}" for item in will_not)
+    console.print("\n".join(lines) + "\n", highlight=False)
 
 
 def ask_customization_resolution(customized_templates: list[Path], new_framework: str) -> str:
@@ -187,10 +211,9 @@ def ask_customization_resolution(customized_templates: list[Path], new_framework
     Returns:
         Action to take: 'move', 'replace', or 'cancel'
     """
-    console.print("[bold yellow]⚠ Customized templates detected:[/bold yellow]")
-    for template in customized_templates:
-        console.print(f"  • {template.name}")
-    console.print()
+    lines = ["[bold yellow]⚠ Customized templates detected:[/bold yellow]"]
+    lines.extend(f"  • {template.name}" for template in customized_templates)
+    console.print("\n".join(lines) + "\n")
 
     choices = [
         questionary.Choice(
@@ -204,20 +227,19 @@ def ask_customization_resolution(customized_templates: list[Path], new_framework
         questionary.Choice(title="Cancel - Don't switch frameworks", value="cancel"),
     ]
 
-    console.print("[bold]Choose what to do with your customizations:[/bold]\n")
-    console.print("  [green]1. Move to .ai-instructions/templates/[/green]")
-    console.print("     → Your templates will override new framework templates")
-    console.print("     → Safe from all future framework switches")
-    console.print("     → You keep your customizations forever")
-    console.print()
-    console.print("  [yellow]2. Backup and replace[/yellow]")
-    console.print("     → Backed up to .framework-backups/")
-    console.print(f"     → Start fresh with {new_framework} templates")
-    console.print("     → You can restore from backup later")
-    console.print()
-    console.print("  [red]3. Cancel[/red]")
-    console.print("     → No changes made")
-    console.print()
+    console.print(
+        "[bold]Choose what to do with your customizations:[/bold]\n\n"
+        "  [green]1. Move to .ai-instructions/templates/[/green]\n"
+        "     → Your templates will override new framework templates\n"
+        "     → Safe from all future framework switches\n"
+        "     → You keep your customizations forever\n\n"
+        "  [yellow]2. Backup and replace[/yellow]\n"
+        "     → Backed up to .framework-backups/\n"
+        f"     → Start fresh with {new_framework} templates\n"
+        "     → You can restore from backup later\n\n"
+        "  [red]3. Cancel[/red]\n"
+        "     → No changes made\n"
+    )
 
     action = questionary.select(
         "Your choice:",
@@ -234,7 +256,8 @@ def execute_framework_switch(
     action: str,
     customized_templates: list[Path],
     backup_dir: Path,
-    manifest: Manifest,
+    manifest: "Manifest",
+    all_templates: list[Path] | None = None,
 ):
     """Execute the framework switch with chosen customization handling.
 
@@ -245,15 +268,21 @@ def execute_framework_switch(
         customized_templates: List of customized template files
         backup_dir: Backup directory for old templates
         manifest: Manifest to update
+        all_templates: Templates currently at the journal root, if already
+            listed (found with find_templates otherwise)
     """
-    all_templates = list(journal_path.glob("*-template.md"))
+    from ai_journal_kit.core.journal import copy_framework_templates
+    from ai_journal_kit.core.manifest import find_templates
+
+    if all_templates is None:
+        all_templates = find_templates(journal_path)
 
-    # Backup all existing templates
+    # Backup all existing templates. copy_file clones or copies in the kernel
+    # where it can, so contents are never read into Python
     if all_templates:
         console.print(f"\n[cyan]Backing up {len(all_templates)} templates...[/cyan]")
         for template_file in all_templates:
-            backup_path = backup_dir / template_file.name
-            shutil.copy2(template_file, backup_path)
+            copy_file(template_file, backup_dir / template_file.name)
 
     # Handle customized templates based on action
     if action == "move" and customized_templates:
@@ -264,10 +293,11 @@ def execute_framework_switch(
         console.print(
             f"\n[cyan]Moving {len(customized_templates)} customized templates to safe zone...[/cyan]"
         )
+        moved = []
         for template_file in customized_templates:
-            safe_path = safe_dir / template_file.name
-            shutil.copy2(template_file, safe_path)
-            console.print(f"  → {template_file.name} → .ai-instructions/templates/")
+            copy_file(template_file, safe_dir / template_file.name)
+            moved.append(f"  → {template_file.name} → .ai-instructions/templates/")
+        console.print("\n".join(moved))
 
         console.print(
             "\n[green]✓[/green] Your customizations are now in [cyan].ai-instructions/templates/[/cyan]"
@@ -276,14 +306,12 @@ def execute_framework_switch(
 
     # Install new framework templates
     console.print(f"[cyan]Installing {framework} templates...[/cyan]")
-    copy_framework_templates(framework, journal_path)
-
-    # Update manifest for all templates
-    new_templates = list(journal_path.glob("*-template.md"))
-    for template_file in new_templates:
-        manifest.add_file(
-            template_file,
-            source=f"framework:{framework}",
-            customized=False,
-            relative_to=journal_path,
-        )
+    new_templates = copy_framework_templates(framework, journal_path)
+
+    # Track the templates just installed
+    manifest.add_files(
+        new_templates,
+        source=f"framework:{framework}",
+        customized=False,
+        relative_to=journal_path,
+    )
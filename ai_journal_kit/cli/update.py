@@ -1,25 +1,37 @@
 """Update command for safely updating the core system."""
 
+import functools
+import importlib.util
 import subprocess
+import sys
+import time
+from pathlib import Path
 
 import typer
-from packaging.version import parse as parse_version
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-
-from ai_journal_kit.core.config import load_config
-from ai_journal_kit.core.migration import ensure_manifest_exists
-from ai_journal_kit.core.templates import copy_ide_configs
+
 from ai_journal_kit.utils.ui import confirm, console, show_error, show_panel, show_success
 
+# Seconds a PyPI version lookup is reused before PyPI is asked again
+VERSION_CACHE_TTL = 60 * 60
+
+# Seconds to let `pip install --upgrade` run before giving up on it
+UPGRADE_TIMEOUT = 300
+
 
+@functools.lru_cache(maxsize=1)
 def detect_pip_command() -> list[str]:
     """Detect which pip command works on this system.
 
+    The running interpreter's own pip is preferred and needs no probe when
+    it is importable; otherwise each candidate is tried with --version. The
+    answer is cached, so later calls never spawn a process.
+
     Returns:
         Command list that works (e.g., ['pip', 'install'] or ['python3', '-m', 'pip', 'install'])
     """
+    if sys.executable and importlib.util.find_spec("pip") is not None:
+        return [sys.executable, "-m", "pip"]
+
     # Try different pip commands in order of preference
     commands = [
         ["pip"],
@@ -47,24 +59,105 @@ def detect_pip_command() -> list[str]:
     return ["pip"]
 
 
-def get_latest_version() -> str | None:
+def fetch_json(url: str, timeout: float = 5):
+    """GET a JSON document, asking for a gzip-compressed response.
+
+    The body is parsed from the response stream with json.load; servers that
+    honour the gzip request (PyPI and GitHub both do) send far fewer bytes.
+
+    Args:
+        url: URL to fetch
+        timeout: Seconds to wait for the server
+
+    Returns:
+        Parsed JSON data
+    """
+    import gzip
+    import json
+    import urllib.request
+
+    from ai_journal_kit import __version__
+
+    request = urllib.request.Request(
+        url,
+        headers={"Accept-Encoding": "gzip", "User-Agent": f"ai-journal-kit/{__version__}"},
+    )
+    with urllib.request.urlopen(request, timeout=timeout, context=_ssl_context()) as response:
+        if response.headers.get("Content-Encoding") == "gzip":
+            with gzip.GzipFile(fileobj=response) as body:
+                return json.load(body)
+        return json.load(response)
+
+
+@functools.lru_cache(maxsize=1)
+def _ssl_context():
+    """TLS context shared by every request, so CA certificates load once."""
+    import ssl
+
+    return ssl.create_default_context()
+
+
+def get_version_cache_path() -> Path:
+    """Get the file caching the latest PyPI version.
+
+    Lives in the user cache directory (see get_cache_dir).
+    """
+    from ai_journal_kit.utils.platform import get_cache_dir
+
+    return get_cache_dir() / "pypi-version.json"
+
+
+def get_latest_version(refresh: bool = False) -> str | None:
     """Query PyPI for the latest version of ai-journal-kit.
 
+    Answers are cached on disk for VERSION_CACHE_TTL seconds, so running
+    `update --check` and then `update` asks PyPI only once.
+
+    Args:
+        refresh: Ignore any cached answer and ask PyPI
+
     Returns:
         Latest version string or None if unable to check.
     """
+    cache_path = get_version_cache_path()
+    if not refresh:
+        cached = _read_version_cache(cache_path)
+        if cached and time.time() - cached["checked_at"] < VERSION_CACHE_TTL:
+            return cached["version"]
+
     try:
-        import json
-        import urllib.request
-
-        with urllib.request.urlopen(
-            "https://pypi.org/pypi/ai-journal-kit/json", timeout=5
-        ) as response:
-            data = json.loads(response.read().decode())
-            return data["info"]["version"]
+        data = fetch_json("https://pypi.org/pypi/ai-journal-kit/json")
+        version = data["info"]["version"]
     except Exception:
         return None
 
+    _write_version_cache(cache_path, version)
+    return version
+
+
+def _read_version_cache(cache_path: Path) -> dict | None:
+    """Read the version cache, or None if it is missing or unreadable."""
+    import json
+
+    try:
+        cached = json.loads(cache_path.read_bytes())
+        if isinstance(cached["version"], str) and isinstance(cached["checked_at"], (int, float)):
+            return cached
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _write_version_cache(cache_path: Path, version: str):
+    """Record a PyPI answer; failing to cache never fails the lookup."""
+    from ai_journal_kit.utils import jsonio
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        jsonio.dump_file({"version": version, "checked_at": time.time()}, cache_path)
+    except OSError:
+        pass
+
 
 def get_changelog(from_version: str, to_version: str) -> str | None:
     """Fetch changelog between versions from GitHub.
@@ -73,16 +166,12 @@ def get_changelog(from_version: str, to_version: str) -> str | None:
         Markdown changelog or None if unavailable.
     """
     try:
-        import json
-        import urllib.request
-
         # Fetch release notes from GitHub
         url = f"https://api.github.com/repos/troylar/ai-journal-kit/releases/tags/v{to_version}"
-        with urllib.request.urlopen(url, timeout=5) as response:
-            data = json.loads(response.read().decode())
-            body = data.get("body", "")
-            if body:
-                return f"# What's New in {to_version}\n\n{body}"
+        data = fetch_json(url)
+        body = data.get("body", "")
+        if body:
+            return f"# What's New in {to_version}\n\n{body}"
     except Exception:
         pass
 
@@ -110,6 +199,9 @@ def update(
     templates: bool = typer.Option(
         False, "--templates", help="Update templates to latest versions (with backup)"
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Ask PyPI for the latest version instead of using the cache"
+    ),
 ):
     """Update AI Journal Kit to the latest version.
 
@@ -122,13 +214,23 @@ def update(
     - Keep your custom configurations (.ai-instructions/)
     - Show changelog with any AI behavior changes
     """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from ai_journal_kit.core.config import load_config
+    from ai_journal_kit.core.migration import ensure_manifest_exists
+
     config = load_config()
     if not config:
         show_error("Journal not set up", "Run 'ai-journal-kit setup' first")
         raise typer.Exit(1)
 
+    # Network requests run in the background while local work carries on.
+    # Each one is waited on before the command can exit
+    pool = ThreadPoolExecutor(max_workers=1)
+    latest_version_future = pool.submit(get_latest_version, refresh=refresh)
+
     # Ensure manifest exists (auto-migrate old journals)
-    ensure_manifest_exists()
+    ensure_manifest_exists(config)
 
     console.print("[bold cyan]Checking for updates...[/bold cyan]\n")
 
@@ -139,7 +241,7 @@ def update(
 
     # Check for latest version
     with console.status("[cyan]Querying PyPI..."):
-        latest_version = get_latest_version()
+        latest_version = latest_version_future.result()
 
     if latest_version is None:
         # Can't check PyPI (dev mode or network issue)
@@ -156,6 +258,8 @@ def update(
         console.print(f"  Latest version:  [cyan]{latest_version}[/cyan]\n")
 
         # Compare versions properly to detect downgrades
+        from packaging.version import parse as parse_version
+
         try:
             current_parsed = parse_version(current_version)
             latest_parsed = parse_version(latest_version)
@@ -193,9 +297,22 @@ def update(
         console.print("Run without --check to install.\n")
         raise typer.Exit(0)
 
+    # Fetch the changelog while checking templates
+    changelog_future = pool.submit(get_changelog, current_version, latest_version)
+    pool.shutdown(wait=False)
+
+    template_changes = {}
+    if templates:
+        from ai_journal_kit.core.template_updater import get_template_changes, show_template_changes
+
+        template_changes = get_template_changes(config.journal_location)
+
     # Show changelog
-    changelog = get_changelog(current_version, latest_version)
+    changelog = changelog_future.result()
     if changelog:
+        from rich.markdown import Markdown
+        from rich.panel import Panel
+
         console.print(
             Panel(
                 Markdown(changelog), title="[bold cyan]Changelog[/bold cyan]", border_style="cyan"
@@ -203,13 +320,8 @@ def update(
         )
         console.print()
 
-    # Check for template updates if requested
-    template_changes = {}
+    # Show template updates if requested
     if templates:
-        from ai_journal_kit.core.template_updater import get_template_changes, show_template_changes
-
-        template_changes = get_template_changes(config.journal_location)
-
         if template_changes:
             console.print()
             show_template_changes(template_changes)
@@ -218,21 +330,21 @@ def update(
                 "[dim]Backups are saved with timestamp: template.backup_YYYYMMDD_HHMMSS.md[/dim]\n"
             )
 
-    # Summary of what will happen
-    update_details = (
+    # Summary of what will happen, built as parts and joined once
+    details = [
         f"• Package: [yellow]{current_version}[/yellow] → [green]{latest_version}[/green]\n"
         f"• IDE Configs: Refresh [cyan]{config.ide}[/cyan] configurations\n"
-    )
+    ]
 
     if templates:
         if template_changes:
-            update_details += (
+            details.append(
                 f"• Templates: Update [yellow]{len(template_changes)}[/yellow] template(s)\n"
             )
         else:
-            update_details += "• Templates: [green]All up to date[/green]\n"
+            details.append("• Templates: [green]All up to date[/green]\n")
 
-    update_details += (
+    details.append(
         f"• Journal: [green]{config.journal_location}[/green]\n\n"
         "[bold]What's Protected:[/bold]\n"
         "✓ All journal content (daily, projects, people, memories, etc.)\n"
@@ -240,18 +352,21 @@ def update(
     )
 
     if templates and template_changes:
-        update_details += "✓ Original templates (backed up with timestamp)\n"
+        details.append("✓ Original templates (backed up with timestamp)\n")
 
-    update_details += "✓ Your data remains untouched\n\n[bold]What's Updated:[/bold]\n"
-    update_details += "→ IDE configuration files with new features\n"
-    update_details += "→ System rules and protections\n"
-    update_details += "→ WELCOME.md (if it exists, will be replaced)\n"
+    details.append(
+        "✓ Your data remains untouched\n\n[bold]What's Updated:[/bold]\n"
+        "→ IDE configuration files with new features\n"
+        "→ System rules and protections\n"
+        "→ WELCOME.md (if it exists, will be replaced)\n"
+    )
 
     if templates and template_changes:
-        update_details += (
+        details.append(
             f"→ [yellow]{len(template_changes)}[/yellow] template(s) to latest versions\n"
         )
 
+    update_details = "".join(details)
     show_panel("Update Plan", update_details)
 
     if not no_confirm and not dry_run:
@@ -264,29 +379,42 @@ def update(
         raise typer.Exit(0)
 
     # Perform update
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from ai_journal_kit.core.templates import copy_ide_configs
+
+    # One transient spinner line, relabelled per step and repainted at 4 Hz;
+    # the upgrade step is a long wait on pip, so faster repaints buy nothing
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         transient=True,
+        refresh_per_second=4,
     ) as progress:
         # Step 1: Upgrade package (always, even with --force)
-        task_upgrade = progress.add_task("[cyan]Upgrading package...", total=1)
+        task = progress.add_task("[cyan]Upgrading package...", total=None)
         try:
             # Detect which pip command works on this system
             pip_cmd = detect_pip_command()
             upgrade_cmd = pip_cmd + ["install", "--upgrade", "ai-journal-kit"]
 
+            # Only stderr is kept, for the error message; pip's progress
+            # output on stdout is discarded rather than buffered
             subprocess.run(
                 upgrade_cmd,
                 check=True,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
+                timeout=UPGRADE_TIMEOUT,
             )
-            progress.update(
-                task_upgrade, completed=1, description="[green]Package upgraded![/green]"
+        except subprocess.TimeoutExpired:
+            show_error(
+                f"Package upgrade did not finish within {UPGRADE_TIMEOUT} seconds",
+                "Check your network connection and run 'ai-journal-kit update' again",
             )
+            raise typer.Exit(1)
         except subprocess.CalledProcessError as e:
-            progress.update(task_upgrade, completed=1, description="[red]Upgrade failed.[/red]")
             pip_cmd_str = " ".join(detect_pip_command())
             show_error(
                 "Package upgrade failed",
@@ -295,20 +423,10 @@ def update(
             raise typer.Exit(1)
 
         # Step 2: Refresh IDE configs
-        task_configs = progress.add_task(
-            f"[cyan]Refreshing {config.ide} configurations...", total=1
-        )
+        progress.update(task, description=f"[cyan]Refreshing {config.ide} configurations...")
         try:
             copy_ide_configs(config.ide, config.journal_location, framework=config.framework)
-            progress.update(
-                task_configs,
-                completed=1,
-                description=f"[green]{config.ide.capitalize()} configs refreshed.[/green]",
-            )
         except Exception as e:
-            progress.update(
-                task_configs, completed=1, description="[red]Config refresh failed.[/red]"
-            )
             show_error("Failed to refresh IDE configs", str(e))
             raise typer.Exit(1)
 
@@ -316,20 +434,12 @@ def update(
         if templates and template_changes:
             from ai_journal_kit.core.template_updater import update_templates
 
-            task_templates = progress.add_task(
-                f"[cyan]Updating {len(template_changes)} template(s)...", total=1
+            progress.update(
+                task, description=f"[cyan]Updating {len(template_changes)} template(s)..."
             )
             try:
-                updated = update_templates(config.journal_location, backup=True)
-                progress.update(
-                    task_templates,
-                    completed=1,
-                    description=f"[green]{len(updated)} template(s) updated![/green]",
-                )
+                update_templates(config.journal_location, backup=True)
             except Exception as e:
-                progress.update(
-                    task_templates, completed=1, description="[red]Template update failed.[/red]"
-                )
                 show_error("Failed to update templates", str(e))
                 raise typer.Exit(1)
 
@@ -337,29 +447,27 @@ def update(
         if not (templates and "WELCOME.md" in template_changes):
             welcome_path = config.journal_location / "WELCOME.md"
             if welcome_path.exists():
-                task_welcome = progress.add_task("[cyan]Updating WELCOME.md...", total=1)
+                progress.update(task, description="[cyan]Updating WELCOME.md...")
                 from ai_journal_kit.core.templates import copy_template
 
                 copy_template("WELCOME.md", welcome_path)
-                progress.update(
-                    task_welcome, completed=1, description="[green]WELCOME.md updated.[/green]"
-                )
 
     # Build success message
-    success_msg = (
+    success_parts = [
         f"✨ AI Journal Kit updated to [green]{latest_version}[/green]!\n\n"
         f"Your journal at [cyan]{config.journal_location}[/cyan] is ready.\n\n"
         "[bold]What Changed:[/bold]\n"
         "• IDE configs refreshed with latest features\n"
-    )
+    ]
 
     if templates and template_changes:
-        success_msg += (
+        success_parts.append(
             f"• [green]{len(template_changes)}[/green] template(s) updated (originals backed up)\n"
         )
 
-    success_msg += (
+    success_parts.append(
         "• Your content and customizations untouched\n\nOpen your journal to see what's new!"
     )
+    success_msg = "".join(success_parts)
 
     show_success(success_msg)
@@ -2,10 +2,6 @@
 
 import typer
 
-from ai_journal_kit.core.config import (
-    load_multi_journal_config,
-    save_multi_journal_config,
-)
 from ai_journal_kit.utils.ui import console, show_error, show_success
 
 
@@ -24,6 +20,8 @@ def use_journal(
         ai-journal-kit use personal
         AI_JOURNAL=test ai-journal-kit status  # Temporary override
     """
+    from ai_journal_kit.core.config import load_multi_journal_config, save_multi_journal_config
+
     multi_config = load_multi_journal_config()
     if not multi_config:
         show_error("No journals configured", "Run 'ai-journal-kit setup' first")
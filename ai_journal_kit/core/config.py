@@ -1,13 +1,38 @@
 """Configuration management for AI Journal Kit with multi-journal support."""
 
+import functools
 import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Literal
 
-from platformdirs import user_config_dir
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
+
+from ai_journal_kit.core.validation import FRAMEWORK_CHOICES, IDE_CHOICES
+from ai_journal_kit.utils import jsonio
+
+# Validation context for data read back from the config file. Its paths
+# were resolved when they were first set, so they aren't resolved again
+SAVED_CONTEXT = {"saved": True}
+
+
+def _expand_path(v, info: ValidationInfo) -> Path:
+    """Expand ~ and make v absolute, resolving symlinks unless it was saved.
+
+    resolve() stats every path component; saved paths skip it and are only
+    made absolute, which touches no files.
+    """
+    path = Path(v).expanduser()
+    if info.context and info.context.get("saved"):
+        return path.absolute()
+    return path.resolve()
 
 
 class JournalProfile(BaseModel):
@@ -17,8 +42,8 @@ class JournalProfile(BaseModel):
 
     name: str
     location: Path
-    ide: Literal["cursor", "windsurf", "claude-code", "copilot", "all"]
-    framework: Literal["default", "gtd", "para", "bullet-journal", "zettelkasten"] = "default"
+    ide: IDE_CHOICES
+    framework: FRAMEWORK_CHOICES = "default"
     version: str = "1.0.0"
     created_at: datetime = Field(default_factory=datetime.now)
     last_updated: datetime = Field(default_factory=datetime.now)
@@ -27,11 +52,9 @@ class JournalProfile(BaseModel):
 
     @field_validator("location", mode="before")
     @classmethod
-    def expand_path(cls, v):
+    def expand_path(cls, v, info: ValidationInfo):
         """Expand ~ and resolve to absolute path."""
-        if isinstance(v, str):
-            return Path(v).expanduser().resolve()
-        return Path(v).expanduser().resolve()
+        return _expand_path(v, info)
 
 
 class MultiJournalConfig(BaseModel):
@@ -42,6 +65,17 @@ class MultiJournalConfig(BaseModel):
     active_journal: str = "default"
     journals: dict[str, JournalProfile] = Field(default_factory=dict)
 
+    @model_validator(mode="before")
+    @classmethod
+    def name_journals_from_keys(cls, data):
+        """Fill in each profile's name from its key when the file omits it."""
+        if isinstance(data, dict) and isinstance(data.get("journals"), dict):
+            data["journals"] = {
+                name: {"name": name, **profile} if isinstance(profile, dict) else profile
+                for name, profile in data["journals"].items()
+            }
+        return data
+
     def get_active_profile(self) -> JournalProfile | None:
         """Get the currently active journal profile."""
         # Check environment variable override first
@@ -82,8 +116,8 @@ class Config(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     journal_location: Path
-    ide: Literal["cursor", "windsurf", "claude-code", "copilot", "all"]
-    framework: Literal["default", "gtd", "para", "bullet-journal", "zettelkasten"] = "default"
+    ide: IDE_CHOICES
+    framework: FRAMEWORK_CHOICES = "default"
     version: str = "1.0.0"
     created_at: datetime = Field(default_factory=datetime.now)
     last_updated: datetime = Field(default_factory=datetime.now)
@@ -92,19 +126,35 @@ class Config(BaseModel):
 
     @field_validator("journal_location", mode="before")
     @classmethod
-    def expand_path(cls, v):
+    def expand_path(cls, v, info: ValidationInfo):
         """Expand ~ and resolve to absolute path."""
-        if isinstance(v, str):
-            return Path(v).expanduser().resolve()
-        return Path(v).expanduser().resolve()
+        return _expand_path(v, info)
+
+
+# Last parsed config, keyed on the (path, mtime_ns, size) of the file it was
+# read from, so repeated loads within one command skip the JSON parse and
+# model validation. Saving writes through to it.
+_config_cache: tuple[tuple, MultiJournalConfig] | None = None
 
 
 def get_config_path() -> Path:
     """Get platform-specific config file path."""
-    config_dir_str = os.getenv("AI_JOURNAL_CONFIG_DIR")
+    return _config_path_for(os.getenv("AI_JOURNAL_CONFIG_DIR"))
+
+
+@functools.lru_cache(maxsize=8)
+def _config_path_for(config_dir_str: str | None) -> Path:
+    """Config file path for an AI_JOURNAL_CONFIG_DIR value, creating its directory.
+
+    Cached so the platformdirs lookup and mkdir happen once per directory;
+    keying on the variable's value keeps overrides set later in the
+    process working.
+    """
     if config_dir_str:
         config_dir = Path(config_dir_str)
     else:
+        from platformdirs import user_config_dir
+
         config_dir = Path(user_config_dir("ai-journal-kit", appauthor=False))
     config_dir.mkdir(parents=True, exist_ok=True)
     return config_dir / "config.json"
@@ -154,8 +204,9 @@ def load_config() -> Config | None:
     if not active_profile:
         return None
 
-    # Convert active profile back to legacy Config format
-    return Config(
+    # Convert active profile back to legacy Config format; its fields are
+    # already validated, so they're copied across without validating again
+    return Config.model_construct(
         journal_location=active_profile.location,
         ide=active_profile.ide,
         framework=active_profile.framework,
@@ -169,12 +220,21 @@ def load_config() -> Config | None:
 
 def load_multi_journal_config() -> MultiJournalConfig | None:
     """Load full multi-journal configuration."""
+    global _config_cache
+
     config_path = get_config_path()
-    if not config_path.exists():
+    try:
+        key = _cache_key(config_path)
+    except OSError:
         return None
 
+    if _config_cache and _config_cache[0] == key:
+        # Callers mutate what they get back, so hand out a copy
+        return _config_cache[1].model_copy(deep=True)
+
     try:
-        data = json.loads(config_path.read_text())
+        # Saved as UTF-8 bytes; json.loads detects the encoding itself
+        data = json.loads(config_path.read_bytes())
 
         # Detect if this is legacy format
         if "journal_location" in data and "journals" not in data:
@@ -184,26 +244,11 @@ def load_multi_journal_config() -> MultiJournalConfig | None:
             save_multi_journal_config(multi_config)
             return multi_config
 
-        # Parse as multi-journal config
-        # Parse journal profiles
-        journals = {}
-        for name, profile_data in data.get("journals", {}).items():
-            # Parse datetime strings
-            if "created_at" in profile_data and isinstance(profile_data["created_at"], str):
-                profile_data["created_at"] = datetime.fromisoformat(profile_data["created_at"])
-            if "last_updated" in profile_data and isinstance(profile_data["last_updated"], str):
-                profile_data["last_updated"] = datetime.fromisoformat(profile_data["last_updated"])
-
-            # Ensure name is in profile_data (don't pass it twice)
-            if "name" not in profile_data:
-                profile_data["name"] = name
-
-            journals[name] = JournalProfile(**profile_data)
-
-        return MultiJournalConfig(
-            active_journal=data.get("active_journal", "default"),
-            journals=journals,
-        )
+        # Parse as multi-journal config; pydantic converts the ISO datetime
+        # and path strings itself
+        multi_config = MultiJournalConfig.model_validate(data, context=SAVED_CONTEXT)
+        _config_cache = (key, multi_config)
+        return multi_config.model_copy(deep=True)
 
     except (json.JSONDecodeError, ValueError, TypeError) as e:
         from ai_journal_kit.utils.ui import error_console
@@ -214,10 +259,15 @@ def load_multi_journal_config() -> MultiJournalConfig | None:
         return None
 
 
-def save_config(config: Config):
+def save_config(config: Config, now: datetime | None = None):
     """Save single journal config (legacy function for backward compatibility).
 
     Updates the active journal in the multi-journal config.
+
+    Args:
+        config: Config for the active journal
+        now: Time to record as the active journal's last update, for callers
+            that have already stamped config (defaults to now)
     """
     multi_config = load_multi_journal_config()
     if not multi_config:
@@ -245,7 +295,7 @@ def save_config(config: Config):
             framework=config.framework,
             version=config.version,
             created_at=config.created_at,
-            last_updated=datetime.now(),
+            last_updated=now or datetime.now(),
             use_symlink=config.use_symlink,
             symlink_source=config.symlink_source,
         )
@@ -256,31 +306,22 @@ def save_config(config: Config):
 
 def save_multi_journal_config(config: MultiJournalConfig):
     """Save multi-journal configuration."""
+    global _config_cache
+
     config_path = get_config_path()
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Convert to dict for JSON serialization
-    data = {
-        "active_journal": config.active_journal,
-        "journals": {},
-    }
-
-    for name, profile in config.journals.items():
-        profile_data = {
-            "name": profile.name,
-            "location": str(profile.location),
-            "ide": profile.ide,
-            "framework": profile.framework,
-            "version": profile.version,
-            "created_at": profile.created_at.isoformat(),
-            "last_updated": profile.last_updated.isoformat(),
-            "use_symlink": profile.use_symlink,
-        }
-        if profile.symlink_source:
-            profile_data["symlink_source"] = str(profile.symlink_source)
-        data["journals"][name] = profile_data
-
-    config_path.write_text(json.dumps(data, indent=2))
+    # Paths and datetimes become strings in pydantic-core; an unset
+    # symlink_source is left out, as it always has been
+    data = config.model_dump(mode="json", exclude_none=True)
+    jsonio.dump_file(data, config_path, indent=True)
+    _config_cache = (_cache_key(config_path), config.model_copy(deep=True))
+
+
+def _cache_key(config_path: Path) -> tuple:
+    """Identify the current contents of the config file without reading it."""
+    stat = config_path.stat()
+    return (config_path, stat.st_mtime_ns, stat.st_size)
 
 
 def update_config(**kwargs):
@@ -293,8 +334,9 @@ def update_config(**kwargs):
         if hasattr(config, key):
             setattr(config, key, value)
 
-    config.last_updated = datetime.now()
-    save_config(config)
+    now = datetime.now()
+    config.last_updated = now
+    save_config(config, now=now)
     return config
 
 
@@ -6,10 +6,15 @@ handling relative date specifications.
 Issue: #6 - Search & Filter Enhancement
 """
 
+import functools
 import re
 from datetime import date, timedelta
 from pathlib import Path
 
+ABSOLUTE_DATE_PATTERN = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+RELATIVE_DATE_PATTERN = re.compile(r"^(\d+)([dwm])$")
+FILENAME_DATE_PATTERN = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
 
 def parse_date(date_str: str) -> date:
     """
@@ -35,21 +40,27 @@ def parse_date(date_str: str) -> date:
         >>> parse_date("7d")  # 7 days ago from today
         date(...)
     """
+    # Relative dates depend on today, so it's part of the cache key
+    return _parse_date_cached(date_str, date.today().toordinal())
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_date_cached(date_str: str, today_ordinal: int) -> date:
+    """Parse a date string as of the given day (see parse_date)."""
     # Try absolute date format first
-    absolute_pattern = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
-    match = absolute_pattern.match(date_str)
-    if match:
+    # The pattern keeps input strict (fromisoformat alone would also take
+    # forms like 20241001); fromisoformat then builds the date in C
+    if ABSOLUTE_DATE_PATTERN.match(date_str):
         try:
-            year, month, day = map(int, match.groups())
-            return date(year, month, day)
+            return date.fromisoformat(date_str)
         except ValueError as e:
             raise ValueError(f"Invalid date: {date_str}") from e
 
-    # Try relative date format
-    relative_pattern = re.compile(r"^(\d+)([dwm])$")
-    match = relative_pattern.match(date_str)
-    if match:
-        return parse_relative_date(date_str)
+    # Try relative date format (it does its own matching)
+    try:
+        return parse_relative_date(date_str, today=date.fromordinal(today_ordinal))
+    except ValueError:
+        pass
 
     raise ValueError(
         f"Invalid date format: '{date_str}'. "
@@ -57,12 +68,13 @@ def parse_date(date_str: str) -> date:
     )
 
 
-def parse_relative_date(relative: str) -> date:
+def parse_relative_date(relative: str, today: date | None = None) -> date:
     """
     Parse relative dates like '7d', '1w', '1m' to absolute dates.
 
     Args:
         relative: Relative date string (e.g., "7d", "2w", "1m")
+        today: Date to count back from (defaults to today)
 
     Returns:
         Absolute date object
@@ -77,10 +89,9 @@ def parse_relative_date(relative: str) -> date:
         >>> parse_relative_date("2w")
         date(...)  # 2 weeks ago
     """
-    today = date.today()
+    today = today or date.today()
 
-    pattern = re.compile(r"^(\d+)([dwm])$")
-    match = pattern.match(relative)
+    match = RELATIVE_DATE_PATTERN.match(relative)
 
     if not match:
         raise ValueError(
@@ -123,16 +134,21 @@ def extract_date_from_filename(file_path: Path) -> date | None:
         >>> extract_date_from_filename(Path("projects/launch.md"))
         None
     """
+    name = file_path.name
+
+    # A date needs 10 characters and two hyphens; most undated names
+    # (projects/launch.md) fail this without running the regex
+    if len(name) < 10 or name.count("-") < 2:
+        return None
+
     # Look for YYYY-MM-DD pattern in filename
-    pattern = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
-    match = pattern.search(file_path.name)
+    match = FILENAME_DATE_PATTERN.search(name)
 
     if not match:
         return None
 
     try:
-        year, month, day = map(int, match.groups())
-        return date(year, month, day)
+        return date.fromisoformat(match.group(0))
     except ValueError:
         # Invalid date (e.g., 2024-13-01)
         return None
@@ -0,0 +1,94 @@
+"""Fast file copies using copy-on-write clones and in-kernel copies."""
+
+import errno
+import os
+import shutil
+import sys
+from pathlib import Path
+
+# Buffer for copying file contents; 1 MiB makes far fewer read/write calls
+# than shutil's 64 KiB default without holding much memory per worker
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Linux ioctl that shares extents between files on btrfs/XFS (reflink)
+FICLONE = 0x40049409
+
+# Errors meaning "this copy strategy isn't available here", not a failed copy
+_UNSUPPORTED = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EBADF,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.ENOTTY,
+    errno.EPERM,
+}
+
+
+def copy_file(source: Path, destination: Path) -> None:
+    """Copy a file's contents and metadata, using the cheapest method available.
+
+    Tries, in order: a copy-on-write clone (clonefile on macOS, FICLONE on
+    Linux), os.copy_file_range, then a buffered read/write.
+
+    Args:
+        source: File to copy
+        destination: Path to write (overwritten if it exists)
+    """
+    if not (sys.platform == "darwin" and _clonefile(source, destination)):
+        with open(source, "rb") as fsrc, open(destination, "wb") as fdst:
+            if not (_reflink(fsrc, fdst) or _copy_file_range(fsrc, fdst)):
+                shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+    shutil.copystat(source, destination)
+
+
+def _clonefile(source: Path, destination: Path) -> bool:
+    """Clone a file on APFS via clonefile(2). Requires destination to not exist."""
+    try:
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        return libc.clonefile(os.fsencode(source), os.fsencode(destination), 0) == 0
+    except (AttributeError, OSError):
+        return False
+
+
+def _reflink(fsrc, fdst) -> bool:
+    """Share the source's extents with the destination via FICLONE on Linux."""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        import fcntl
+
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        return True
+    except OSError as e:
+        if e.errno in _UNSUPPORTED:
+            return False
+        raise
+
+
+def _copy_file_range(fsrc, fdst) -> bool:
+    """Copy inside the kernel with os.copy_file_range, if supported."""
+    if not hasattr(os, "copy_file_range"):
+        return False
+
+    infd, outfd = fsrc.fileno(), fdst.fileno()
+    offset = 0
+    while True:
+        try:
+            sent = os.copy_file_range(infd, outfd, COPY_BUFFER_SIZE * 8)
+        except OSError as e:
+            # Nothing written yet: let the caller fall back to a plain copy
+            if offset == 0 and e.errno in _UNSUPPORTED:
+                return False
+            raise
+        if sent == 0:
+            # Some filesystems (procfs, FUSE, NFS/CIFS across devices on older
+            # kernels) report 0 at once instead of an error; unless the source
+            # really is empty, leave the copy to the buffered fallback
+            if offset == 0 and os.fstat(infd).st_size > 0:
+                return False
+            return True
+        offset += sent
@@ -6,12 +6,27 @@ with entry type detection.
 Issue: #6 - Search & Filter Enhancement
 """
 
+import fnmatch
+import os
+import re
+from collections.abc import Callable
 from datetime import date
 from pathlib import Path
 
 from ai_journal_kit.core.date_utils import extract_date_from_filename
 from ai_journal_kit.core.search_result import EntryType
 
+# Whether file names match patterns case-sensitively, as rglob does per platform
+CASE_SENSITIVE_NAMES = os.name != "nt"
+
+# Top-level journal folder -> the entry type of every file beneath it
+FOLDER_ENTRY_TYPES = {
+    "daily": EntryType.DAILY,
+    "projects": EntryType.PROJECT,
+    "people": EntryType.PEOPLE,
+    "memories": EntryType.MEMORY,
+}
+
 
 class FileScanner:
     """Efficient file scanner with caching."""
@@ -52,31 +67,37 @@ class FileScanner:
         Returns:
             List of matching file paths
         """
-        # Use pathlib.Path.rglob() for cross-platform recursive search
-        all_files = list(self.journal_path.rglob(pattern))
+        matches = _name_matcher(pattern)
+        filter_dates = date_after is not None or date_before is not None
 
+        # DirEntry already knows each entry's type, so the walk stats
+        # nothing and only matching files become Paths
         filtered_files = []
-        for file_path in all_files:
-            # Filter by entry type if specified
-            if entry_types:
-                try:
-                    file_entry_type = self.get_entry_type(file_path)
-                    if file_entry_type not in entry_types:
+        pending = [(str(self.journal_path), True)]  # (directory, is journal root)
+        while pending:
+            directory, at_root = pending.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # The folder under the journal root decides the entry type,
+                    # so a type filter prunes whole folders before listing them
+                    if at_root and entry_types:
+                        if FOLDER_ENTRY_TYPES.get(entry.name) not in entry_types:
+                            continue
+                    pending.append((entry.path, False))
+                elif matches(entry.name) and entry.is_file():
+                    # Files at the root have no entry type; any type filter drops them
+                    if at_root and entry_types:
                         continue
-                except ValueError:
-                    # Skip files that don't match known entry types
-                    continue
-
-            # Filter by date if specified
-            if date_after or date_before:
-                file_date = extract_date_from_filename(file_path)
-                if file_date:
-                    if date_after and file_date < date_after:
+                    file_path = Path(entry.path)
+                    if filter_dates and not _in_date_range(file_path, date_after, date_before):
                         continue
-                    if date_before and file_date > date_before:
-                        continue
-
-            filtered_files.append(file_path)
+                    filtered_files.append(file_path)
 
         return filtered_files
 
@@ -114,18 +135,46 @@ class FileScanner:
 
         folder = parts[0] if len(parts) > 0 else ""
 
-        # Map folder names to entry types
-        folder_mapping = {
-            "daily": EntryType.DAILY,
-            "projects": EntryType.PROJECT,
-            "people": EntryType.PEOPLE,
-            "memories": EntryType.MEMORY,
-        }
-
-        if folder in folder_mapping:
-            return folder_mapping[folder]
+        if folder in FOLDER_ENTRY_TYPES:
+            return FOLDER_ENTRY_TYPES[folder]
 
         raise ValueError(
             f"Unknown entry type for folder '{folder}'. "
-            f"Expected one of: {', '.join(folder_mapping.keys())}"
+            f"Expected one of: {', '.join(FOLDER_ENTRY_TYPES.keys())}"
         )
+
+
+def _name_matcher(
+    pattern: str, case_sensitive: bool = CASE_SENSITIVE_NAMES
+) -> Callable[[str], bool]:
+    """
+    Build a predicate matching file names against a glob pattern.
+
+    Patterns like "*.md" become a plain suffix check; anything else is
+    matched with fnmatch rules. Like rglob, matching ignores case on Windows
+    and is case-sensitive elsewhere.
+
+    Args:
+        pattern: Glob pattern for file names
+        case_sensitive: Whether matching is case-sensitive (default: the
+            platform's convention)
+    """
+    suffix = pattern[1:]
+    if pattern.startswith("*") and not any(c in suffix for c in "*?["):
+        if case_sensitive:
+            return lambda name: name.endswith(suffix)
+        suffix = suffix.lower()
+        return lambda name: name.lower().endswith(suffix)
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile(fnmatch.translate(pattern), flags).match
+
+
+def _in_date_range(file_path: Path, date_after: date | None, date_before: date | None) -> bool:
+    """Check a file's name date against the range; undated files always pass."""
+    file_date = extract_date_from_filename(file_path)
+    if file_date:
+        if date_after and file_date < date_after:
+            return False
+        if date_before and file_date > date_before:
+            return False
+    return True
@@ -1,6 +1,9 @@
 """Journal structure creation and validation."""
 
+import os
 import shutil
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from importlib.resources import files
 from pathlib import Path
 
@@ -41,24 +44,93 @@ def create_structure(journal_path: Path, framework: str = "default"):
         copy_framework_templates(framework, journal_path)
 
 
-def copy_framework_templates(framework: str, journal_path: Path):
+def copy_framework_templates(framework: str, journal_path: Path) -> list[Path]:
     """Copy framework-specific templates to journal.
 
     Args:
         framework: Framework name (gtd, para, bullet-journal, zettelkasten)
         journal_path: Root journal directory
+
+    Returns:
+        Paths of the templates written to the journal
     """
     template_base = files("ai_journal_kit.templates").joinpath("frameworks").joinpath(framework)
-    template_dir = Path(str(template_base))
 
-    if not template_dir.exists():
+    # List the framework directory once, filtering names by suffix
+    try:
+        with os.scandir(str(template_base)) as it:
+            template_files = [
+                entry for entry in it if entry.name.endswith(".md") and entry.is_file()
+            ]
+    except FileNotFoundError:
         # Framework templates don't exist yet - skip silently
-        return
+        return []
 
     # Copy all templates from framework directory to journal root
-    for template_file in template_dir.glob("*.md"):
+    installed = []
+    for template_file in template_files:
         dest_file = journal_path / template_file.name
-        shutil.copy2(template_file, dest_file)
+        shutil.copy2(template_file.path, dest_file)
+        installed.append(dest_file)
+    return installed
+
+
+@dataclass
+class JournalScan:
+    """What one read of a journal's root found, for health checks."""
+
+    exists: bool  # Whether the journal root could be read
+    missing: list[str] = field(default_factory=list)  # Required folders absent
+    markers: set[str] = field(default_factory=set)  # Requested marker paths present
+    stats: dict[str, int] = field(default_factory=dict)  # *.md count per folder, if counted
+
+
+def scan_journal(
+    journal_path: Path, markers: Iterable[str] = (), count_files: bool = False
+) -> JournalScan:
+    """Check a journal's folders, marker files and file counts in one pass.
+
+    The root is listed once and every check answered from that listing;
+    nested markers are only probed when their top-level entry exists, and
+    folders are only listed when counting files.
+
+    Args:
+        journal_path: Root journal directory
+        markers: Journal-relative POSIX paths to check for (e.g. ".cursor/rules")
+        count_files: Whether to count markdown files in each required folder
+
+    Returns:
+        JournalScan of the results
+    """
+    try:
+        with os.scandir(journal_path) as it:
+            entries = {entry.name: entry for entry in it}
+    except OSError:
+        stats = dict.fromkeys(REQUIRED_FOLDERS, 0) if count_files else {}
+        return JournalScan(exists=False, missing=REQUIRED_FOLDERS.copy(), stats=stats)
+
+    scan = JournalScan(exists=True)
+    scan.missing = [folder for folder in REQUIRED_FOLDERS if folder not in entries]
+
+    for marker in markers:
+        top, _, rest = marker.partition("/")
+        if top in entries and (not rest or os.path.exists(os.path.join(journal_path, marker))):
+            scan.markers.add(marker)
+
+    if count_files:
+        for folder in REQUIRED_FOLDERS:
+            scan.stats[folder] = _count_markdown(entries[folder]) if folder in entries else 0
+
+    return scan
+
+
+def _count_markdown(entry: os.DirEntry) -> int:
+    """Count the *.md entries of a directory, as Path.glob("*.md") would match them."""
+    try:
+        with os.scandir(entry.path) as it:
+            return sum(1 for child in it if child.name.endswith(".md"))
+    except OSError:
+        return 0
 
 
 def validate_structure(journal_path: Path) -> tuple[bool, list[str]]:
@@ -70,15 +142,7 @@ def validate_structure(journal_path: Path) -> tuple[bool, list[str]]:
     Returns:
         Tuple of (all_present, missing_folders)
     """
-    if not journal_path.exists():
-        return False, REQUIRED_FOLDERS.copy()
-
-    missing = []
-    for folder in REQUIRED_FOLDERS:
-        folder_path = journal_path / folder
-        if not folder_path.exists():
-            missing.append(folder)
-
+    missing = scan_journal(journal_path).missing
     return len(missing) == 0, missing
 
 
@@ -91,12 +155,4 @@ def get_folder_stats(journal_path: Path) -> dict[str, int]:
     Returns:
         Dictionary of folder_name: file_count
     """
-    stats = {}
-    for folder in REQUIRED_FOLDERS:
-        folder_path = journal_path / folder
-        if folder_path.exists():
-            # Count markdown files only
-            stats[folder] = len(list(folder_path.glob("*.md")))
-        else:
-            stats[folder] = 0
-    return stats
+    return scan_journal(journal_path, count_files=True).stats
@@ -6,11 +6,17 @@ user customizations and prevent data loss during updates.
 
 import hashlib
 import json
+import os
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Literal
 
+from ai_journal_kit.utils import jsonio
+
+# Framework templates are installed at the journal root with this suffix
+TEMPLATE_SUFFIX = "-template.md"
+
 
 @dataclass
 class FileEntry:
@@ -74,8 +80,7 @@ class Manifest:
         data = {"version": self.version, "framework": self.framework, "files": files_dict}
 
         manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(manifest_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        jsonio.dump_file(data, manifest_path, indent=True)
 
     def add_file(
         self,
@@ -83,6 +88,7 @@ class Manifest:
         source: str,
         customized: bool = False,
         relative_to: Path | None = None,
+        installed_at: str | None = None,
     ):
         """Add or update a file in the manifest.
 
@@ -91,6 +97,7 @@ class Manifest:
             source: Source identifier (e.g., "framework:gtd", "system:ide-config")
             customized: Whether file is customized
             relative_to: Make path relative to this directory (for portability)
+            installed_at: ISO timestamp to record (defaults to now)
         """
         # Use relative path for portability
         if relative_to:
@@ -106,11 +113,30 @@ class Manifest:
 
         self.files[file_key] = FileEntry(
             source=source,
-            installed_at=datetime.now().isoformat(),
+            installed_at=installed_at or datetime.now().isoformat(),
             hash=file_hash,
             customized=customized,
         )
 
+    def add_files(
+        self,
+        file_paths: list[Path],
+        source: str,
+        customized: bool = False,
+        relative_to: Path | None = None,
+    ):
+        """Add or update several files installed together, under one timestamp.
+
+        Args:
+            file_paths: Absolute paths to files
+            source: Source identifier (e.g., "framework:gtd", "system:ide-config")
+            customized: Whether files are customized
+            relative_to: Make paths relative to this directory (for portability)
+        """
+        installed_at = datetime.now().isoformat()
+        for file_path in file_paths:
+            self.add_file(file_path, source, customized, relative_to, installed_at)
+
     def is_customized(self, file_path: Path, relative_to: Path | None = None) -> bool:
         """Check if a file has been customized by the user.
 
@@ -142,11 +168,39 @@ class Manifest:
 
         # Compare current hash with tracked hash
         actual_path = file_path if file_path.is_absolute() else relative_to / file_path
-        if not actual_path.exists():
-            return False
+        return self._content_changed(entry, actual_path)
+
+    def customized_files(self, file_paths: list[Path], relative_to: Path) -> list[Path]:
+        """Find which of several files under one directory are customized.
 
-        current_hash = self._compute_hash(actual_path)
-        return current_hash != entry.hash
+        Same answer as calling is_customized on each path, but manifest keys
+        are sliced off the string paths under one shared prefix instead of
+        going through Path.relative_to per file.
+
+        Args:
+            file_paths: Absolute paths to files
+            relative_to: Directory the manifest keys are relative to
+
+        Returns:
+            The customized files, in the order given
+        """
+        # Untracked files are never customized, so an empty manifest needs no checks
+        if not self.files:
+            return []
+
+        prefix = os.path.join(str(relative_to), "")
+        customized = []
+        for file_path in file_paths:
+            path_str = str(file_path)
+            if not path_str.startswith(prefix):
+                if self.is_customized(file_path, relative_to=relative_to):
+                    customized.append(file_path)
+                continue
+
+            entry = self.files.get(path_str[len(prefix) :])
+            if entry is not None and (entry.customized or self._content_changed(entry, file_path)):
+                customized.append(file_path)
+        return customized
 
     def mark_customized(self, file_path: Path, relative_to: Path | None = None):
         """Mark a file as customized.
@@ -202,6 +256,13 @@ class Manifest:
                 customized.append(file_path)
         return customized
 
+    @classmethod
+    def _content_changed(cls, entry: FileEntry, actual_path: Path) -> bool:
+        """Check whether a tracked file's content no longer matches its hash."""
+        if not actual_path.exists():
+            return False
+        return cls._compute_hash(actual_path) != entry.hash
+
     @staticmethod
     def _compute_hash(file_path: Path) -> str:
         """Compute SHA256 hash of file content.
@@ -212,13 +273,38 @@ class Manifest:
         Returns:
             Hex digest of file hash
         """
-        sha256 = hashlib.sha256()
         with open(file_path, "rb") as f:
+            # file_digest (Python 3.11+) reads the file in C
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "sha256").hexdigest()
+
+            sha256 = hashlib.sha256()
             for chunk in iter(lambda: f.read(8192), b""):
                 sha256.update(chunk)
         return sha256.hexdigest()
 
 
+def find_templates(journal_path: Path) -> list[Path]:
+    """Find the framework templates installed at a journal's root.
+
+    Args:
+        journal_path: Journal root directory
+
+    Returns:
+        Paths of *-template.md files, in directory order (none if the
+        journal directory is missing)
+    """
+    try:
+        with os.scandir(journal_path) as it:
+            return [
+                Path(entry.path)
+                for entry in it
+                if entry.name.endswith(TEMPLATE_SUFFIX) and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+
 def is_in_safe_zone(file_path: Path, journal_path: Path) -> bool:
     """Check if file is in user-owned safe zone.
 
@@ -1,20 +1,24 @@
 """Migration utilities for upgrading existing journals to new versions."""
 
 from ai_journal_kit import __version__
-from ai_journal_kit.core.config import load_config
-from ai_journal_kit.core.manifest import Manifest
+from ai_journal_kit.core.config import Config, load_config
+from ai_journal_kit.core.manifest import Manifest, find_templates
 
 
-def migrate_to_manifest_system() -> bool:
+def migrate_to_manifest_system(config: Config | None = None) -> bool:
     """Migrate existing journal to use manifest tracking system.
 
     This runs automatically when a journal is detected without a manifest.
     Safe to run multiple times (idempotent).
 
+    Args:
+        config: Config the caller already loaded (loaded here if omitted)
+
     Returns:
         True if migration was performed, False if not needed
     """
-    config = load_config()
+    if config is None:
+        config = load_config()
     if not config:
         return False  # No journal setup yet
 
@@ -33,13 +37,12 @@ def migrate_to_manifest_system() -> bool:
     manifest = Manifest(version=__version__, framework=config.framework)
 
     # Track all existing templates
-    for template_file in journal_path.glob("*-template.md"):
-        manifest.add_file(
-            template_file,
-            source=f"framework:{config.framework}",
-            customized=False,  # Assume not customized initially
-            relative_to=journal_path,
-        )
+    manifest.add_files(
+        find_templates(journal_path),
+        source=f"framework:{config.framework}",
+        customized=False,  # Assume not customized initially
+        relative_to=journal_path,
+    )
 
     # Save manifest
     manifest.save(manifest_path)
@@ -47,10 +50,13 @@ def migrate_to_manifest_system() -> bool:
     return True  # Migration performed
 
 
-def ensure_manifest_exists() -> None:
+def ensure_manifest_exists(config: Config | None = None) -> None:
     """Ensure manifest exists for current journal, migrating if necessary.
 
     Call this from any command that needs manifest support.
     Silent no-op if not needed.
+
+    Args:
+        config: Config the caller already loaded, so it isn't loaded twice
     """
-    migrate_to_manifest_system()
+    migrate_to_manifest_system(config)
@@ -6,13 +6,16 @@ coordinating file scanning, text search, and result aggregation.
 Issue: #6 - Search & Filter Enhancement
 """
 
+import functools
 import re
 import time
+from collections.abc import Iterator
 from datetime import date
 from pathlib import Path
 
 from ai_journal_kit.core.date_utils import extract_date_from_filename
 from ai_journal_kit.core.file_scanner import FileScanner
+from ai_journal_kit.core.search_index import open_index
 from ai_journal_kit.core.search_result import (
     EntryType,
     SearchQuery,
@@ -24,6 +27,59 @@ from ai_journal_kit.core.search_result import (
 WIKILINK_PATTERN = r"\[\[([^\]|]+)(?:\|[^\]]+)?\]\]"
 
 
+# Lines shown before and after each match
+CONTEXT_LINES = 2
+
+
+@functools.lru_cache(maxsize=256)
+def compile_search_pattern(search_text: str, case_sensitive: bool = False) -> re.Pattern:
+    """
+    Compile the literal pattern for a search, once per query rather than per file.
+
+    Args:
+        search_text: Text to search for (escaped, so matched literally)
+        case_sensitive: Whether matching is case-sensitive
+
+    Returns:
+        Compiled regex
+    """
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile(re.escape(search_text), flags)
+
+
+def _line_window(text: str, line_start: int, context_lines: int) -> tuple[list[str], int]:
+    """
+    Split out the line starting at line_start plus up to context_lines on each side.
+
+    Args:
+        text: File contents, with "\n" line endings
+        line_start: Offset of the first character of the line
+        context_lines: Number of lines wanted before and after it
+
+    Returns:
+        Tuple of (lines in the window, index of the line within them)
+    """
+    window_start = line_start
+    line_idx = 0
+    while line_idx < context_lines and window_start > 0:
+        window_start = text.rfind("\n", 0, window_start - 1) + 1
+        line_idx += 1
+
+    window_end = line_start
+    for _ in range(context_lines + 1):
+        newline = text.find("\n", window_end)
+        if newline == -1:
+            window_end = len(text)
+            break
+        window_end = newline + 1
+
+    window = text[window_start:window_end]
+    lines = window.split("\n")
+    if window.endswith("\n"):
+        lines.pop()
+    return lines, line_idx
+
+
 class SearchEngine:
     """Main search engine class coordinating file scanning and search."""
 
@@ -51,6 +107,7 @@ class SearchEngine:
 
         self.journal_path = journal_path.resolve()
         self.file_scanner = FileScanner(journal_path)
+        self.index = open_index(self.journal_path)
 
     def search(self, query: SearchQuery) -> SearchResultSet:
         """
@@ -68,23 +125,8 @@ class SearchEngine:
         """
         start_time = time.time()
 
-        # Scan files using FileScanner with query filters
-        files = self.file_scanner.scan(
-            entry_types=query.entry_types if query.entry_types else None,
-            date_after=query.date_after,
-            date_before=query.date_before,
-        )
-
-        # Search each file for matches
-        all_results: list[SearchResult] = []
-        for file_path in files:
-            file_results = self._search_in_file(file_path, query.search_text, query.case_sensitive)
-            all_results.extend(file_results)
-
-            # Apply limit if specified
-            if query.limit and len(all_results) >= query.limit:
-                all_results = all_results[: query.limit]
-                break
+        files, candidates = self._scan_candidates(query)
+        all_results = list(self._iter_results(candidates, query))
 
         # Calculate execution time
         execution_time = (time.time() - start_time) * 1000  # Convert to ms
@@ -98,6 +140,22 @@ class SearchEngine:
             files_scanned=len(files),
         )
 
+    def search_iter(self, query: SearchQuery) -> Iterator[SearchResult]:
+        """
+        Execute search query, yielding results as each file is searched.
+
+        Unlike search(), results aren't collected first, so callers can show
+        them while the scan continues.
+
+        Args:
+            query: SearchQuery object with search criteria
+
+        Yields:
+            SearchResult objects in the same order search() returns them
+        """
+        _, candidates = self._scan_candidates(query)
+        yield from self._iter_results(candidates, query)
+
     def scan_files(
         self,
         entry_types: list[EntryType] | None = None,
@@ -145,6 +203,33 @@ class SearchEngine:
         Returns:
             SearchResultSet with entries containing the reference
 
+        Raises:
+            ValueError: If reference format is invalid
+        """
+        query = self.cross_reference_query(reference, entry_types, date_after, date_before)
+
+        # Execute search and return results
+        return self.search(query)
+
+    def cross_reference_query(
+        self,
+        reference: str,
+        entry_types: list[EntryType] | None = None,
+        date_after: date | None = None,
+        date_before: date | None = None,
+    ) -> SearchQuery:
+        """
+        Build the query that finds entries referencing a specific note.
+
+        Args:
+            reference: Reference path (e.g., "people/sarah")
+            entry_types: Optional list of entry types to search
+            date_after: Optional date filter (after)
+            date_before: Optional date filter (before)
+
+        Returns:
+            SearchQuery for the [[reference]] wiki-link
+
         Raises:
             ValueError: If reference format is invalid
         """
@@ -160,8 +245,7 @@ class SearchEngine:
         # Using the actual wiki-link syntax
         search_pattern = f"[[{normalized_ref}"
 
-        # Create SearchQuery
-        query = SearchQuery(
+        return SearchQuery(
             search_text=search_pattern,
             entry_types=entry_types or list(EntryType),
             date_after=date_after,
@@ -171,11 +255,60 @@ class SearchEngine:
             limit=None,
         )
 
-        # Execute search and return results
-        return self.search(query)
+    def _scan_candidates(self, query: SearchQuery) -> tuple[list[Path], list[Path]]:
+        """
+        Find the files a query applies to, and those that may contain its text.
+
+        Args:
+            query: SearchQuery object with search criteria
+
+        Returns:
+            Tuple of (files matching the filters, candidate files to search)
+        """
+        # Scan files using FileScanner with query filters
+        files = self.file_scanner.scan(
+            entry_types=query.entry_types if query.entry_types else None,
+            date_after=query.date_after,
+            date_before=query.date_before,
+        )
+
+        # Only read files the index shows can contain the query
+        return files, self.index.candidates(files, query.search_text)
+
+    def _iter_results(self, files: list[Path], query: SearchQuery) -> Iterator[SearchResult]:
+        """
+        Search each file for matches, stopping at the query's limit.
+
+        The limit ends the scan rather than trimming a full result list:
+        results come out in file order with no sort to wait for, so no file
+        is read, and no line searched, once enough matches are found.
+
+        Args:
+            files: Files to search, in order
+            query: SearchQuery object with search criteria
+
+        Yields:
+            SearchResult objects
+        """
+        remaining = query.limit
+        for file_path in files:
+            file_results = self._search_in_file(
+                file_path, query.search_text, query.case_sensitive, max_results=remaining
+            )
+            yield from file_results
+
+            # Apply limit if specified
+            if remaining is not None:
+                remaining -= len(file_results)
+                if remaining <= 0:
+                    return
 
     def _search_in_file(
-        self, file_path: Path, pattern: str, case_sensitive: bool = False
+        self,
+        file_path: Path,
+        pattern: str,
+        case_sensitive: bool = False,
+        max_results: int | None = None,
     ) -> list[SearchResult]:
         """
         Search for pattern in file and extract context.
@@ -184,6 +317,7 @@ class SearchEngine:
             file_path: Path to file to search
             pattern: Text pattern to search for (will be escaped)
             case_sensitive: Whether search is case-sensitive
+            max_results: Stop after this many matches (None = all)
 
         Returns:
             List of SearchResult objects for matches in this file
@@ -191,19 +325,24 @@ class SearchEngine:
         results: list[SearchResult] = []
 
         # Compile regex with escaped pattern for safety
-        flags = 0 if case_sensitive else re.IGNORECASE
         try:
-            regex = re.compile(re.escape(pattern), flags)
+            regex = compile_search_pattern(pattern, case_sensitive)
         except re.error:
             return results
 
         # Open file with UTF-8 encoding
         try:
             with open(file_path, encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()
+                text = f.read()
         except OSError:
             return results
 
+        # Text mode turns every line ending into "\n", so no line contains one;
+        # otherwise, one regex pass over the whole file finds the same matches
+        # as searching line by line, without a Python-level loop per line
+        if "\n" in pattern or not regex.search(text):
+            return results
+
         # Get entry metadata
         try:
             entry_type = self.file_scanner.get_entry_type(file_path)
@@ -212,30 +351,41 @@ class SearchEngine:
 
         entry_date = extract_date_from_filename(file_path)
 
-        # Search each line for matches
-        for line_idx, line in enumerate(lines):
-            line = line.rstrip("\n\r")
-            match = regex.search(line)
-
-            if match:
-                # Extract context
-                context_before, context_after = self._extract_context(lines, line_idx)
-
-                # Get match positions
-                match_positions = [(m.start(), m.end()) for m in regex.finditer(line)]
-
-                # Create search result
-                result = SearchResult(
-                    file_path=file_path,
-                    entry_type=entry_type,
-                    entry_date=entry_date,
-                    line_number=line_idx + 1,  # 1-indexed for display
-                    matched_line=line,
-                    context_before=[ctx_line.rstrip("\n\r") for ctx_line in context_before],
-                    context_after=[ctx_line.rstrip("\n\r") for ctx_line in context_after],
-                    match_positions=match_positions,
-                )
-                results.append(result)
+        # Group matches by the line they fall on, noting where each line starts
+        line_idx = 0
+        line_start = 0
+        scanned = 0
+        matched_lines: dict[int, tuple[int, list[tuple[int, int]]]] = {}
+        for m in regex.finditer(text):
+            newlines = text.count("\n", scanned, m.start())
+            if newlines:
+                line_idx += newlines
+                line_start = text.rfind("\n", scanned, m.start()) + 1
+            scanned = m.start()
+            if line_idx not in matched_lines and len(matched_lines) == max_results:
+                break
+            matched_lines.setdefault(line_idx, (line_start, []))[1].append(
+                (m.start() - line_start, m.end() - line_start)
+            )
+
+        for line_idx, (line_start, match_positions) in matched_lines.items():
+            # Only the matched line and its context are split out of the
+            # text, never the whole file
+            lines, window_idx = _line_window(text, line_start, CONTEXT_LINES)
+            context_before, context_after = self._extract_context(lines, window_idx, CONTEXT_LINES)
+
+            # Create search result
+            result = SearchResult(
+                file_path=file_path,
+                entry_type=entry_type,
+                entry_date=entry_date,
+                line_number=line_idx + 1,  # 1-indexed for display
+                matched_line=lines[window_idx],
+                context_before=context_before,
+                context_after=context_after,
+                match_positions=match_positions,
+            )
+            results.append(result)
 
         return results
 
@@ -0,0 +1,382 @@
+"""Persistent indexes for narrowing journal searches.
+
+Indexes live in the user cache directory, one folder per journal (see
+index_dir), so searching never writes into the journal itself.
+
+Where SQLite has FTS5 with the trigram tokenizer, file bodies are indexed in
+an index.db database (FTSSearchIndex) and the query is matched as a
+substring (GLOB) inside SQLite. Otherwise a pure-Python word index is used:
+
+Each file's vocabulary (its distinct words, case-folded) is recorded once in
+an index.json sidecar. A line can only contain the query if
+every run of word characters in the query appears inside some word of the
+file, so a substring check against each file's vocabulary picks out the
+candidate files; only those are read and searched line by line. Entries are
+refreshed from file mtimes and sizes, so only changed files are re-read.
+Either way the engine still searches the candidates line by line, so the
+results are exactly those of a full scan.
+
+Issue: #6 - Search & Filter Enhancement
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
+
+from ai_journal_kit.utils.platform import get_cache_dir
+
+INDEX_FILENAME = "index.json"
+INDEX_VERSION = 1
+FTS_INDEX_FILENAME = "index.db"
+
+WORD_PATTERN = re.compile(r"\w+")
+GLOB_SPECIAL = re.compile(r"[*?\[]")
+
+# Files modified this recently may change again within the same mtime tick,
+# so their stamp isn't trusted on the next refresh (as git does for its index)
+RACY_WINDOW_NS = 2_000_000_000
+
+# Non-ASCII characters that re.IGNORECASE matches against an ASCII letter.
+# Folding them keeps case-insensitive candidates a superset of the real matches.
+_ASCII_FOLDS = str.maketrans({"İ": "i", "ı": "i", "ſ": "s", "K": "k"})
+
+
+def index_dir(journal_path: Path) -> Path:
+    """Get the cache folder holding a journal's search indexes.
+
+    Args:
+        journal_path: Absolute path to journal directory
+
+    Returns:
+        Folder under the user cache directory, named after a hash of the
+        journal path (not created here)
+    """
+    digest = hashlib.sha256(str(journal_path).encode("utf-8")).hexdigest()[:16]
+    return get_cache_dir() / "search-index" / digest
+
+
+def fold(text: str) -> str:
+    """Normalize text so case variants of the same ASCII query fold together."""
+    return text.translate(_ASCII_FOLDS).lower()
+
+
+def vocabulary(text: str) -> str:
+    """Get the distinct case-folded words of text, space-separated."""
+    return " ".join(set(WORD_PATTERN.findall(fold(text))))
+
+
+def query_terms(search_text: str) -> list[str] | None:
+    """Get the word runs of a query that a matching file's vocabulary must contain.
+
+    Returns:
+        List of terms, or None if the index can't narrow this query (no word
+        characters, or non-ASCII characters whose case-insensitive matches the
+        folding doesn't cover)
+    """
+    if not search_text.isascii():
+        return None
+    return WORD_PATTERN.findall(search_text.lower()) or None
+
+
+class SearchIndex:
+    """Word index over a journal's markdown files."""
+
+    def __init__(self, journal_path: Path):
+        """
+        Initialize index for a journal.
+
+        Args:
+            journal_path: Absolute path to journal directory
+        """
+        self.journal_path = journal_path
+        self.index_path = index_dir(journal_path) / INDEX_FILENAME
+        # Relative path -> [mtime_ns, size, vocabulary]
+        self.files: dict[str, list] = {}
+        self._load()
+
+    def candidates(self, files: list[Path], search_text: str) -> list[Path]:
+        """
+        Narrow files to those that may contain search_text.
+
+        Args:
+            files: Files to consider (from FileScanner)
+            search_text: Text being searched for
+
+        Returns:
+            Subset of files, in the same order, whose vocabulary contains every
+            query term; all files if the query can't be narrowed
+        """
+        terms = query_terms(search_text)
+        if terms is None:
+            return files
+
+        self.refresh(files)
+        matches = []
+        for file_path in files:
+            entry = self.files.get(self._key(file_path))
+            # Files that couldn't be indexed are left for the search to decide
+            if entry is None or all(term in entry[2] for term in terms):
+                matches.append(file_path)
+        return matches
+
+    def refresh(self, files: list[Path]) -> None:
+        """
+        Bring the index up to date for files, then persist it if anything changed.
+
+        Args:
+            files: Files that should be indexed
+        """
+        changed = False
+        current = {}
+        for file_path in files:
+            key = self._key(file_path)
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            entry = self.files.get(key)
+            if entry is None or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+                entry = self._index_file(file_path, stat)
+                changed = True
+            if entry is not None:
+                current[key] = entry
+
+        # Files outside this scan (other entry types or dates) stay indexed
+        for key, entry in self.files.items():
+            if key in current:
+                continue
+            if (self.journal_path / key).exists():
+                current[key] = entry
+            else:
+                changed = True
+
+        self.files = current
+        if changed:
+            self.save()
+
+    def save(self) -> None:
+        """Write the index sidecar, ignoring caches that can't be written."""
+        data = {"version": INDEX_VERSION, "files": self.files}
+        tmp_path = self.index_path.with_name(f"{INDEX_FILENAME}.tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass
+
+    def _load(self) -> None:
+        """Load the index sidecar, starting empty if it's missing or unusable."""
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == INDEX_VERSION:
+            self.files = data.get("files", {})
+
+    def _index_file(self, file_path: Path, stat: os.stat_result) -> list | None:
+        """Read a file the same way the search does and record its vocabulary."""
+        try:
+            with open(file_path, encoding="utf-8", errors="ignore") as f:
+                text = f.read()
+        except OSError:
+            return None
+
+        mtime_ns = stat.st_mtime_ns
+        if time.time_ns() - mtime_ns < RACY_WINDOW_NS:
+            mtime_ns = 0
+        return [mtime_ns, stat.st_size, vocabulary(text)]
+
+    def _key(self, file_path: Path) -> str:
+        """Get the journal-relative POSIX path used as a file's index key."""
+        return _relative_key(self.journal_path, file_path)
+
+
+class FTSSearchIndex:
+    """SQLite FTS5 trigram index over a journal's markdown files.
+
+    The trigram index serves substring GLOB patterns, so SQLite picks out
+    the files containing the whole query rather than just its words. Bodies are stored case-folded, like the word
+    index, so the candidates stay a superset of case-insensitive matches.
+    """
+
+    def __init__(self, journal_path: Path, connection: sqlite3.Connection):
+        """
+        Initialize index over an open database (see open_index).
+
+        Args:
+            journal_path: Absolute path to journal directory
+            connection: Connection with the FTS schema created
+        """
+        self.journal_path = journal_path
+        self.index_path = index_dir(journal_path) / FTS_INDEX_FILENAME
+        self.connection = connection
+
+    @classmethod
+    def open(cls, journal_path: Path) -> "FTSSearchIndex":
+        """
+        Open (creating if needed) the index database for a journal.
+
+        Raises:
+            sqlite3.Error: If the database can't be opened or this SQLite
+                build has no FTS5 trigram tokenizer
+            OSError: If the cache folder can't be created
+        """
+        index_path = index_dir(journal_path) / FTS_INDEX_FILENAME
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(index_path)
+        try:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS files ("
+                    "id INTEGER PRIMARY KEY, path TEXT UNIQUE, mtime_ns INTEGER, size INTEGER)"
+                )
+                # Each body's rowid is its files.id
+                connection.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS bodies "
+                    "USING fts5(body, tokenize='trigram', detail=none)"
+                )
+        except sqlite3.Error:
+            connection.close()
+            raise
+        return cls(journal_path, connection)
+
+    def candidates(self, files: list[Path], search_text: str) -> list[Path]:
+        """
+        Narrow files to those that may contain search_text.
+
+        Args:
+            files: Files to consider (from FileScanner)
+            search_text: Text being searched for
+
+        Returns:
+            Subset of files, in the same order, whose text contains the query
+            (or each literal part of it);
+            all files if the query can't be narrowed
+        """
+        # Folding covers re.IGNORECASE only for ASCII queries
+        if not search_text.isascii():
+            return files
+
+        # The trigram index serves literal runs of three or more characters, so
+        # GLOB wildcard characters in the query split it into separate patterns
+        runs = [run for run in GLOB_SPECIAL.split(fold(search_text)) if len(run) >= 3]
+        if not runs:
+            return files
+
+        indexed = self.refresh(files)
+        where = " AND ".join(["bodies.body GLOB ?"] * len(runs))
+        try:
+            rows = self.connection.execute(
+                f"SELECT path FROM files JOIN bodies ON bodies.rowid = files.id WHERE {where}",
+                [f"*{run}*" for run in runs],
+            ).fetchall()
+        except sqlite3.Error:
+            return files
+        matched = {path for (path,) in rows}
+
+        # Files that couldn't be indexed are left for the search to decide
+        return [
+            file_path
+            for file_path in files
+            if (key := self._key(file_path)) in matched or key not in indexed
+        ]
+
+    def refresh(self, files: list[Path]) -> set[str]:
+        """
+        Bring the index up to date for files.
+
+        Args:
+            files: Files that should be indexed
+
+        Returns:
+            Keys of the files that are indexed
+        """
+        ids = {}
+        stamps = {}
+        try:
+            rows = self.connection.execute("SELECT id, path, mtime_ns, size FROM files").fetchall()
+        except sqlite3.Error:
+            # Locked or unreadable: nothing counts as indexed, so every file
+            # is left for the search to scan
+            return set()
+        for file_id, path, mtime_ns, size in rows:
+            ids[path] = file_id
+            stamps[path] = (mtime_ns, size)
+
+        indexed = set()
+        updates = []
+        for file_path in files:
+            key = self._key(file_path)
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            if stamps.get(key) == (stat.st_mtime_ns, stat.st_size):
+                indexed.add(key)
+                continue
+            try:
+                with open(file_path, encoding="utf-8", errors="ignore") as f:
+                    body = fold(f.read())
+            except OSError:
+                continue
+            mtime_ns = stat.st_mtime_ns
+            if time.time_ns() - mtime_ns < RACY_WINDOW_NS:
+                mtime_ns = 0
+            updates.append((key, mtime_ns, stat.st_size, body))
+            indexed.add(key)
+
+        # Files outside this scan (other entry types or dates) stay indexed
+        removed = [key for key in stamps.keys() - indexed if not (self.journal_path / key).exists()]
+
+        if updates or removed:
+            stale = [(ids[key],) for key in [key for key, *_ in updates] + removed if key in ids]
+            try:
+                with self.connection:
+                    self.connection.executemany("DELETE FROM files WHERE id = ?", stale)
+                    self.connection.executemany("DELETE FROM bodies WHERE rowid = ?", stale)
+                    for key, mtime_ns, size, body in updates:
+                        cursor = self.connection.execute(
+                            "INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                            (key, mtime_ns, size),
+                        )
+                        self.connection.execute(
+                            "INSERT INTO bodies (rowid, body) VALUES (?, ?)",
+                            (cursor.lastrowid, body),
+                        )
+            except sqlite3.Error:
+                return indexed - {key for key, *_ in updates}
+        return indexed
+
+    def _key(self, file_path: Path) -> str:
+        """Get the journal-relative POSIX path used as a file's index key."""
+        return _relative_key(self.journal_path, file_path)
+
+
+def open_index(journal_path: Path) -> FTSSearchIndex | SearchIndex:
+    """
+    Open the best search index available for a journal.
+
+    Args:
+        journal_path: Absolute path to journal directory
+
+    Returns:
+        FTSSearchIndex when SQLite has FTS5 with the trigram tokenizer and the
+        cache is writable, otherwise the JSON word index
+    """
+    try:
+        return FTSSearchIndex.open(journal_path)
+    except (sqlite3.Error, OSError):
+        return SearchIndex(journal_path)
+
+
+def _relative_key(journal_path: Path, file_path: Path) -> str:
+    """Get the journal-relative POSIX path used as a file's index key."""
+    try:
+        return file_path.relative_to(journal_path).as_posix()
+    except ValueError:
+        return file_path.as_posix()
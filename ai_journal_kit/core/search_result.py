@@ -9,9 +9,13 @@ Issue: #6 - Search & Filter Enhancement
 from datetime import date
 from enum import Enum
 from pathlib import Path
+from typing import TextIO
 
 from pydantic import BaseModel, Field, field_validator
 
+# Write buffer for markdown exports, so large exports take few write calls
+EXPORT_BUFFER_SIZE = 1 << 20
+
 
 class EntryType(str, Enum):
     """Enumeration of journal entry types."""
@@ -244,16 +248,30 @@ class SearchResultSet(BaseModel):
             files_scanned=self.files_scanned,
         )
 
-    def export_to_markdown(self, output_path: Path) -> None:
+    def export_to_markdown(self, output: Path | TextIO, chunk_size: int = 64) -> None:
         """
-        Export results to markdown file.
+        Export results to markdown, writing them in chunks as they're formatted.
+
+        Only chunk_size results are held as text at once, so memory doesn't
+        grow with the export, and a 1 MiB write buffer keeps write calls few.
 
         Args:
-            output_path: Path where markdown file will be written
+            output: Path where markdown file will be written, or an open text
+                stream (e.g. sys.stdout), which is written to but not closed
+            chunk_size: Number of results formatted per write
 
         Raises:
             IOError: If file cannot be written
         """
+        if not isinstance(output, Path):
+            self._write_markdown(output, chunk_size)
+            return
+
+        with open(output, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as f:
+            self._write_markdown(f, chunk_size)
+
+    def _write_markdown(self, stream: TextIO, chunk_size: int) -> None:
+        """Write the markdown export to an open stream, chunk_size results per write."""
         from datetime import datetime
 
         lines = []
@@ -281,23 +299,26 @@ class SearchResultSet(BaseModel):
         lines.append("")
         lines.append("---")
         lines.append("")
-
-        # Add each result
-        for result in self.results:
-            lines.append(f"## {result.file_path.name} (Line {result.line_number})")
-            lines.append("")
-            lines.append(f"**Date**: {result.display_date}")
-            lines.append("")
-            lines.append("### Context")
-            lines.append("")
-            lines.append("```markdown")
-            lines.append(result.get_context())
-            lines.append("```")
-            lines.append("")
-            lines.append("---")
-            lines.append("")
-
-        output_path.write_text("\n".join(lines))
+        stream.write("\n".join(lines))
+
+        # Add each result. Every line after the header is preceded by a
+        # newline, so the file has no trailing newline beyond the last "---"
+        for start in range(0, len(self.results), chunk_size):
+            lines = []
+            for result in self.results[start : start + chunk_size]:
+                lines.append(f"## {result.file_path.name} (Line {result.line_number})")
+                lines.append("")
+                lines.append(f"**Date**: {result.display_date}")
+                lines.append("")
+                lines.append("### Context")
+                lines.append("")
+                lines.append("```markdown")
+                lines.append(result.get_context())
+                lines.append("```")
+                lines.append("")
+                lines.append("---")
+                lines.append("")
+            stream.write("\n" + "\n".join(lines))
 
     def filter_by_type(self, entry_type: EntryType) -> "SearchResultSet":
         """
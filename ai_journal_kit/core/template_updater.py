@@ -1,7 +1,7 @@
 """Template update utilities for safely updating journal templates."""
 
 import shutil
-from datetime import datetime
+import time
 from pathlib import Path
 
 from rich.table import Table
@@ -21,7 +21,7 @@ def backup_template(template_path: Path) -> Path:
     if not template_path.exists():
         raise FileNotFoundError(f"Template not found: {template_path}")
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     backup_name = f"{template_path.stem}.backup_{timestamp}{template_path.suffix}"
     backup_path = template_path.parent / backup_name
 
@@ -94,7 +94,7 @@ def show_template_changes(changes: dict[str, dict]) -> None:
     table.add_column("Last Modified")
 
     for name, info in changes.items():
-        modified_date = datetime.fromtimestamp(info["modified"]).strftime("%Y-%m-%d")
+        modified_date = time.strftime("%Y-%m-%d", time.localtime(info["modified"]))
         table.add_row(
             name,
             f"{info['size_old']} bytes",
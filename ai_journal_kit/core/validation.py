@@ -1,17 +1,33 @@
 """Path and input validation utilities."""
 
 from pathlib import Path
-from typing import Literal
+from typing import Literal, get_args
 
 IDE_CHOICES = Literal["cursor", "windsurf", "claude-code", "copilot", "all"]
 FRAMEWORK_CHOICES = Literal["default", "gtd", "para", "bullet-journal", "zettelkasten"]
 
+# Built once from the Literals above for O(1) membership checks
+VALID_IDES = frozenset(get_args(IDE_CHOICES))
+VALID_FRAMEWORKS = frozenset(get_args(FRAMEWORK_CHOICES))
 
-def validate_path(path: str | Path) -> Path:
+# Framework name -> label shown in setup and switch-framework summaries
+FRAMEWORK_DISPLAY_NAMES = {
+    "default": "Default (flexible)",
+    "gtd": "GTD (Getting Things Done)",
+    "para": "PARA (Projects, Areas, Resources, Archive)",
+    "bullet-journal": "Bullet Journal",
+    "zettelkasten": "Zettelkasten",
+}
+
+
+def validate_path(path: str | Path, parent_exists: bool | None = None) -> Path:
     """Validate and normalize a filesystem path.
 
     Args:
         path: Path to validate
+        parent_exists: Whether the parent directory exists, for callers that
+            have already resolved path and checked its parent; skips
+            resolving and checking again (None = check)
 
     Returns:
         Normalized absolute Path
@@ -25,11 +41,15 @@ def validate_path(path: str | Path) -> Path:
     if "\0" in path_str:
         raise ValueError("Path contains null byte")
 
-    # Expand ~ and resolve to absolute
-    expanded = Path(path).expanduser().resolve()
+    if parent_exists is None:
+        # Expand ~ and resolve to absolute
+        expanded = Path(path).expanduser().resolve()
+        parent_exists = expanded.parent.exists()
+    else:
+        expanded = Path(path)
 
     # Check if parent directory exists
-    if not expanded.parent.exists():
+    if not parent_exists:
         raise ValueError(f"Parent directory does not exist: {expanded.parent}")
 
     return expanded
@@ -47,11 +67,10 @@ def validate_ide(ide: str) -> str:
     Raises:
         ValueError: If IDE is not supported
     """
-    valid_ides = ["cursor", "windsurf", "claude-code", "copilot", "all"]
     ide_lower = ide.lower()
 
-    if ide_lower not in valid_ides:
-        raise ValueError(f"Invalid IDE: {ide}. Must be one of: {', '.join(valid_ides)}")
+    if ide_lower not in VALID_IDES:
+        raise ValueError(f"Invalid IDE: {ide}. Must be one of: {', '.join(get_args(IDE_CHOICES))}")
 
     return ide_lower
 
@@ -68,12 +87,12 @@ def validate_framework(framework: str) -> str:
     Raises:
         ValueError: If framework is not supported
     """
-    valid_frameworks = ["default", "gtd", "para", "bullet-journal", "zettelkasten"]
     framework_lower = framework.lower()
 
-    if framework_lower not in valid_frameworks:
+    if framework_lower not in VALID_FRAMEWORKS:
         raise ValueError(
-            f"Invalid framework: {framework}. Must be one of: {', '.join(valid_frameworks)}"
+            f"Invalid framework: {framework}. "
+            f"Must be one of: {', '.join(get_args(FRAMEWORK_CHOICES))}"
         )
 
     return framework_lower
@@ -0,0 +1,76 @@
+"""JSON serialization that uses orjson when it is installed.
+
+orjson is an optional speedup (``pip install ai-journal-kit[fast]``); every
+helper falls back to the standard library ``json`` module without it.
+"""
+
+import json
+import os
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj, indent: bool = False) -> str:
+    """Serialize obj to a JSON string.
+
+    The text is the same with or without orjson: non-ASCII characters are
+    escaped as json.dumps does, so it prints on any console encoding. orjson
+    renders indented documents that come out pure ASCII; everything else
+    (compact output, non-ASCII text) goes through json.dumps.
+
+    Args:
+        obj: JSON-compatible data (dicts, lists, str, numbers, bools, None)
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None and indent:
+        text = orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        if text.isascii():
+            return text
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def dump(obj, stream, indent: bool = False):
+    """Write obj as JSON to a text stream, followed by a newline.
+
+    Writes the same text as dumps. Without orjson this streams through
+    json.dump rather than building the whole document as one string first.
+
+    Args:
+        obj: JSON-compatible data
+        stream: Writable text stream (e.g. sys.stdout)
+        indent: Pretty-print with two-space indentation
+    """
+    if orjson is not None and indent:
+        stream.write(dumps(obj, indent=indent))
+    else:
+        json.dump(obj, stream, indent=2 if indent else None)
+    stream.write("\n")
+
+
+def dump_file(obj, path: Path, indent: bool = False):
+    """Write obj as UTF-8 JSON to path, replacing it atomically.
+
+    The document is encoded straight to bytes (non-ASCII text is kept as
+    UTF-8 rather than escaped) and written to a sibling temp file that is
+    renamed over path, so readers never see a half-written file.
+
+    Args:
+        obj: JSON-compatible data
+        path: File to write
+        indent: Pretty-print with two-space indentation
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    else:
+        data = json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
@@ -1,5 +1,6 @@
 """Platform detection and platform-specific path handling."""
 
+import os
 import platform
 import sys
 from pathlib import Path
@@ -52,3 +53,18 @@ def can_create_symlinks() -> bool:
     else:
         # Unix-like systems support symlinks
         return True
+
+
+def get_cache_dir() -> Path:
+    """Get the user cache directory for ai-journal-kit.
+
+    Lives in the platform's user cache directory, or AI_JOURNAL_CACHE_DIR
+    when that is set. It isn't created here.
+    """
+    cache_dir_str = os.getenv("AI_JOURNAL_CACHE_DIR")
+    if cache_dir_str:
+        return Path(cache_dir_str)
+
+    from platformdirs import user_cache_dir
+
+    return Path(user_cache_dir("ai-journal-kit", appauthor=False))
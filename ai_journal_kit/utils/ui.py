@@ -7,7 +7,6 @@ import questionary
 from rich.console import Console
 from rich.markdown import Markdown
 from rich.panel import Panel
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
 
@@ -85,6 +84,8 @@ def confirm(prompt: str) -> bool:
 
 def show_progress(tasks: list[tuple[str, Callable]]):
     """Execute tasks with progress bar."""
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -27,6 +27,20 @@ def temp_journal_dir() -> Generator[Path, None, None]:
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch) -> Path:
+    """Point the CLI's cache directory (e.g. the PyPI version cache) at a temp dir.
+
+    Keeps cached answers from leaking between tests or into the user's cache.
+
+    Returns:
+        Path: Temporary cache directory
+    """
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("AI_JOURNAL_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
 @pytest.fixture
 def mock_config(temp_journal_dir: Path) -> Generator[Path, None, None]:
     """Create a mock configuration file for testing.
@@ -716,3 +716,89 @@ def test_doctor_checks_unknown_ide_returns_false(temp_journal_dir, isolated_conf
 
     # Should detect missing IDE configs for unknown IDE
     assert result.exit_code in [0, 1]
+
+
+@pytest.mark.integration
+def test_doctor_scan_journal_reads_root_once(temp_journal_dir, tmp_path):
+    """Test _scan_journal lists the journal root and reports missing journals."""
+    from ai_journal_kit.cli.doctor import _scan_journal
+    from ai_journal_kit.core.journal import REQUIRED_FOLDERS, create_structure
+
+    create_structure(temp_journal_dir)
+
+    scan = _scan_journal(temp_journal_dir)
+    assert set(REQUIRED_FOLDERS) <= set(scan["entries"])
+    assert scan["writable"] is True
+
+    missing = _scan_journal(tmp_path / "does-not-exist")
+    assert missing == {"entries": None, "children": {}, "writable": False}
+
+
+@pytest.mark.integration
+def test_doctor_permission_check_writes_nothing(temp_journal_dir, isolated_config):
+    """Test the permissions check doesn't create files in the journal."""
+    from ai_journal_kit.core.config import Config, save_config
+    from ai_journal_kit.core.journal import create_structure
+    from ai_journal_kit.core.templates import copy_ide_configs
+
+    create_structure(temp_journal_dir)
+    copy_ide_configs("cursor", temp_journal_dir)
+    save_config(Config(journal_location=temp_journal_dir, ide="cursor"))
+    before = sorted(p.name for p in temp_journal_dir.iterdir())
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["doctor"])
+
+    assert result.exit_code == 0
+    assert sorted(p.name for p in temp_journal_dir.iterdir()) == before
+
+
+@pytest.mark.integration
+def test_doctor_verbose_confirms_writability_with_real_write(temp_journal_dir, isolated_config):
+    """Test --verbose backs the os.access check with an actual write."""
+    from unittest.mock import patch
+
+    from ai_journal_kit.core.config import Config, save_config
+    from ai_journal_kit.core.journal import create_structure
+    from ai_journal_kit.core.templates import copy_ide_configs
+
+    create_structure(temp_journal_dir)
+    copy_ide_configs("cursor", temp_journal_dir)
+    save_config(Config(journal_location=temp_journal_dir, ide="cursor"))
+
+    runner = CliRunner()
+    with patch("ai_journal_kit.cli.doctor._can_write", return_value=False) as mock_write:
+        quiet = runner.invoke(app, ["doctor"])
+        verbose = runner.invoke(app, ["doctor", "--verbose"])
+
+    assert quiet.exit_code == 0
+    assert verbose.exit_code == 1
+    mock_write.assert_called_once_with(temp_journal_dir)
+
+
+@pytest.mark.integration
+def test_doctor_can_write_leaves_no_files(temp_journal_dir):
+    """Test the real write probe cleans up after itself."""
+    from ai_journal_kit.cli.doctor import _can_write
+
+    assert _can_write(temp_journal_dir) is True
+    assert list(temp_journal_dir.iterdir()) == []
+    assert _can_write(temp_journal_dir / "missing") is False
+
+
+@pytest.mark.integration
+def test_doctor_scan_journal_lists_ide_config_dirs(temp_journal_dir):
+    """Test _scan_journal reads IDE config directories so IDE checks need no stats."""
+    from ai_journal_kit.cli.doctor import _check_ide_configs, _scan_journal
+    from ai_journal_kit.core.config import Config
+    from ai_journal_kit.core.templates import copy_ide_configs
+
+    copy_ide_configs("cursor", temp_journal_dir)
+    (temp_journal_dir / ".github").write_text("not a directory")
+
+    scan = _scan_journal(temp_journal_dir)
+
+    assert "rules" in scan["children"][".cursor"]
+    assert ".github" not in scan["children"]
+    assert _check_ide_configs(Config(journal_location=temp_journal_dir, ide="cursor"), scan)
+    assert not _check_ide_configs(Config(journal_location=temp_journal_dir, ide="copilot"), scan)
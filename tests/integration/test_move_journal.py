@@ -568,9 +568,10 @@ def test_move_handles_exception_during_move(temp_journal_dir, isolated_config, t
 
     new_location = tmp_path / "new"
 
-    # Mock shutil.copytree to raise exception
-    with patch(
-        "ai_journal_kit.cli.move.shutil.copytree", side_effect=PermissionError("Mock error")
+    # Force the copy path and make copying a file raise
+    with (
+        patch("ai_journal_kit.cli.move._same_filesystem", return_value=False),
+        patch("ai_journal_kit.cli.move.copy_file", side_effect=PermissionError("Mock error")),
     ):
         runner = CliRunner()
         result = runner.invoke(app, ["move", str(new_location), "--no-confirm"])
@@ -578,3 +579,227 @@ def test_move_handles_exception_during_move(temp_journal_dir, isolated_config, t
         # Should handle error
         assert result.exit_code != 0
         assert "failed" in result.output.lower() or "error" in result.output.lower()
+
+
+@pytest.mark.integration
+def test_move_same_filesystem_renames(temp_journal_dir, isolated_config, tmp_path):
+    """Test move on the same filesystem renames instead of copying."""
+    from unittest.mock import patch
+
+    create_journal_fixture(
+        path=temp_journal_dir, ide="cursor", has_content=True, config_dir=isolated_config
+    )
+
+    new_location = tmp_path / "renamed-journal"
+
+    with patch("ai_journal_kit.cli.move._parallel_copytree") as mock_copytree:
+        runner = CliRunner()
+        result = runner.invoke(app, ["move", str(new_location), "--no-confirm"])
+
+    assert result.exit_code == 0
+    mock_copytree.assert_not_called()
+    assert not temp_journal_dir.exists()
+    assert (new_location / "daily" / "2025-01-01.md").exists()
+    assert_journal_structure_valid(new_location)
+
+
+@pytest.mark.integration
+def test_move_renames_back_when_config_save_fails(temp_journal_dir, isolated_config, tmp_path):
+    """Test a failed config save after a rename puts the journal back."""
+    from unittest.mock import patch
+
+    from ai_journal_kit.core.config import load_config
+
+    create_journal_fixture(
+        path=temp_journal_dir, ide="cursor", has_content=True, config_dir=isolated_config
+    )
+
+    new_location = tmp_path / "renamed-journal"
+
+    with patch("ai_journal_kit.cli.move.save_config", side_effect=OSError("disk full")):
+        runner = CliRunner()
+        result = runner.invoke(app, ["move", str(new_location), "--no-confirm"])
+
+    assert result.exit_code == 1
+    assert "still at the original location" in result.output
+    assert (temp_journal_dir / "daily" / "2025-01-01.md").exists()
+    assert not new_location.exists()
+    assert load_config().journal_location == temp_journal_dir.resolve()
+
+
+@pytest.mark.integration
+def test_move_reports_new_location_when_symlink_update_fails(
+    temp_journal_dir, isolated_config, tmp_path
+):
+    """Test a failure after the config is saved reports where the journal now is."""
+    from unittest.mock import patch
+
+    from ai_journal_kit.core.config import load_config, update_config
+
+    create_journal_fixture(
+        path=temp_journal_dir, ide="cursor", has_content=True, config_dir=isolated_config
+    )
+    update_config(use_symlink=True, symlink_source=tmp_path / "link")
+
+    new_location = tmp_path / "renamed-journal"
+
+    with patch("ai_journal_kit.cli.move.update_link_target", side_effect=OSError("busy")):
+        runner = CliRunner()
+        result = runner.invoke(app, ["move", str(new_location), "--no-confirm"])
+
+    assert result.exit_code == 1
+    assert "still at the original location" not in result.output
+    assert "configuration updated" in result.output
+    assert load_config().journal_location == new_location.resolve()
+
+
+@pytest.mark.integration
+def test_move_renames_into_empty_destination(temp_journal_dir, isolated_config, tmp_path):
+    """Test move renames into an existing empty destination directory."""
+    create_journal_fixture(
+        path=temp_journal_dir, ide="cursor", has_content=True, config_dir=isolated_config
+    )
+
+    new_location = tmp_path / "empty-destination"
+    new_location.mkdir()
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["move", str(new_location), "--no-confirm"])
+
+    assert result.exit_code == 0
+    assert not temp_journal_dir.exists()
+    assert (new_location / "daily" / "2025-01-01.md").exists()
+
+
+@pytest.mark.integration
+def test_move_across_filesystems_copies(temp_journal_dir, isolated_config, tmp_path):
+    """Test move falls back to copy and cleanup across filesystems."""
+    from unittest.mock import patch
+
+    create_journal_fixture(
+        path=temp_journal_dir, ide="cursor", has_content=True, config_dir=isolated_config
+    )
+
+    new_location = tmp_path / "other-fs-journal"
+
+    with patch("ai_journal_kit.cli.move._same_filesystem", return_value=False):
+        runner = CliRunner()
+        result = runner.invoke(app, ["move", str(new_location), "--no-confirm"])
+
+    assert result.exit_code == 0
+    assert not temp_journal_dir.exists()
+    assert (new_location / "daily" / "2025-01-01.md").exists()
+    assert_journal_structure_valid(new_location)
+
+
+@pytest.mark.integration
+def test_parallel_copytree_copies_nested_tree(tmp_path):
+    """Test parallel copy reproduces nested files and merges into existing dirs."""
+    from ai_journal_kit.cli.move import _parallel_copytree
+
+    source = tmp_path / "source"
+    (source / "daily" / "2025").mkdir(parents=True)
+    (source / "empty").mkdir()
+    (source / "README.md").write_text("root")
+    (source / "daily" / "2025" / "01-01.md").write_text("entry")
+
+    destination = tmp_path / "destination"
+    destination.mkdir()
+    (destination / "existing.md").write_text("keep")
+
+    progress = []
+    copied = _parallel_copytree(
+        source, destination, on_copy=lambda done, total: progress.append((done, total))
+    )
+
+    assert copied == 2
+    assert progress[-1] == (2, 2)
+    assert (destination / "README.md").read_text() == "root"
+    assert (destination / "daily" / "2025" / "01-01.md").read_text() == "entry"
+    assert (destination / "empty").is_dir()
+    assert (destination / "existing.md").read_text() == "keep"
+
+
+@pytest.mark.integration
+def test_remove_in_background_deletes_directory(tmp_path):
+    """Test old location vanishes immediately and is deleted off-thread."""
+    from ai_journal_kit.cli.move import _remove_in_background
+
+    old = tmp_path / "old-journal"
+    (old / "daily").mkdir(parents=True)
+    (old / "daily" / "2025-01-01.md").write_text("entry")
+
+    thread = _remove_in_background(old)
+
+    assert not old.exists()
+    thread.join(timeout=10)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.integration
+def test_remove_in_background_reports_leftover(tmp_path):
+    """Test a failed delete reports the leftover directory instead of hiding it."""
+    from unittest.mock import patch
+
+    from ai_journal_kit.cli.move import _remove_in_background
+
+    old = tmp_path / "old-journal"
+    (old / "daily").mkdir(parents=True)
+    (old / "daily" / "2025-01-01.md").write_text("entry")
+
+    failures = []
+    with patch("os.unlink", side_effect=PermissionError("in use")):
+        thread = _remove_in_background(old, on_error=lambda path, e: failures.append(path))
+        thread.join(timeout=10)
+
+    assert len(failures) == 1
+    assert failures[0].exists()
+    assert failures[0].name.startswith(".old-journal.old-")
+
+
+@pytest.mark.integration
+def test_move_succeeds_when_cleanup_fails(temp_journal_dir, isolated_config, tmp_path):
+    """Test a failed cleanup of the old location warns but keeps the move."""
+    from unittest.mock import patch
+
+    from ai_journal_kit.core.config import load_config
+
+    create_journal_fixture(
+        path=temp_journal_dir, ide="cursor", has_content=True, config_dir=isolated_config
+    )
+
+    new_location = tmp_path / "other-fs-journal"
+
+    with (
+        patch("ai_journal_kit.cli.move._same_filesystem", return_value=False),
+        patch(
+            "ai_journal_kit.cli.move._remove_in_background",
+            side_effect=PermissionError("sharing violation"),
+        ),
+    ):
+        runner = CliRunner()
+        result = runner.invoke(app, ["move", str(new_location), "--no-confirm"])
+
+    assert result.exit_code == 0
+    assert "could not remove the old copy" in result.output
+    assert "still at the original location" not in result.output
+    assert load_config().journal_location == new_location.resolve()
+
+
+@pytest.mark.integration
+def test_nonempty_dir_detection(tmp_path):
+    """Test _nonempty_dir handles empty, populated, missing and file paths."""
+    from ai_journal_kit.cli.move import _nonempty_dir
+
+    empty = tmp_path / "empty"
+    empty.mkdir()
+    populated = tmp_path / "populated"
+    populated.mkdir()
+    (populated / "note.md").write_text("note")
+    a_file = tmp_path / "file.md"
+    a_file.write_text("file")
+
+    assert _nonempty_dir(populated) is True
+    assert _nonempty_dir(empty) is False
+    assert _nonempty_dir(tmp_path / "missing") is False
+    assert _nonempty_dir(a_file) is False
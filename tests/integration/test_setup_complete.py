@@ -251,6 +251,23 @@ def test_setup_creates_parent_directory(tmp_path, isolated_config):
     assert_journal_structure_valid(nested_path)
 
 
+@pytest.mark.integration
+def test_setup_new_directory_with_root_ide_files(tmp_path, isolated_config):
+    """Test IDE files written to the journal root don't race its creation."""
+    nested_path = tmp_path / "new" / "journal"
+
+    runner = CliRunner()
+
+    result = runner.invoke(
+        app,
+        ["setup", "--location", str(nested_path), "--ide", "claude-code", "--no-confirm"],
+    )
+
+    assert result.exit_code == 0, f"Setup failed: {result.output}"
+    assert_journal_structure_valid(nested_path)
+    assert_ide_config_installed(nested_path, "claude-code")
+
+
 @pytest.mark.integration
 def test_setup_dry_run_mode(temp_journal_dir, isolated_config):
     """Test setup dry-run mode shows actions without making changes."""
@@ -318,6 +335,31 @@ def test_setup_with_invalid_ide(temp_journal_dir, isolated_config):
     assert "ide" in result.output.lower() or "invalid" in result.output.lower()
 
 
+@pytest.mark.integration
+def test_setup_invalid_framework_rejected_before_creating_parent(tmp_path, isolated_config):
+    """Test a malformed --framework fails before any directory is created."""
+    nested_path = tmp_path / "missing" / "journal"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        [
+            "setup",
+            "--location",
+            str(nested_path),
+            "--ide",
+            "cursor",
+            "--framework",
+            "not-a-framework",
+            "--no-confirm",
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert "Invalid framework" in result.output
+    assert not nested_path.parent.exists()
+
+
 @pytest.mark.integration
 def test_setup_with_parent_creation_declined(temp_journal_dir, isolated_config):
     """Test setup when user declines parent directory creation (covers lines 74-81)."""
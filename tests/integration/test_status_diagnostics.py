@@ -124,6 +124,28 @@ def test_status_json_output(temp_journal_dir, isolated_config):
             pass
 
 
+@pytest.mark.integration
+def test_status_json_output_is_complete_document(temp_journal_dir, isolated_config):
+    """Test status --json writes one indented JSON document with health checks."""
+    create_journal_fixture(path=temp_journal_dir, ide="cursor", config_dir=isolated_config)
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["status", "--json"])
+
+    assert result.exit_code == 0
+    assert result.output.startswith("{\n  ")
+    assert result.output.endswith("}\n")
+    data = json.loads(result.output)
+    assert data["journal_location"] == str(temp_journal_dir)
+    assert data["ide"] == "cursor"
+    assert set(data["health"]) == {
+        "journal_exists",
+        "structure_valid",
+        "ide_configs",
+        "config_valid",
+    }
+
+
 @pytest.mark.integration
 def test_status_verbose_mode(temp_journal_dir, isolated_config):
     """Test status verbose mode shows detailed information."""
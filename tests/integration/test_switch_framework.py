@@ -190,6 +190,37 @@ def test_switch_framework_interactive_mode(temp_journal_dir, isolated_config):
     assert isinstance(result.exit_code, int)
 
 
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "args, hint",
+    [
+        (["switch-framework"], "Pass the framework"),
+        (["switch-framework", "gtd"], "--no-confirm"),
+    ],
+)
+def test_switch_framework_without_terminal_fails_before_prompting(
+    temp_journal_dir, isolated_config, args, hint
+):
+    """Test prompts are never started when stdin is not a terminal."""
+    from unittest.mock import patch
+
+    create_journal_fixture(
+        path=temp_journal_dir, ide="cursor", config_dir=isolated_config, framework="default"
+    )
+
+    runner = CliRunner()
+    with patch("ai_journal_kit.cli.switch_framework.questionary") as questionary:
+        with patch("ai_journal_kit.cli.switch_framework.ask_framework") as ask_framework:
+            result = runner.invoke(app, args)
+
+    assert result.exit_code == 1
+    assert "interactive terminal" in result.output
+    assert hint in result.output
+    ask_framework.assert_not_called()
+    assert questionary.mock_calls == []
+    assert load_config().framework == "default"
+
+
 @pytest.mark.integration
 def test_switch_framework_backs_up_all_templates(temp_journal_dir, isolated_config):
     """Test that all template files are backed up during switch."""
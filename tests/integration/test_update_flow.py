@@ -9,6 +9,8 @@ Tests update scenarios including:
 - Handling corrupted configs
 """
 
+import json
+
 import pytest
 from typer.testing import CliRunner
 
@@ -254,11 +256,39 @@ def test_update_detect_pip_handles_exceptions(temp_journal_dir, isolated_config)
 
     from ai_journal_kit.cli.update import detect_pip_command
 
-    # Mock subprocess.run to raise various exceptions
-    with patch("subprocess.run", side_effect=FileNotFoundError("pip not found")):
-        result = detect_pip_command()
-        # Should fall back to ["pip"]
-        assert result == ["pip"]
+    # Mock subprocess.run to raise various exceptions, with no importable pip
+    detect_pip_command.cache_clear()
+    try:
+        with patch("importlib.util.find_spec", return_value=None):
+            with patch("subprocess.run", side_effect=FileNotFoundError("pip not found")):
+                result = detect_pip_command()
+    finally:
+        detect_pip_command.cache_clear()
+
+    # Should fall back to ["pip"]
+    assert result == ["pip"]
+
+
+@pytest.mark.integration
+def test_update_detect_pip_prefers_running_interpreter():
+    """Test detect_pip_command uses this interpreter's pip without probing, once."""
+    import sys
+    from unittest.mock import patch
+
+    from ai_journal_kit.cli.update import detect_pip_command
+
+    detect_pip_command.cache_clear()
+    try:
+        with patch("importlib.util.find_spec", return_value=object()) as find_spec:
+            with patch("subprocess.run") as run:
+                first = detect_pip_command()
+                second = detect_pip_command()
+    finally:
+        detect_pip_command.cache_clear()
+
+    assert first == second == [sys.executable, "-m", "pip"]
+    run.assert_not_called()
+    find_spec.assert_called_once_with("pip")
 
 
 @pytest.mark.integration
@@ -483,7 +513,7 @@ def test_update_handles_ide_config_copy_failure(temp_journal_dir, isolated_confi
     with patch("ai_journal_kit.cli.update.get_latest_version", return_value="99.99.99"):
         with patch("subprocess.run"):  # Mock pip to succeed
             with patch(
-                "ai_journal_kit.cli.update.copy_ide_configs", side_effect=OSError("Mock error")
+                "ai_journal_kit.core.templates.copy_ide_configs", side_effect=OSError("Mock error")
             ):
                 runner = CliRunner()
                 result = runner.invoke(app, ["update", "--no-confirm"])
@@ -658,3 +688,180 @@ def test_update_current_less_than_latest_proceeds(temp_journal_dir, isolated_con
                 assert result.exit_code == 0
                 # Should show update process
                 assert "1.0.10" in result.output and "1.0.11" in result.output
+
+
+@pytest.mark.integration
+def test_update_fetches_versions_and_changelog_in_background(temp_journal_dir, isolated_config):
+    """Test the PyPI and changelog requests run off the main thread."""
+    import threading
+    from unittest.mock import patch
+
+    create_journal_fixture(path=temp_journal_dir, ide="cursor", config_dir=isolated_config)
+
+    request_threads = []
+
+    def fake_latest_version(refresh=False):
+        request_threads.append(threading.current_thread())
+        return "99.99.99"
+
+    def fake_changelog(from_version, to_version):
+        request_threads.append(threading.current_thread())
+        return "# Release notes marker"
+
+    with patch("ai_journal_kit.cli.update.get_latest_version", side_effect=fake_latest_version):
+        with patch("ai_journal_kit.cli.update.get_changelog", side_effect=fake_changelog):
+            runner = CliRunner()
+            result = runner.invoke(app, ["update", "--dry-run", "--templates"])
+
+    assert result.exit_code == 0
+    assert "Release notes marker" in result.output
+    assert len(request_threads) == 2
+    assert threading.main_thread() not in request_threads
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("compressed", [True, False])
+def test_fetch_json_reads_plain_and_gzip_responses(compressed):
+    """Test fetch_json asks for gzip and parses either kind of response."""
+    import gzip
+    import io
+    from unittest.mock import MagicMock, patch
+
+    from ai_journal_kit.cli.update import fetch_json
+
+    payload = b'{"info": {"version": "1.2.3"}}'
+    response = io.BytesIO(gzip.compress(payload) if compressed else payload)
+    response.headers = {"Content-Encoding": "gzip"} if compressed else {}
+    urlopen = MagicMock()
+    urlopen.return_value.__enter__.return_value = response
+
+    with patch("urllib.request.urlopen", urlopen):
+        data = fetch_json("https://example.invalid/pkg.json")
+
+    assert data == {"info": {"version": "1.2.3"}}
+    request = urlopen.call_args.args[0]
+    assert request.get_header("Accept-encoding") == "gzip"
+    assert request.get_header("User-agent").startswith("ai-journal-kit/")
+
+
+@pytest.mark.integration
+def test_fetch_json_reuses_one_ssl_context():
+    """Test every request is made with the same cached SSL context."""
+    import io
+    from unittest.mock import MagicMock, patch
+
+    from ai_journal_kit.cli.update import fetch_json
+
+    def respond(*args, **kwargs):
+        response = io.BytesIO(b"{}")
+        response.headers = {}
+        opened = MagicMock()
+        opened.__enter__.return_value = response
+        return opened
+
+    with patch("urllib.request.urlopen", side_effect=respond) as urlopen:
+        fetch_json("https://example.invalid/a.json")
+        fetch_json("https://example.invalid/b.json")
+
+    first, second = (call.kwargs["context"] for call in urlopen.call_args_list)
+    assert first is second
+
+
+@pytest.mark.integration
+def test_update_pip_upgrade_keeps_only_stderr(temp_journal_dir, isolated_config):
+    """Test the pip upgrade discards stdout and captures stderr for errors."""
+    import subprocess
+    from unittest.mock import patch
+
+    create_journal_fixture(path=temp_journal_dir, ide="cursor", config_dir=isolated_config)
+
+    with patch("ai_journal_kit.cli.update.get_latest_version", return_value="99.99.99"):
+        with patch("subprocess.run") as run:
+            runner = CliRunner()
+            result = runner.invoke(app, ["update", "--no-confirm"])
+
+    assert result.exit_code == 0
+    upgrade_calls = [c for c in run.call_args_list if "--upgrade" in c.args[0]]
+    assert len(upgrade_calls) == 1
+    assert upgrade_calls[0].kwargs["stdout"] == subprocess.DEVNULL
+    assert upgrade_calls[0].kwargs["stderr"] == subprocess.PIPE
+
+
+@pytest.mark.integration
+def test_get_latest_version_uses_fresh_cache(isolated_cache_dir):
+    """Test a recent PyPI answer is reused without a network request."""
+    import time
+    from unittest.mock import patch
+
+    from ai_journal_kit.cli.update import get_latest_version, get_version_cache_path
+
+    with patch(
+        "ai_journal_kit.cli.update.fetch_json", return_value={"info": {"version": "2.0.0"}}
+    ) as fetch:
+        assert get_latest_version() == "2.0.0"
+        assert get_latest_version() == "2.0.0"
+
+    fetch.assert_called_once()
+    cache_path = get_version_cache_path()
+    assert cache_path.parent == isolated_cache_dir
+    assert json.loads(cache_path.read_text())["checked_at"] <= time.time()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("stale, refresh", [(True, False), (False, True)])
+def test_get_latest_version_refetches_stale_or_refreshed(stale, refresh):
+    """Test an expired cache entry, or refresh=True, asks PyPI again."""
+    import time
+    from unittest.mock import patch
+
+    from ai_journal_kit.cli.update import (
+        VERSION_CACHE_TTL,
+        get_latest_version,
+        get_version_cache_path,
+    )
+
+    cache_path = get_version_cache_path()
+    cache_path.parent.mkdir(parents=True)
+    checked_at = time.time() - (VERSION_CACHE_TTL + 1 if stale else 0)
+    cache_path.write_text(json.dumps({"version": "1.0.0", "checked_at": checked_at}))
+
+    with patch("ai_journal_kit.cli.update.fetch_json", return_value={"info": {"version": "2.0.0"}}):
+        assert get_latest_version(refresh=refresh) == "2.0.0"
+
+    assert json.loads(cache_path.read_text())["version"] == "2.0.0"
+
+
+@pytest.mark.integration
+def test_update_refresh_flag_bypasses_version_cache(temp_journal_dir, isolated_config):
+    """Test update --refresh asks for an uncached PyPI answer."""
+    from unittest.mock import patch
+
+    create_journal_fixture(path=temp_journal_dir, ide="cursor", config_dir=isolated_config)
+
+    with patch("ai_journal_kit.cli.update.get_latest_version", return_value=None) as latest:
+        runner = CliRunner()
+        result = runner.invoke(app, ["update", "--check", "--refresh"])
+
+    assert result.exit_code == 0
+    latest.assert_called_once_with(refresh=True)
+
+
+@pytest.mark.integration
+def test_update_pip_upgrade_timeout_reports_error(temp_journal_dir, isolated_config):
+    """Test a hung pip upgrade is cut off and reported instead of freezing the CLI."""
+    import subprocess
+    from unittest.mock import patch
+
+    from ai_journal_kit.cli.update import UPGRADE_TIMEOUT
+
+    create_journal_fixture(path=temp_journal_dir, ide="cursor", config_dir=isolated_config)
+
+    timeout = subprocess.TimeoutExpired(cmd="pip", timeout=UPGRADE_TIMEOUT)
+    with patch("ai_journal_kit.cli.update.get_latest_version", return_value="99.99.99"):
+        with patch("subprocess.run", side_effect=timeout) as run:
+            runner = CliRunner()
+            result = runner.invoke(app, ["update", "--no-confirm"])
+
+    assert result.exit_code == 1
+    assert "did not finish" in result.output
+    assert run.call_args.kwargs["timeout"] == UPGRADE_TIMEOUT
@@ -0,0 +1,127 @@
+"""
+Startup import regression tests.
+
+Runs the CLI's entry imports in a fresh interpreter under ``-X importtime``
+so lazy-loading regressions show up as test failures.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative import budget for the CLI app, in microseconds
+APP_IMPORT_BUDGET_US = 400_000
+
+# Modules that only specific commands need; importing the app must not load them
+DEFERRED_MODULES = [
+    "rich.table",
+    "rich.progress",
+    "questionary",
+    "pydantic",
+    "ai_journal_kit.core.config",
+]
+
+# Command module -> modules it must only import once the command runs, so
+# listing commands in `--help` stays cheap
+COMMAND_DEFERRED_MODULES = {
+    "ai_journal_kit.cli.search": [
+        "ai_journal_kit.core.config",
+        "ai_journal_kit.core.search_engine",
+        "sqlite3",
+    ],
+    "ai_journal_kit.cli.setup": [
+        "ai_journal_kit.core.config",
+        "ai_journal_kit.core.journal",
+        "rich.progress",
+    ],
+    "ai_journal_kit.cli.status": [
+        "ai_journal_kit.core.config",
+        "ai_journal_kit.core.migration",
+    ],
+    "ai_journal_kit.cli.switch_framework": [
+        "ai_journal_kit.core.config",
+        "ai_journal_kit.core.migration",
+    ],
+    "ai_journal_kit.cli.use_journal": [
+        "ai_journal_kit.core.config",
+        "pydantic",
+    ],
+    "ai_journal_kit.cli.update": [
+        "ai_journal_kit.core.config",
+        "ai_journal_kit.core.migration",
+        "packaging.version",
+        "rich.progress",
+    ],
+}
+
+
+def import_times(code: str) -> dict[str, int]:
+    """Run code in a fresh interpreter and return each module's cumulative import time.
+
+    Args:
+        code: Python source to run with -X importtime
+
+    Returns:
+        Dictionary of module name: cumulative microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+    )
+    assert result.returncode == 0, result.stderr
+
+    # Lines look like: "import time:       671 |       3416 |   ai_journal_kit.cli"
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, module = line.split(":", 1)[1].split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.perf
+def test_app_import_defers_command_dependencies():
+    """Test importing the CLI app leaves command-only dependencies unloaded."""
+    times = import_times("import ai_journal_kit.cli.app")
+
+    loaded = [module for module in DEFERRED_MODULES if module in times]
+    assert loaded == []
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("command_module", COMMAND_DEFERRED_MODULES)
+def test_command_import_defers_run_dependencies(command_module):
+    """Test importing a command module leaves run-time-only dependencies unloaded."""
+    times = import_times(f"import {command_module}")
+
+    loaded = [module for module in COMMAND_DEFERRED_MODULES[command_module] if module in times]
+    assert loaded == []
+
+
+@pytest.mark.perf
+def test_app_import_within_budget():
+    """Test the CLI app imports within its startup budget."""
+    times = import_times("import ai_journal_kit.cli.app")
+
+    assert times["ai_journal_kit.cli.app"] < APP_IMPORT_BUDGET_US
+
+
+@pytest.mark.perf
+def test_version_fast_path_skips_typer():
+    """Test `--version` is answered without importing Typer or the app."""
+    times = import_times(
+        "import sys\n"
+        "sys.argv = ['ai-journal-kit', '--version']\n"
+        "from ai_journal_kit.__main__ import main\n"
+        "main()\n"
+    )
+
+    assert "typer" not in times
+    assert "ai_journal_kit.cli.app" not in times
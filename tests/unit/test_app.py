@@ -1,6 +1,7 @@
 """Unit tests for CLI app and version command."""
 
 import pytest
+import typer
 from typer.testing import CliRunner
 
 from ai_journal_kit import __version__
@@ -50,3 +51,55 @@ def test_app_has_all_commands():
     assert "doctor" in output_lower
     assert "update" in output_lower
     assert "move" in output_lower
+
+
+@pytest.mark.unit
+def test_app_imports_commands_lazily():
+    """Test importing the app does not import any command module."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "import ai_journal_kit.cli.app\n"
+        "print(sorted(m for m in sys.modules if m.startswith('ai_journal_kit.cli.')))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    assert result.returncode == 0
+    assert result.stdout.strip() == "['ai_journal_kit.cli.app']"
+
+
+@pytest.mark.unit
+def test_unknown_command_fails():
+    """Test unknown commands are rejected without importing anything."""
+    runner = CliRunner()
+    result = runner.invoke(app, ["not-a-command"])
+
+    assert result.exit_code != 0
+
+
+@pytest.mark.unit
+def test_app_registers_exact_command_set():
+    """Test the app exposes exactly the expected commands and each one resolves."""
+    from ai_journal_kit.cli.app import COMMANDS
+
+    expected = [
+        "setup",
+        "use",
+        "list",
+        "search",
+        "add-ide",
+        "switch-framework",
+        "customize-template",
+        "status",
+        "doctor",
+        "update",
+        "move",
+    ]
+    assert list(COMMANDS) == expected
+
+    group = typer.main.get_command(app)
+    assert group.list_commands(None) == expected
+    for name in expected:
+        assert group.get_command(None, name).name == name
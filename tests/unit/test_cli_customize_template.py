@@ -196,5 +196,5 @@ def test_customize_template_calls_ensure_manifest():
                     with pytest.raises(typer.Exit):
                         customize_template("daily-template.md")
 
-    # Should have called ensure_manifest_exists
-    mock_ensure.assert_called_once()
+    # Should have called ensure_manifest_exists with the config it already loaded
+    mock_ensure.assert_called_once_with(mock_config)
@@ -167,3 +167,36 @@ def test_list_journals_inactive_journal():
         with patch("ai_journal_kit.cli.list_journals.get_active_journal_name", return_value="work"):
             with patch("ai_journal_kit.cli.list_journals.console"):
                 list_journals(json_output=False)
+
+
+@pytest.mark.unit
+def test_list_journals_single_journal_skips_table():
+    """Test a single journal is printed as one line rather than a table."""
+    from datetime import datetime
+    from pathlib import Path
+
+    mock_profile = MagicMock()
+    mock_profile.location = Path("/test/journal")
+    mock_profile.framework = "gtd"
+    mock_profile.ide = "cursor"
+    mock_profile.created_at = datetime.now()
+    mock_profile.last_updated = datetime.now()
+
+    mock_multi_config = MagicMock()
+    mock_multi_config.journals = {"default": mock_profile}
+
+    with patch(
+        "ai_journal_kit.cli.list_journals.load_multi_journal_config", return_value=mock_multi_config
+    ):
+        with patch(
+            "ai_journal_kit.cli.list_journals.get_active_journal_name", return_value="default"
+        ):
+            with patch("ai_journal_kit.cli.list_journals.console") as mock_console:
+                with patch("rich.table.Table") as mock_table:
+                    list_journals(json_output=False)
+
+    mock_table.assert_not_called()
+    printed = " ".join(str(call.args[0]) for call in mock_console.print.call_args_list if call.args)
+    assert "default" in printed
+    assert str(Path("/test/journal")) in printed
+    assert "✓ Active" in printed
@@ -14,9 +14,11 @@ from rich.console import Console
 from typer.testing import CliRunner
 
 from ai_journal_kit.cli.search import (
+    _get_engine,
     display_search_header,
     format_search_results,
     parse_entry_types,
+    stream_search_results,
     validate_date_range,
 )
 from ai_journal_kit.core.search_result import (
@@ -83,6 +85,96 @@ class TestSearchCommand:
         # Should not raise error
         display_search_header(query, 5, 125.5)
 
+    def test_display_search_header_single_write(self, monkeypatch):
+        """Test the header, filters and count are printed in one call."""
+        recorder = Console(record=True, width=120)
+        calls = []
+        monkeypatch.setattr(
+            "ai_journal_kit.cli.search.console.print",
+            lambda *args, **kwargs: calls.append(args) or recorder.print(*args, **kwargs),
+        )
+        query = SearchQuery(search_text="anxiety", entry_types=[EntryType.DAILY], limit=3)
+
+        display_search_header(query, 2, 10.0)
+
+        assert len(calls) == 1
+        assert recorder.export_text().splitlines() == [
+            "",
+            "🔍 Search: anxiety",
+            "Filters: Types: Daily | Limit: 3",
+            "Found 2 results (10ms)",
+            "",
+        ]
+
+    def test_stream_search_results_counts_results(self):
+        """Test streamed results are displayed in batches and counted."""
+        results = (
+            SearchResult(
+                file_path=Path(f"daily/2024-11-{day:02d}.md"),
+                entry_type=EntryType.DAILY,
+                entry_date=date(2024, 11, day),
+                line_number=1,
+                matched_line=f"Match {day}",
+            )
+            for day in range(1, 6)
+        )
+
+        console = Console(record=True, width=120)
+        count = stream_search_results(results, console, batch_size=2)
+
+        assert count == 5
+        output = console.export_text()
+        assert output.index("Match 1") < output.index("Match 5")
+        assert "No results found" not in output
+
+    def test_stream_search_results_empty(self):
+        """Test streaming no results shows the empty message."""
+        console = Console(record=True)
+
+        assert stream_search_results(iter([]), console) == 0
+        assert "No results found" in console.export_text()
+
+    @pytest.mark.parametrize(
+        "args, message",
+        [
+            (["--type", "bogus"], "Invalid entry type"),
+            (["--after", "yesterday"], "Invalid --after date"),
+            (["--after", "2024-12-01", "--before", "2024-11-01"], "date"),
+        ],
+    )
+    def test_invalid_arguments_fail_before_loading_config(self, monkeypatch, args, message):
+        """Test malformed arguments are rejected without reading the config."""
+        from ai_journal_kit.cli.app import app
+
+        def fail():
+            raise AssertionError("config loaded")
+
+        monkeypatch.setattr("ai_journal_kit.core.config.load_config", fail)
+
+        result = runner.invoke(app, ["search", "anxiety", *args])
+
+        assert result.exit_code == 1
+        assert message in result.output
+        assert "config loaded" not in result.output
+
+    def test_get_engine_reuses_engine_per_journal(self, tmp_path):
+        """Test repeated searches of a journal share one engine that sees new files."""
+        _get_engine.cache_clear()
+        (tmp_path / "daily").mkdir()
+        (tmp_path / "daily" / "2024-11-01.md").write_text("first entry")
+
+        engine = _get_engine(str(tmp_path))
+        assert len(engine.search(SearchQuery(search_text="entry")).results) == 1
+
+        (tmp_path / "daily" / "2024-11-02.md").write_text("second entry")
+        (tmp_path / "projects").mkdir()
+        (tmp_path / "projects" / "launch.md").write_text("project entry")
+
+        assert _get_engine(str(tmp_path)) is engine
+        assert len(engine.search(SearchQuery(search_text="entry")).results) == 3
+        assert _get_engine.cache_info().misses == 1
+        _get_engine.cache_clear()
+
 
 class TestParseEntryTypes:
     """Tests for parse_entry_types function."""
@@ -121,6 +213,8 @@ class TestParseEntryTypes:
 
         error_msg = str(exc_info.value)
         assert "invalid" in error_msg.lower()
+        assert error_msg.count("Invalid entry type") == 1
+        assert "Valid types: daily, project, people, memory" in error_msg
 
     def test_parse_empty_string_raises_error(self):
         """Test empty string raises error."""
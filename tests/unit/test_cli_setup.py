@@ -220,6 +220,16 @@ def test_detect_existing_journal_with_copilot_ide(tmp_path):
     assert detected["ide_copilot"] is True
 
 
+@pytest.mark.unit
+def test_detect_existing_journal_github_without_instructions(tmp_path):
+    """Test a .github folder alone isn't taken for a Copilot config."""
+    (tmp_path / ".github" / "workflows").mkdir(parents=True)
+
+    detected = _detect_existing_journal(tmp_path)
+
+    assert "ide_copilot" not in detected
+
+
 @pytest.mark.unit
 def test_detect_existing_journal_with_templates(tmp_path):
     """Test _detect_existing_journal detects template files."""
@@ -543,3 +553,16 @@ def test_handle_existing_journal_formats_ide_names_correctly(mock_show_panel, tm
 
     assert "claude code" in message  # Should replace underscores with spaces
     assert result["detected_ide"] == "claude-code"
+
+
+@pytest.mark.unit
+@patch("ai_journal_kit.cli.setup.show_panel")
+def test_handle_existing_journal_prefers_ides_in_priority_order(mock_show_panel, tmp_path):
+    """Test the first IDE in priority order wins when several are detected."""
+    detected = {"ide_copilot": True, "ide_windsurf": True}
+
+    result = _handle_existing_journal(
+        tmp_path, detected, no_confirm=True, location=str(tmp_path), name="test"
+    )
+
+    assert result["detected_ide"] == "windsurf"
@@ -147,6 +147,9 @@ def test_update_config(isolated_config_dir, monkeypatch):
     assert loaded.ide == "windsurf"
     assert loaded.use_symlink is True
 
+    # One timestamp for both the returned and the saved config
+    assert loaded.last_updated == updated.last_updated
+
 
 @pytest.mark.unit
 def test_update_config_raises_when_no_config(isolated_config_dir, monkeypatch):
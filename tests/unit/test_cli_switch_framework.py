@@ -16,6 +16,7 @@ import typer
 
 from ai_journal_kit.cli.switch_framework import (
     ask_customization_resolution,
+    backup_timestamp,
     execute_framework_switch,
     show_interactive_checklist,
     switch_framework,
@@ -26,7 +27,7 @@ from ai_journal_kit.core.manifest import Manifest
 @pytest.mark.unit
 def test_switch_framework_not_set_up():
     """Test switch-framework fails when journal not set up."""
-    with patch("ai_journal_kit.cli.switch_framework.load_config", return_value=None):
+    with patch("ai_journal_kit.core.config.load_config", return_value=None):
         with patch("ai_journal_kit.cli.switch_framework.show_error"):
             with pytest.raises(typer.Exit) as exc_info:
                 switch_framework("gtd")
@@ -34,6 +35,23 @@ def test_switch_framework_not_set_up():
     assert exc_info.value.exit_code == 1
 
 
+@pytest.mark.unit
+def test_switch_framework_missing_journal(tmp_path):
+    """Test switch-framework reports a missing journal directory instead of crashing."""
+    mock_config = MagicMock()
+    mock_config.journal_location = tmp_path / "missing"
+    mock_config.framework = "default"
+
+    with patch("ai_journal_kit.core.config.load_config", return_value=mock_config):
+        with patch("ai_journal_kit.cli.switch_framework.show_error") as mock_error:
+            with pytest.raises(typer.Exit) as exc_info:
+                switch_framework("gtd", no_confirm=True)
+
+    assert exc_info.value.exit_code == 1
+    assert "does not exist" in mock_error.call_args.args[0]
+    assert not (tmp_path / "missing").exists()
+
+
 @pytest.mark.unit
 def test_switch_framework_same_framework(temp_journal_dir):
     """Test switch-framework handles switching to same framework."""
@@ -42,8 +60,8 @@ def test_switch_framework_same_framework(temp_journal_dir):
     mock_config.journal_location = temp_journal_dir
     mock_config.framework = "gtd"
 
-    with patch("ai_journal_kit.cli.switch_framework.load_config", return_value=mock_config):
-        with patch("ai_journal_kit.cli.switch_framework.ensure_manifest_exists"):
+    with patch("ai_journal_kit.core.config.load_config", return_value=mock_config):
+        with patch("ai_journal_kit.core.migration.ensure_manifest_exists"):
             with patch("ai_journal_kit.cli.switch_framework.console"):
                 with pytest.raises(typer.Exit) as exc_info:
                     switch_framework("gtd", no_confirm=True)
@@ -58,8 +76,8 @@ def test_switch_framework_invalid_framework(temp_journal_dir):
     mock_config.journal_location = temp_journal_dir
     mock_config.framework = "default"
 
-    with patch("ai_journal_kit.cli.switch_framework.load_config", return_value=mock_config):
-        with patch("ai_journal_kit.cli.switch_framework.ensure_manifest_exists"):
+    with patch("ai_journal_kit.core.config.load_config", return_value=mock_config):
+        with patch("ai_journal_kit.core.migration.ensure_manifest_exists"):
             with patch("ai_journal_kit.cli.switch_framework.show_error"):
                 with pytest.raises(typer.Exit) as exc_info:
                     switch_framework("invalid-framework", no_confirm=True)
@@ -67,6 +85,18 @@ def test_switch_framework_invalid_framework(temp_journal_dir):
     assert exc_info.value.exit_code == 1
 
 
+@pytest.mark.unit
+def test_backup_timestamp_format():
+    """Test backup timestamps are local time plus a nanosecond suffix."""
+    import time
+
+    ns = 1_700_000_000_000_000_042
+    expected = time.strftime("%Y%m%d-%H%M%S", time.localtime(1_700_000_000))
+
+    assert backup_timestamp(ns) == f"{expected}-000000042"
+    assert backup_timestamp(ns + 1) != backup_timestamp(ns)
+
+
 @pytest.mark.unit
 def test_show_interactive_checklist_no_customizations(capsys):
     """Test show_interactive_checklist with no customizations."""
@@ -107,6 +137,22 @@ def test_show_interactive_checklist_with_customizations(capsys):
     assert "choose what to do" in output.lower() or "detected" in output.lower()
 
 
+@pytest.mark.unit
+def test_show_interactive_checklist_prints_once():
+    """Test the checklist is laid out as one markup string in a single print."""
+    with patch("ai_journal_kit.cli.switch_framework.console") as mock_console:
+        show_interactive_checklist(framework="gtd", framework_name="GTD", customized_count=2)
+
+    mock_console.print.assert_called_once()
+    lines = mock_console.print.call_args.args[0].splitlines()
+    assert "  [green]✓[/green]    Templates will be replaced with GTD templates" in lines
+    assert (
+        "  [green]✓[/green]    2 customized template(s) detected - you'll choose what to do"
+        in lines
+    )
+    assert "  [red]✗[/red]    Your existing notes will NOT be modified" in lines
+
+
 @pytest.mark.unit
 def test_ask_customization_resolution_move(monkeypatch):
     """Test ask_customization_resolution returns 'move' action."""
@@ -123,6 +169,27 @@ def test_ask_customization_resolution_move(monkeypatch):
     assert result == "move"
 
 
+@pytest.mark.unit
+def test_ask_customization_resolution_prints_in_two_writes():
+    """Test the template list and the options menu are each printed in one call."""
+    test_templates = [Path(f"/test/{name}-template.md") for name in ("daily", "project", "people")]
+
+    mock_select = MagicMock()
+    mock_select.ask.return_value = "move"
+
+    with patch("ai_journal_kit.cli.switch_framework.questionary.select", return_value=mock_select):
+        with patch("ai_journal_kit.cli.switch_framework.console") as mock_console:
+            ask_customization_resolution(test_templates, "GTD")
+
+    assert mock_console.print.call_count == 2
+    template_list = mock_console.print.call_args_list[0].args[0]
+    assert template_list.splitlines()[1:] == [
+        "  • daily-template.md",
+        "  • project-template.md",
+        "  • people-template.md",
+    ]
+
+
 @pytest.mark.unit
 def test_ask_customization_resolution_replace(monkeypatch):
     """Test ask_customization_resolution returns 'replace' action."""
@@ -169,7 +236,7 @@ def test_execute_framework_switch_replace_action(tmp_path):
     manifest = Manifest()
     manifest.add_file(old_template, source="framework:default")
 
-    with patch("ai_journal_kit.cli.switch_framework.copy_framework_templates"):
+    with patch("ai_journal_kit.core.journal.copy_framework_templates"):
         with patch("ai_journal_kit.cli.switch_framework.console"):
             execute_framework_switch(
                 journal_path=journal_path,
@@ -183,6 +250,72 @@ def test_execute_framework_switch_replace_action(tmp_path):
     # Old template should be backed up
     backup_file = backup_dir / "daily-template.md"
     assert backup_file.exists()
+    assert backup_file.read_bytes() == b"# Old Daily Template"
+    assert backup_file.stat().st_mtime_ns == old_template.stat().st_mtime_ns
+
+
+@pytest.mark.unit
+def test_execute_framework_switch_uses_listed_templates(tmp_path):
+    """Test execute_framework_switch backs up the templates it's given without rescanning."""
+    journal_path = tmp_path / "journal"
+    journal_path.mkdir()
+    daily_template = journal_path / "daily-template.md"
+    daily_template.write_text("# Daily")
+    (journal_path / "project-template.md").write_text("# Project")
+
+    backup_dir = tmp_path / "backup"
+    backup_dir.mkdir()
+
+    with patch("ai_journal_kit.core.journal.copy_framework_templates"):
+        with patch("ai_journal_kit.cli.switch_framework.console"):
+            execute_framework_switch(
+                journal_path=journal_path,
+                framework="gtd",
+                action="replace",
+                customized_templates=[],
+                backup_dir=backup_dir,
+                manifest=Manifest(),
+                all_templates=[daily_template],
+            )
+
+    assert [p.name for p in backup_dir.iterdir()] == ["daily-template.md"]
+
+
+@pytest.mark.unit
+def test_execute_framework_switch_tracks_installed_templates(tmp_path):
+    """Test the manifest records the templates copy_framework_templates installed."""
+    journal_path = tmp_path / "journal"
+    journal_path.mkdir()
+    leftover = journal_path / "someday-maybe-template.md"
+    leftover.write_text("# Someday")
+
+    backup_dir = tmp_path / "backup"
+    backup_dir.mkdir()
+
+    manifest = Manifest()
+    manifest.add_file(leftover, source="framework:gtd", relative_to=journal_path)
+
+    with patch("ai_journal_kit.cli.switch_framework.console"):
+        with patch("ai_journal_kit.core.manifest.find_templates", return_value=[leftover]) as find:
+            execute_framework_switch(
+                journal_path=journal_path,
+                framework="para",
+                action="replace",
+                customized_templates=[],
+                backup_dir=backup_dir,
+                manifest=manifest,
+            )
+
+    # Only the initial listing; the installed templates come back from the copy
+    find.assert_called_once_with(journal_path)
+    installed = {name for name, entry in manifest.files.items() if entry.source == "framework:para"}
+    assert installed == {
+        "area-template.md",
+        "daily-template.md",
+        "project-template.md",
+        "resource-template.md",
+    }
+    assert manifest.files["someday-maybe-template.md"].source == "framework:gtd"
 
 
 @pytest.mark.unit
@@ -201,7 +334,7 @@ def test_execute_framework_switch_move_action(tmp_path):
     manifest = Manifest()
     manifest.add_file(custom_template, source="framework:default")
 
-    with patch("ai_journal_kit.cli.switch_framework.copy_framework_templates"):
+    with patch("ai_journal_kit.core.journal.copy_framework_templates"):
         with patch("ai_journal_kit.cli.switch_framework.console"):
             execute_framework_switch(
                 journal_path=journal_path,
@@ -229,7 +362,7 @@ def test_execute_framework_switch_no_templates(tmp_path):
 
     manifest = Manifest()
 
-    with patch("ai_journal_kit.cli.switch_framework.copy_framework_templates"):
+    with patch("ai_journal_kit.core.journal.copy_framework_templates"):
         with patch("ai_journal_kit.cli.switch_framework.console"):
             execute_framework_switch(
                 journal_path=journal_path,
@@ -19,7 +19,7 @@ from ai_journal_kit.cli.use_journal import use_journal
 @pytest.mark.unit
 def test_use_journal_no_config():
     """Test use command when no journals configured (lines 29-30)."""
-    with patch("ai_journal_kit.cli.use_journal.load_multi_journal_config", return_value=None):
+    with patch("ai_journal_kit.core.config.load_multi_journal_config", return_value=None):
         with patch("ai_journal_kit.cli.use_journal.show_error") as mock_error:
             with pytest.raises(typer.Exit) as exc_info:
                 use_journal("test")
@@ -36,7 +36,7 @@ def test_use_journal_not_found():
     mock_multi_config.journals = {"work": MagicMock(), "personal": MagicMock()}
 
     with patch(
-        "ai_journal_kit.cli.use_journal.load_multi_journal_config", return_value=mock_multi_config
+        "ai_journal_kit.core.config.load_multi_journal_config", return_value=mock_multi_config
     ):
         with patch("ai_journal_kit.cli.use_journal.show_error") as mock_error:
             with pytest.raises(typer.Exit) as exc_info:
@@ -62,9 +62,9 @@ def test_use_journal_success():
     mock_multi_config.journals = {"work": mock_profile}
 
     with patch(
-        "ai_journal_kit.cli.use_journal.load_multi_journal_config", return_value=mock_multi_config
+        "ai_journal_kit.core.config.load_multi_journal_config", return_value=mock_multi_config
     ):
-        with patch("ai_journal_kit.cli.use_journal.save_multi_journal_config") as mock_save:
+        with patch("ai_journal_kit.core.config.save_multi_journal_config") as mock_save:
             with patch("ai_journal_kit.cli.use_journal.show_success") as mock_success:
                 with patch("ai_journal_kit.cli.use_journal.console"):
                     use_journal("work")
@@ -88,9 +88,9 @@ def test_use_journal_displays_info():
     mock_multi_config.journals = {"personal": mock_profile}
 
     with patch(
-        "ai_journal_kit.cli.use_journal.load_multi_journal_config", return_value=mock_multi_config
+        "ai_journal_kit.core.config.load_multi_journal_config", return_value=mock_multi_config
     ):
-        with patch("ai_journal_kit.cli.use_journal.save_multi_journal_config"):
+        with patch("ai_journal_kit.core.config.save_multi_journal_config"):
             with patch("ai_journal_kit.cli.use_journal.show_success"):
                 with patch("ai_journal_kit.cli.use_journal.console"):
                     use_journal("personal")
@@ -117,9 +117,9 @@ def test_use_journal_multiple_available():
     mock_multi_config.journals = {"work": mock_profile1, "personal": mock_profile2}
 
     with patch(
-        "ai_journal_kit.cli.use_journal.load_multi_journal_config", return_value=mock_multi_config
+        "ai_journal_kit.core.config.load_multi_journal_config", return_value=mock_multi_config
     ):
-        with patch("ai_journal_kit.cli.use_journal.save_multi_journal_config"):
+        with patch("ai_journal_kit.core.config.save_multi_journal_config"):
             with patch("ai_journal_kit.cli.use_journal.show_success"):
                 with patch("ai_journal_kit.cli.use_journal.console"):
                     use_journal("work")
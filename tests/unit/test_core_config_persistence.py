@@ -29,6 +29,17 @@ def test_get_config_path_uses_platformdirs():
     assert "ai-journal-kit" in str(config_path)
 
 
+@pytest.mark.unit
+def test_get_config_path_follows_config_dir_override(tmp_path, monkeypatch):
+    """Test a cached config path still follows AI_JOURNAL_CONFIG_DIR changes."""
+    monkeypatch.setenv("AI_JOURNAL_CONFIG_DIR", str(tmp_path / "first"))
+    assert get_config_path() == tmp_path / "first" / "config.json"
+
+    monkeypatch.setenv("AI_JOURNAL_CONFIG_DIR", str(tmp_path / "second"))
+    assert get_config_path() == tmp_path / "second" / "config.json"
+    assert (tmp_path / "second").is_dir()
+
+
 @pytest.mark.unit
 def test_save_and_load_multi_journal_config_roundtrip(tmp_path, monkeypatch):
     """Test saving and loading multi-journal config preserves all data."""
@@ -201,6 +212,42 @@ def test_load_config_parses_datetime_strings(tmp_path, monkeypatch):
     assert profile.last_updated == datetime(2025, 1, 2, 14, 20, 30)
 
 
+@pytest.mark.unit
+def test_load_config_names_profiles_from_keys(tmp_path, monkeypatch):
+    """Test profiles saved without a name take it from their key."""
+    config_path = tmp_path / "config.json"
+    monkeypatch.setattr("ai_journal_kit.core.config.get_config_path", lambda: config_path)
+
+    import json
+
+    data = {
+        "active_journal": "work",
+        "journals": {"work": {"location": "/test/journal", "ide": "cursor"}},
+    }
+    config_path.write_text(json.dumps(data))
+
+    config = load_multi_journal_config()
+
+    assert config is not None
+    assert config.journals["work"].name == "work"
+
+
+@pytest.mark.unit
+def test_save_config_omits_unset_symlink_source(tmp_path, monkeypatch):
+    """Test symlink_source is only written when set."""
+    config_path = tmp_path / "config.json"
+    monkeypatch.setattr("ai_journal_kit.core.config.get_config_path", lambda: config_path)
+
+    profile = JournalProfile(name="test", location=Path("/test/journal"), ide="cursor")
+    save_multi_journal_config(MultiJournalConfig(active_journal="test", journals={"test": profile}))
+
+    import json
+
+    saved = json.loads(config_path.read_text())["journals"]["test"]
+    assert "symlink_source" not in saved
+    assert saved["location"] == str(profile.location)
+
+
 @pytest.mark.unit
 def test_config_persists_across_multiple_operations(tmp_path, monkeypatch):
     """Test config survives multiple save/load cycles."""
@@ -281,3 +328,69 @@ def test_config_path_expansion(tmp_path, monkeypatch):
     # Path should be absolute, not contain ~
     assert profile.location.is_absolute()
     assert "~" not in str(profile.location)
+
+
+@pytest.mark.unit
+def test_load_config_reuses_parsed_config(tmp_path, monkeypatch):
+    """Test repeated loads skip re-reading an unchanged config file."""
+    config_path = tmp_path / "config.json"
+    monkeypatch.setattr("ai_journal_kit.core.config.get_config_path", lambda: config_path)
+
+    profile = JournalProfile(name="test", location=tmp_path / "journal", ide="cursor")
+    save_multi_journal_config(MultiJournalConfig(active_journal="test", journals={"test": profile}))
+
+    first = load_multi_journal_config()
+    with monkeypatch.context() as m:
+        m.setattr(Path, "read_text", lambda self: pytest.fail("config re-read"))
+        second = load_multi_journal_config()
+
+    assert second == first
+    # Callers get their own copy to mutate
+    assert second is not first
+    second.journals["test"].ide = "windsurf"
+    assert load_multi_journal_config().journals["test"].ide == "cursor"
+
+
+@pytest.mark.unit
+def test_load_config_sees_external_changes(tmp_path, monkeypatch):
+    """Test a config file changed on disk is re-read rather than served from cache."""
+    import json
+    import os
+
+    config_path = tmp_path / "config.json"
+    monkeypatch.setattr("ai_journal_kit.core.config.get_config_path", lambda: config_path)
+
+    profile = JournalProfile(name="test", location=tmp_path / "journal", ide="cursor")
+    save_multi_journal_config(MultiJournalConfig(active_journal="test", journals={"test": profile}))
+    assert load_multi_journal_config().journals["test"].ide == "cursor"
+
+    data = json.loads(config_path.read_text())
+    data["journals"]["test"]["ide"] = "copilot"
+    config_path.write_text(json.dumps(data))
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_multi_journal_config().journals["test"].ide == "copilot"
+
+
+@pytest.mark.unit
+def test_load_config_keeps_saved_locations_unresolved(tmp_path, monkeypatch):
+    """Test saved locations are made absolute without resolving symlinks again."""
+    config_path = tmp_path / "config.json"
+    monkeypatch.setattr("ai_journal_kit.core.config.get_config_path", lambda: config_path)
+
+    target = tmp_path / "real-journal"
+    target.mkdir()
+    link = tmp_path / "journal-link"
+    link.symlink_to(target)
+
+    import json
+
+    data = {"journals": {"test": {"location": str(link), "ide": "cursor"}}}
+    config_path.write_text(json.dumps(data))
+
+    config = load_multi_journal_config()
+
+    assert config.journals["test"].location == link
+    # New profiles are still resolved
+    assert JournalProfile(name="new", location=link, ide="cursor").location == target
@@ -12,6 +12,7 @@ from pathlib import Path
 import pytest
 
 from ai_journal_kit.core.date_utils import (
+    _parse_date_cached,
     extract_date_from_filename,
     parse_date,
     parse_relative_date,
@@ -60,6 +61,19 @@ class TestParseDate:
         with pytest.raises(ValueError):
             parse_date("2024-02-30")  # Invalid day
 
+    @pytest.mark.parametrize("date_str", ["20241001", "2024-W40-2", "2024-10-01T00:00"])
+    def test_parse_rejects_other_iso_forms(self, date_str):
+        """Test only YYYY-MM-DD is accepted, not every form fromisoformat takes."""
+        with pytest.raises(ValueError, match="Invalid date format"):
+            parse_date(date_str)
+
+    def test_relative_dates_cached_per_day(self):
+        """Test cached relative dates follow the day they were parsed on."""
+        day = date(2024, 11, 10)
+
+        assert _parse_date_cached("7d", day.toordinal()) == date(2024, 11, 3)
+        assert _parse_date_cached("7d", day.toordinal() + 1) == date(2024, 11, 4)
+
 
 class TestParseRelativeDate:
     """Tests for parse_relative_date function (T033 - US2)."""
@@ -135,3 +149,11 @@ class TestExtractDateFromFilename:
         """Test extracting date with text before date pattern."""
         result = extract_date_from_filename(Path("notes-2024-11-15.md"))
         assert result == date(2024, 11, 15)
+
+    @pytest.mark.parametrize(
+        "filename",
+        ["2024.md", "launch-plan-notes.md", "2024-1101.md", "path/2024-11-01/notes.md"],
+    )
+    def test_names_without_room_for_a_date_return_none(self, filename):
+        """Test names too short or with fewer than two hyphens return None."""
+        assert extract_date_from_filename(Path(filename)) is None
@@ -0,0 +1,114 @@
+"""
+Unit tests for fast file copy helpers.
+
+Tests clone/copy_file_range fallbacks and buffered copying.
+"""
+
+import errno
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ai_journal_kit.core.fastcopy import COPY_BUFFER_SIZE, _copy_file_range, copy_file
+
+
+@pytest.fixture
+def large_file(tmp_path):
+    """A file spanning several copy buffers with a fixed mtime."""
+    source = tmp_path / "large.md"
+    source.write_bytes(os.urandom(COPY_BUFFER_SIZE * 2 + 17))
+    os.utime(source, (1_700_000_000, 1_700_000_000))
+    return source
+
+
+@pytest.mark.unit
+def test_copy_file_preserves_content_and_mtime(large_file, tmp_path):
+    """Test copy keeps content and modification time."""
+    destination = tmp_path / "copy.md"
+
+    copy_file(large_file, destination)
+
+    assert destination.read_bytes() == large_file.read_bytes()
+    assert destination.stat().st_mtime == large_file.stat().st_mtime
+
+
+@pytest.mark.unit
+def test_copy_file_overwrites_existing(large_file, tmp_path):
+    """Test copy replaces an existing destination file."""
+    destination = tmp_path / "copy.md"
+    destination.write_text("old content that is going away")
+
+    copy_file(large_file, destination)
+
+    assert destination.read_bytes() == large_file.read_bytes()
+
+
+@pytest.mark.unit
+def test_copy_file_falls_back_to_buffered_copy(large_file, tmp_path):
+    """Test copy works when no clone or in-kernel copy is available."""
+    destination = tmp_path / "copy.md"
+
+    with (
+        patch("ai_journal_kit.core.fastcopy._clonefile", return_value=False),
+        patch("ai_journal_kit.core.fastcopy._reflink", return_value=False),
+        patch("ai_journal_kit.core.fastcopy._copy_file_range", return_value=False),
+    ):
+        copy_file(large_file, destination)
+
+    assert destination.read_bytes() == large_file.read_bytes()
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="copy_file_range unavailable")
+def test_copy_file_range_unsupported_returns_false(large_file, tmp_path):
+    """Test copy_file_range reports unsupported before anything is written."""
+    destination = tmp_path / "copy.md"
+
+    with (
+        open(large_file, "rb") as fsrc,
+        open(destination, "wb") as fdst,
+        patch("os.copy_file_range", side_effect=OSError(errno.EXDEV, "cross-device")),
+    ):
+        assert _copy_file_range(fsrc, fdst) is False
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="copy_file_range unavailable")
+def test_copy_file_range_real_error_raises(large_file, tmp_path):
+    """Test copy_file_range surfaces errors that aren't about support."""
+    destination = tmp_path / "copy.md"
+
+    with (
+        open(large_file, "rb") as fsrc,
+        open(destination, "wb") as fdst,
+        patch("os.copy_file_range", side_effect=OSError(errno.ENOSPC, "no space")),
+    ):
+        with pytest.raises(OSError):
+            _copy_file_range(fsrc, fdst)
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="copy_file_range unavailable")
+def test_copy_file_range_copying_nothing_falls_back(large_file, tmp_path):
+    """Test a copy_file_range that copies nothing at once falls back to a buffered copy."""
+    destination = tmp_path / "copy.md"
+
+    with (
+        patch("ai_journal_kit.core.fastcopy._clonefile", return_value=False),
+        patch("ai_journal_kit.core.fastcopy._reflink", return_value=False),
+        patch("os.copy_file_range", return_value=0),
+    ):
+        copy_file(large_file, destination)
+
+    assert destination.read_bytes() == large_file.read_bytes()
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="copy_file_range unavailable")
+def test_copy_file_range_empty_source_succeeds(tmp_path):
+    """Test an empty source counts as copied when copy_file_range returns 0."""
+    source = tmp_path / "empty.md"
+    source.write_bytes(b"")
+    with open(source, "rb") as fsrc, open(tmp_path / "copy.md", "wb") as fdst:
+        assert _copy_file_range(fsrc, fdst) is True
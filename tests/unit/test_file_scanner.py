@@ -140,6 +140,57 @@ class TestFileScanner:
         error_msg = str(exc_info.value)
         assert "Unknown entry type" in error_msg or "not in journal" in error_msg
 
+    def test_scan_includes_nested_and_root_files(self, test_journal):
+        """Test unfiltered scans recurse and keep files outside typed folders."""
+        (test_journal / "daily" / "2024").mkdir()
+        (test_journal / "daily" / "2024" / "2024-12-01.md").write_text("# Nested")
+        (test_journal / "WELCOME.md").write_text("# Welcome")
+        (test_journal / "notes.txt").write_text("not markdown")
+
+        scanner = FileScanner(test_journal)
+
+        names = {f.name for f in scanner.scan()}
+        assert {"2024-12-01.md", "WELCOME.md"} <= names
+        assert "notes.txt" not in names
+        # Root files have no entry type, so a type filter leaves them out
+        daily_names = {f.name for f in scanner.scan(entry_types=[EntryType.DAILY])}
+        assert "2024-12-01.md" in daily_names
+        assert "WELCOME.md" not in daily_names
+
+    def test_scan_with_entry_type_filter_skips_other_folders(self, test_journal, monkeypatch):
+        """Test folders of other entry types are never listed."""
+        import os
+
+        listed = []
+        real_scandir = os.scandir
+
+        def recording_scandir(path):
+            listed.append(Path(path).name)
+            return real_scandir(path)
+
+        monkeypatch.setattr("ai_journal_kit.core.file_scanner.os.scandir", recording_scandir)
+
+        FileScanner(test_journal).scan(entry_types=[EntryType.DAILY])
+
+        assert "daily" in listed
+        assert not {"projects", "people", "memories"} & set(listed)
+
+    @pytest.mark.parametrize("pattern", ["*.md", "*-??.md"])
+    def test_name_matcher_case_sensitivity(self, pattern):
+        """Test names match case-insensitively only where rglob would (Windows)."""
+        from ai_journal_kit.core.file_scanner import _name_matcher
+
+        assert _name_matcher(pattern, case_sensitive=True)("note-01.md")
+        assert not _name_matcher(pattern, case_sensitive=True)("NOTE-01.MD")
+        assert _name_matcher(pattern, case_sensitive=False)("NOTE-01.MD")
+        assert not _name_matcher(pattern, case_sensitive=False)("note-01.txt")
+
+    def test_scan_with_custom_pattern(self, test_journal):
+        """Test non-suffix glob patterns are matched against file names."""
+        scanner = FileScanner(test_journal)
+        files = scanner.scan(pattern="2024-11-0?.md")
+        assert sorted(f.name for f in files) == ["2024-11-01.md", "2024-11-05.md"]
+
 
 class TestFileScannerIntegration:
     """Integration tests with real file system (T046 - US3)."""
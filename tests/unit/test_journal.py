@@ -8,8 +8,10 @@ import pytest
 
 from ai_journal_kit.core.journal import (
     REQUIRED_FOLDERS,
+    copy_framework_templates,
     create_structure,
     get_folder_stats,
+    scan_journal,
     validate_structure,
 )
 
@@ -116,6 +118,37 @@ def test_get_folder_stats_ignores_non_markdown(temp_journal_dir):
     assert stats["daily"] == 1
 
 
+@pytest.mark.unit
+def test_scan_journal_answers_all_checks(temp_journal_dir):
+    """Test scan_journal reports folders, markers and counts from one pass."""
+    (temp_journal_dir / "daily").mkdir()
+    (temp_journal_dir / "daily" / "2024-11-01.md").write_text("# Daily")
+    (temp_journal_dir / ".cursor" / "rules").mkdir(parents=True)
+    (temp_journal_dir / ".github").mkdir()
+
+    scan = scan_journal(
+        temp_journal_dir,
+        markers=[".cursor/rules", ".github/copilot-instructions.md", "CLAUDE.md"],
+        count_files=True,
+    )
+
+    assert scan.exists is True
+    assert scan.missing == [folder for folder in REQUIRED_FOLDERS if folder != "daily"]
+    assert scan.markers == {".cursor/rules"}
+    assert scan.stats == {folder: int(folder == "daily") for folder in REQUIRED_FOLDERS}
+
+
+@pytest.mark.unit
+def test_scan_journal_missing_journal(tmp_path):
+    """Test scan_journal reports a journal that can't be read as missing everything."""
+    scan = scan_journal(tmp_path / "missing", markers=["CLAUDE.md"])
+
+    assert scan.exists is False
+    assert scan.missing == REQUIRED_FOLDERS
+    assert scan.markers == set()
+    assert scan.stats == {}
+
+
 @pytest.mark.unit
 def test_create_structure_is_idempotent(temp_journal_dir):
     """Test that create_structure can be called multiple times safely."""
@@ -158,3 +191,28 @@ def test_create_structure_with_gtd_framework(temp_journal_dir):
     assert (temp_journal_dir / "project-template.md").exists()
     assert (temp_journal_dir / "someday-maybe-template.md").exists()
     assert (temp_journal_dir / "waiting-for-template.md").exists()
+
+
+@pytest.mark.unit
+def test_copy_framework_templates_copies_every_markdown_template(temp_journal_dir):
+    """Test copy_framework_templates installs each *.md file of the framework."""
+    from importlib.resources import files
+    from pathlib import Path
+
+    source = Path(str(files("ai_journal_kit.templates").joinpath("frameworks", "para")))
+    expected = sorted(p.name for p in source.glob("*.md"))
+
+    installed = copy_framework_templates("para", temp_journal_dir)
+
+    assert expected
+    assert sorted(installed) == sorted(temp_journal_dir / name for name in expected)
+    assert sorted(p.name for p in temp_journal_dir.iterdir()) == expected
+    for name in expected:
+        assert (temp_journal_dir / name).read_bytes() == (source / name).read_bytes()
+
+
+@pytest.mark.unit
+def test_copy_framework_templates_unknown_framework_is_noop(temp_journal_dir):
+    """Test a framework without templates copies nothing."""
+    assert copy_framework_templates("no-such-framework", temp_journal_dir) == []
+    assert list(temp_journal_dir.iterdir()) == []
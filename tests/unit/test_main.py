@@ -2,10 +2,12 @@
 
 from unittest.mock import patch
 
+import pytest
+
 
 def test_main_calls_app():
     """Test main() function imports and calls app."""
-    with patch("ai_journal_kit.cli.app.app") as mock_app:
+    with patch("ai_journal_kit.cli.app.app") as mock_app, patch("sys.argv", ["ai-journal-kit"]):
         from ai_journal_kit.__main__ import main
 
         main()
@@ -20,7 +22,7 @@ def test_main_module_execution():
 
 def test_main_as_module():
     """Test executing module with python -m (covers line 12)."""
-    with patch("ai_journal_kit.cli.app.app") as mock_app:
+    with patch("ai_journal_kit.cli.app.app") as mock_app, patch("sys.argv", ["ai-journal-kit"]):
         # Read the __main__.py file and execute it with __name__ == "__main__"
         import pathlib
 
@@ -32,3 +34,19 @@ def test_main_as_module():
 
         # The main() function should have been called
         mock_app.assert_called_once()
+
+
+@pytest.mark.parametrize("flag", ["--version", "-v"])
+def test_main_version_fast_path(flag, capsys):
+    """Test a bare --version/-v is answered without calling the Typer app."""
+    from ai_journal_kit import __version__
+    from ai_journal_kit.__main__ import main
+
+    with (
+        patch("ai_journal_kit.cli.app.app") as mock_app,
+        patch("sys.argv", ["ai-journal-kit", flag]),
+    ):
+        main()
+
+    mock_app.assert_not_called()
+    assert capsys.readouterr().out == f"ai-journal-kit version {__version__}\n"
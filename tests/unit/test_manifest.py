@@ -5,6 +5,7 @@ import pytest
 from ai_journal_kit.core.manifest import (
     FileEntry,
     Manifest,
+    find_templates,
     is_in_safe_zone,
 )
 
@@ -138,6 +139,40 @@ def test_manifest_add_file_customized(tmp_path):
     assert manifest.files[file_key].customized is True
 
 
+@pytest.mark.unit
+def test_manifest_add_files_shares_timestamp(tmp_path):
+    """Test adding several files records them under one install timestamp."""
+    manifest = Manifest()
+    files = [tmp_path / "daily-template.md", tmp_path / "project-template.md"]
+    for file_path in files:
+        file_path.write_text(f"{file_path.name} content")
+
+    manifest.add_files(files, source="framework:gtd", relative_to=tmp_path)
+
+    assert set(manifest.files) == {"daily-template.md", "project-template.md"}
+    entries = list(manifest.files.values())
+    assert entries[0].installed_at == entries[1].installed_at
+    assert entries[0].hash != entries[1].hash
+
+
+@pytest.mark.unit
+def test_find_templates(tmp_path):
+    """Test only *-template.md files at the journal root are found."""
+    (tmp_path / "daily-template.md").write_text("daily")
+    (tmp_path / "notes.md").write_text("notes")
+    (tmp_path / "dir-template.md").mkdir()
+    (tmp_path / "daily").mkdir()
+    (tmp_path / "daily" / "nested-template.md").write_text("nested")
+
+    assert find_templates(tmp_path) == [tmp_path / "daily-template.md"]
+
+
+@pytest.mark.unit
+def test_find_templates_missing_journal(tmp_path):
+    """Test a missing journal directory has no templates rather than raising."""
+    assert find_templates(tmp_path / "missing") == []
+
+
 @pytest.mark.unit
 def test_manifest_is_customized_not_tracked(tmp_path):
     """Test is_customized for untracked file."""
@@ -160,6 +195,21 @@ def test_manifest_is_customized_marked_as_customized(tmp_path):
     assert manifest.is_customized(test_file) is True
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("has_file_digest", [True, False])
+def test_manifest_compute_hash_is_sha256(tmp_path, monkeypatch, has_file_digest):
+    """Test _compute_hash gives the SHA256 digest with or without file_digest."""
+    import hashlib
+
+    content = b"# Template\n" * 5000
+    test_file = tmp_path / "big-template.md"
+    test_file.write_bytes(content)
+    if not has_file_digest:
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+
+    assert Manifest._compute_hash(test_file) == hashlib.sha256(content).hexdigest()
+
+
 @pytest.mark.unit
 def test_manifest_is_customized_hash_changed(tmp_path):
     """Test is_customized when file content changed."""
@@ -227,6 +277,49 @@ def test_manifest_is_customized_relative_path(tmp_path):
     assert manifest.is_customized(test_file, relative_to=journal_path) is True
 
 
+@pytest.mark.unit
+def test_manifest_customized_files_matches_is_customized(tmp_path):
+    """Test customized_files agrees with is_customized for each file, in order."""
+    manifest = Manifest()
+    journal_path = tmp_path / "journal"
+    journal_path.mkdir()
+    other_file = tmp_path / "outside-template.md"
+    other_file.write_text("original")
+
+    files = []
+    for name in ["edited", "unchanged", "marked"]:
+        path = journal_path / f"{name}-template.md"
+        path.write_text("original")
+        files.append(path)
+    untracked = journal_path / "untracked-template.md"
+    untracked.write_text("new")
+
+    manifest.add_files(files + [other_file], source="framework:gtd", relative_to=journal_path)
+    files[0].write_text("modified")
+    manifest.mark_customized(files[2], relative_to=journal_path)
+    other_file.write_text("modified")
+
+    candidates = [untracked, other_file] + files
+    expected = [p for p in candidates if manifest.is_customized(p, relative_to=journal_path)]
+
+    assert manifest.customized_files(candidates, relative_to=journal_path) == expected
+    assert expected == [other_file, files[0], files[2]]
+
+
+@pytest.mark.unit
+def test_manifest_customized_files_empty_manifest_skips_checks(tmp_path):
+    """Test an empty manifest reports no customized files without touching them."""
+    from unittest.mock import patch
+
+    manifest = Manifest()
+    missing = tmp_path / "never-created-template.md"
+
+    with patch.object(Manifest, "is_customized") as is_customized:
+        assert manifest.customized_files([missing], relative_to=tmp_path / "elsewhere") == []
+
+    is_customized.assert_not_called()
+
+
 @pytest.mark.unit
 def test_manifest_mark_customized(tmp_path):
     """Test marking a file as customized."""
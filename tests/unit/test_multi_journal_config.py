@@ -3,6 +3,7 @@
 import json
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -222,6 +223,25 @@ def test_load_multi_journal_config_migrates_legacy(tmp_path, monkeypatch):
     assert "active_journal" in loaded_data
 
 
+def test_legacy_config_is_migrated_once(tmp_path, monkeypatch):
+    """Test the migrated config is saved on the first load only."""
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    monkeypatch.setenv("AI_JOURNAL_CONFIG_DIR", str(config_dir))
+    (config_dir / "config.json").write_text(
+        json.dumps({"journal_location": str(tmp_path / "journal"), "ide": "cursor"})
+    )
+
+    with patch(
+        "ai_journal_kit.core.config.save_multi_journal_config",
+        wraps=save_multi_journal_config,
+    ) as mock_save:
+        load_multi_journal_config()
+        load_multi_journal_config()
+
+    mock_save.assert_called_once()
+
+
 def test_get_active_journal_name_env_override(tmp_path, monkeypatch):
     """Test that AI_JOURNAL env var overrides active journal."""
     config_dir = tmp_path / "config"
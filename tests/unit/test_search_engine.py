@@ -11,7 +11,11 @@ from pathlib import Path
 
 import pytest
 
-from ai_journal_kit.core.search_engine import SearchEngine
+from ai_journal_kit.core.search_engine import (
+    SearchEngine,
+    _line_window,
+    compile_search_pattern,
+)
 from ai_journal_kit.core.search_result import EntryType, SearchQuery
 
 
@@ -154,6 +158,22 @@ class TestSearchEngineBasicSearch:
 
         assert result_set.total_count <= 2
 
+    def test_search_iter_yields_same_results_as_search(self, test_journal_path):
+        """Test streamed results match the collected result set."""
+        engine = SearchEngine(test_journal_path)
+        query = SearchQuery(search_text="Entry")
+
+        streamed = list(engine.search_iter(query))
+
+        assert streamed == engine.search(query).results
+
+    def test_search_iter_stops_at_limit(self, test_journal_path):
+        """Test streaming stops once the limit is reached."""
+        engine = SearchEngine(test_journal_path)
+        query = SearchQuery(search_text="Entry", limit=2)
+
+        assert len(list(engine.search_iter(query))) == 2
+
 
 class TestSearchEngineFileSearch:
     """Tests for _search_in_file method (T016 - US1)."""
@@ -193,6 +213,55 @@ class TestSearchEngineFileSearch:
         assert len(results) >= 1
         assert "[special]" in results[0].matched_line
 
+    def test_search_in_file_stops_at_max_results(self, tmp_path):
+        """Test _search_in_file stops once max_results matches are found."""
+        test_dir = tmp_path / "daily"
+        test_dir.mkdir()
+        test_file = test_dir / "2024-11-01.md"
+        test_file.write_text("match one\nmatch two\nmatch three\n")
+
+        engine = SearchEngine(tmp_path)
+        results = engine._search_in_file(test_file, "match", max_results=2)
+
+        assert [r.line_number for r in results] == [1, 2]
+
+    def test_search_in_file_groups_matches_by_line(self, tmp_path):
+        """Test matches found in one pass over the file map back to their lines."""
+        test_dir = tmp_path / "daily"
+        test_dir.mkdir()
+        test_file = test_dir / "2024-11-01.md"
+        test_file.write_bytes(b"Intro\r\nfoo and FOO\r\nnothing\r\nlast foo\r\n")
+
+        engine = SearchEngine(tmp_path)
+        results = engine._search_in_file(test_file, "foo")
+
+        assert [r.line_number for r in results] == [2, 4]
+        assert results[0].matched_line == "foo and FOO"
+        assert results[0].match_positions == [(0, 3), (8, 11)]
+        assert results[0].context_before == ["Intro"]
+        assert results[0].context_after == ["nothing", "last foo"]
+        assert results[1].match_positions == [(5, 8)]
+        assert results[1].context_after == []
+
+    def test_search_in_file_never_matches_across_lines(self, tmp_path):
+        """Test a pattern containing a newline matches no line."""
+        test_dir = tmp_path / "daily"
+        test_dir.mkdir()
+        test_file = test_dir / "2024-11-01.md"
+        test_file.write_text("first\nsecond\n")
+
+        engine = SearchEngine(tmp_path)
+
+        assert engine._search_in_file(test_file, "first\nsecond") == []
+
+    def test_search_pattern_compiled_once_per_query(self):
+        """Test the escaped pattern is cached across files."""
+        pattern = compile_search_pattern("[special]", False)
+
+        assert compile_search_pattern("[special]", False) is pattern
+        assert pattern.search("A [SPECIAL] case")
+        assert not compile_search_pattern("[special]", True).search("A [SPECIAL] case")
+
 
 class TestSearchEngineContextExtraction:
     """Tests for _extract_context method (T017 - US1)."""
@@ -234,6 +303,19 @@ class TestSearchEngineContextExtraction:
         assert context_before == ["Line 0\n", "Line 1\n"]
         assert context_after == []  # No lines after
 
+    @pytest.mark.parametrize(
+        ("text", "line_start", "expected"),
+        [
+            ("a\nb\nc\nmatch\nd\ne\nf\n", 6, (["b", "c", "match", "d", "e"], 2)),
+            ("match\nd\n", 0, (["match", "d"], 0)),
+            ("a\nmatch", 2, (["a", "match"], 1)),
+            ("a\n\nmatch\n\n", 3, (["a", "", "match", ""], 2)),
+        ],
+    )
+    def test_line_window(self, text, line_start, expected):
+        """Test only the matched line and its context are split out of the text."""
+        assert _line_window(text, line_start, context_lines=2) == expected
+
 
 class TestSearchEngineDateFilter:
     """Tests for date filtering (T032, T034 - US2)."""
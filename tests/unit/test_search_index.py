@@ -0,0 +1,252 @@
+"""Unit tests for the persistent search index.
+
+Issue: #6 - Search & Filter Enhancement
+"""
+
+import json
+import os
+import sqlite3
+import time
+
+import pytest
+
+from ai_journal_kit.core.search_engine import SearchEngine
+from ai_journal_kit.core.search_index import (
+    FTS_INDEX_FILENAME,
+    INDEX_FILENAME,
+    RACY_WINDOW_NS,
+    FTSSearchIndex,
+    SearchIndex,
+    fold,
+    index_dir,
+    open_index,
+    query_terms,
+)
+from ai_journal_kit.core.search_result import SearchQuery
+
+
+def _age(path, seconds=10):
+    """Push a file's mtime back so its index entry is trusted."""
+    stamp = time.time_ns() - RACY_WINDOW_NS - seconds * 1_000_000_000
+    os.utime(path, ns=(stamp, stamp))
+
+
+@pytest.fixture
+def journal(tmp_path):
+    """Create a journal whose files are older than the racy window."""
+    daily_dir = tmp_path / "daily"
+    projects_dir = tmp_path / "projects"
+    daily_dir.mkdir()
+    projects_dir.mkdir()
+
+    (daily_dir / "2024-11-01.md").write_text("# Daily Entry\n\nFeeling anxious about the deadline.")
+    (daily_dir / "2024-11-05.md").write_text("# Daily Entry\n\nMet with Sarah about features.")
+    (projects_dir / "q4-launch.md").write_text("# Q4 Launch\n\nProject to launch by Q4.")
+    for path in tmp_path.rglob("*.md"):
+        _age(path)
+
+    return tmp_path
+
+
+def _files(journal):
+    return sorted(journal.rglob("*.md"))
+
+
+class TestQueryTerms:
+    """Tests for query normalization."""
+
+    def test_splits_on_non_word_characters(self):
+        assert query_terms("Q4-Launch") == ["q4", "launch"]
+
+    def test_punctuation_only_query_is_not_narrowed(self):
+        assert query_terms("[[") is None
+
+    def test_non_ascii_query_is_not_narrowed(self):
+        assert query_terms("café") is None
+
+    def test_fold_matches_regex_case_insensitivity(self):
+        # re.IGNORECASE matches the Kelvin sign and long s against k and s
+        assert fold("Key ſun") == "key sun"
+
+
+class TestCandidates:
+    """Tests for narrowing files with the index."""
+
+    def test_keeps_only_files_containing_every_term(self, journal):
+        index = SearchIndex(journal)
+        candidates = index.candidates(_files(journal), "anxious deadline")
+        assert [p.name for p in candidates] == ["2024-11-01.md"]
+
+    def test_terms_match_inside_words(self, journal):
+        index = SearchIndex(journal)
+        candidates = index.candidates(_files(journal), "eatur")
+        assert [p.name for p in candidates] == ["2024-11-05.md"]
+
+    def test_case_insensitive(self, journal):
+        index = SearchIndex(journal)
+        candidates = index.candidates(_files(journal), "SARAH")
+        assert [p.name for p in candidates] == ["2024-11-05.md"]
+
+    def test_kelvin_sign_in_file_is_candidate_for_ascii_query(self, journal):
+        path = journal / "daily" / "2024-11-10.md"
+        path.write_text("UnlocK the door")
+        index = SearchIndex(journal)
+        assert path in index.candidates(_files(journal), "unlock")
+
+    def test_unnarrowable_query_returns_all_files(self, journal):
+        index = SearchIndex(journal)
+        files = _files(journal)
+        assert index.candidates(files, "café") == files
+        assert not (index_dir(journal) / INDEX_FILENAME).exists()
+
+
+class TestPersistence:
+    """Tests for keeping the sidecar fresh."""
+
+    def test_index_is_saved_and_reloaded(self, journal):
+        SearchIndex(journal).refresh(_files(journal))
+
+        data = json.loads((index_dir(journal) / INDEX_FILENAME).read_text())
+        assert set(data["files"]) == {
+            "daily/2024-11-01.md",
+            "daily/2024-11-05.md",
+            "projects/q4-launch.md",
+        }
+        assert SearchIndex(journal).files == data["files"]
+
+    def test_edited_file_is_reindexed(self, journal):
+        SearchIndex(journal).refresh(_files(journal))
+
+        path = journal / "daily" / "2024-11-01.md"
+        path.write_text("Completely different words")
+        _age(path, seconds=5)
+
+        index = SearchIndex(journal)
+        assert index.candidates(_files(journal), "different") == [path]
+        assert index.candidates(_files(journal), "anxious") == []
+
+    def test_recently_modified_file_is_not_trusted(self, journal):
+        path = journal / "daily" / "2024-11-01.md"
+        path.write_text("Fresh content")
+
+        index = SearchIndex(journal)
+        index.refresh(_files(journal))
+        assert index.files["daily/2024-11-01.md"][0] == 0
+
+    def test_removed_file_is_dropped(self, journal):
+        SearchIndex(journal).refresh(_files(journal))
+        (journal / "projects" / "q4-launch.md").unlink()
+
+        index = SearchIndex(journal)
+        index.refresh(_files(journal))
+        assert "projects/q4-launch.md" not in index.files
+
+    def test_files_outside_scan_are_kept(self, journal):
+        SearchIndex(journal).refresh(_files(journal))
+
+        index = SearchIndex(journal)
+        index.refresh(sorted((journal / "daily").glob("*.md")))
+        assert "projects/q4-launch.md" in index.files
+
+    def test_corrupt_sidecar_is_rebuilt(self, journal):
+        index_dir(journal).mkdir(parents=True)
+        (index_dir(journal) / INDEX_FILENAME).write_text("not json")
+
+        index = SearchIndex(journal)
+        assert index.files == {}
+        assert len(index.candidates(_files(journal), "launch")) == 1
+
+    def test_unwritable_sidecar_is_ignored(self, journal):
+        index_dir(journal).mkdir(parents=True)
+        (index_dir(journal) / INDEX_FILENAME).mkdir()
+
+        index = SearchIndex(journal)
+        assert len(index.candidates(_files(journal), "launch")) == 1
+
+
+class TestFTSSearchIndex:
+    """Tests for the SQLite FTS5 trigram index."""
+
+    def test_open_index_prefers_fts(self, journal):
+        index = open_index(journal)
+        assert isinstance(index, FTSSearchIndex)
+        assert (index_dir(journal) / FTS_INDEX_FILENAME).exists()
+
+    def test_index_is_kept_out_of_the_journal(self, journal, tmp_path_factory, monkeypatch):
+        cache_dir = tmp_path_factory.mktemp("cache")
+        monkeypatch.setenv("AI_JOURNAL_CACHE_DIR", str(cache_dir))
+        open_index(journal).refresh(_files(journal))
+        SearchIndex(journal).refresh(_files(journal))
+
+        assert not list(journal.glob("*index*"))
+        assert index_dir(journal).is_relative_to(cache_dir)
+        assert index_dir(journal) != index_dir(journal / "daily")
+
+    def test_open_index_falls_back_to_word_index(self, journal, monkeypatch):
+        def unavailable(cls, journal_path):
+            raise sqlite3.OperationalError("no such tokenizer: trigram")
+
+        monkeypatch.setattr(FTSSearchIndex, "open", classmethod(unavailable))
+        assert isinstance(open_index(journal), SearchIndex)
+
+    def test_matches_substrings_across_words(self, journal):
+        index = FTSSearchIndex.open(journal)
+        candidates = index.candidates(_files(journal), "ABOUT THE DEAD")
+        assert [p.name for p in candidates] == ["2024-11-01.md"]
+
+    def test_glob_characters_match_literally(self, journal):
+        path = journal / "daily" / "2024-11-10.md"
+        path.write_text("See [[people/sarah]] *today*")
+        index = FTSSearchIndex.open(journal)
+        assert index.candidates(_files(journal), "[[people/sarah") == [path]
+        assert index.candidates(_files(journal), "*today*") == [path]
+
+    def test_short_query_is_not_narrowed(self, journal):
+        index = FTSSearchIndex.open(journal)
+        files = _files(journal)
+        assert index.candidates(files, "q4") == files
+
+    def test_edited_and_removed_files_are_refreshed(self, journal):
+        FTSSearchIndex.open(journal).refresh(_files(journal))
+
+        edited = journal / "daily" / "2024-11-01.md"
+        edited.write_text("Completely different words")
+        _age(edited, seconds=5)
+        (journal / "projects" / "q4-launch.md").unlink()
+
+        index = FTSSearchIndex.open(journal)
+        assert index.candidates(_files(journal), "different") == [edited]
+        assert index.candidates(_files(journal), "anxious") == []
+        paths = {path for (path,) in index.connection.execute("SELECT path FROM files")}
+        assert paths == {"daily/2024-11-01.md", "daily/2024-11-05.md"}
+
+    def test_unreadable_database_leaves_every_file(self, journal):
+        index = FTSSearchIndex.open(journal)
+        index.connection.execute("DROP TABLE files")
+
+        files = _files(journal)
+        assert index.refresh(files) == set()
+        assert index.candidates(files, "launch") == files
+
+
+@pytest.mark.parametrize("backend", [SearchIndex, FTSSearchIndex.open])
+def test_engine_results_match_linear_scan(journal, backend):
+    """The index only skips files; results are the same as reading everything."""
+
+    class NoIndex:
+        def candidates(self, files, search_text):
+            return files
+
+    for text in ["daily", "LAUNCH", "q4-", "[[", "with sarah", "t about"]:
+        query = SearchQuery(search_text=text)
+        indexed_engine = SearchEngine(journal)
+        indexed_engine.index = backend(journal)
+        indexed = indexed_engine.search(query)
+
+        linear_engine = SearchEngine(journal)
+        linear_engine.index = NoIndex()
+        linear = linear_engine.search(query)
+
+        assert [(r.file_path, r.line_number) for r in indexed.results] == [
+            (r.file_path, r.line_number) for r in linear.results
+        ]
@@ -6,6 +6,7 @@ Issue: #6 - Search & Filter Enhancement
 Coverage Target: 100%
 """
 
+import io
 from datetime import date
 from pathlib import Path
 
@@ -379,6 +380,41 @@ class TestSearchResultSet:
         assert "anxious" in content
         assert "2024-11-01.md" in content
 
+    def test_export_to_markdown_stream_matches_file(self, tmp_path):
+        """Test exporting to a stream, in any chunk size, writes the same markdown."""
+        results = [
+            SearchResult(
+                file_path=Path(f"daily/2024-11-{day:02d}.md"),
+                entry_type=EntryType.DAILY,
+                entry_date=date(2024, 11, day),
+                line_number=day,
+                matched_line=f"Feeling anxious {day}",
+            )
+            for day in range(1, 6)
+        ]
+        result_set = SearchResultSet(
+            results=results,
+            query=SearchQuery(search_text="anxious"),
+            total_count=5,
+            execution_time_ms=50.0,
+            files_scanned=10,
+        )
+
+        output_file = tmp_path / "results.md"
+        result_set.export_to_markdown(output_file)
+        stream = io.StringIO()
+        result_set.export_to_markdown(stream, chunk_size=2)
+
+        expected = output_file.read_text(encoding="utf-8")
+
+        # The Generated timestamp may tick between the two exports
+        def without_timestamp(text):
+            return [line for line in text.split("\n") if not line.startswith("**Generated**")]
+
+        assert without_timestamp(stream.getvalue()) == without_timestamp(expected)
+        assert expected.endswith("---\n")
+        assert not stream.closed
+
     def test_filter_by_type(self):
         """Test filtering results by entry type."""
         query = SearchQuery(search_text="test")
@@ -0,0 +1,79 @@
+"""
+Unit tests for JSON helpers.
+
+Tests output with and without the optional orjson backend.
+"""
+
+import io
+import json
+
+import pytest
+
+from ai_journal_kit.utils import jsonio
+
+DATA = {"active_journal": "work", "journals": {"work": {"ide": "cursor", "is_active": True}}}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run a test against both the orjson and the stdlib backend."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    return request.param
+
+
+@pytest.mark.unit
+def test_dumps_roundtrips(backend):
+    """Test dumps produces JSON that parses back to the same data."""
+    assert json.loads(jsonio.dumps(DATA)) == DATA
+    assert json.loads(jsonio.dumps(DATA, indent=True)) == DATA
+
+
+@pytest.mark.unit
+def test_dumps_indent_matches_stdlib(backend):
+    """Test indented output matches json.dumps(indent=2) for ASCII data."""
+    assert jsonio.dumps(DATA, indent=True) == json.dumps(DATA, indent=2)
+
+
+@pytest.mark.unit
+def test_dump_writes_to_stream_with_newline(backend):
+    """Test dump writes the document and a trailing newline."""
+    stream = io.StringIO()
+
+    jsonio.dump(DATA, stream, indent=True)
+
+    assert stream.getvalue().endswith("}\n")
+    assert json.loads(stream.getvalue()) == DATA
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("indent", [True, False])
+def test_non_ascii_output_matches_stdlib(backend, indent):
+    """Test non-ASCII text is escaped the same way with either backend."""
+    data = {"location": "/home/zoë/日記", "journals": DATA["journals"]}
+    expected = json.dumps(data, indent=2 if indent else None)
+
+    assert jsonio.dumps(data, indent=indent) == expected
+
+    # A legacy code page console can't encode the raw characters
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="cp1252")
+    jsonio.dump(data, stream, indent=indent)
+    stream.flush()
+    assert raw.getvalue().decode("cp1252") == expected + "\n"
+
+
+@pytest.mark.unit
+def test_dump_file_writes_utf8_atomically(backend, tmp_path):
+    """Test dump_file writes UTF-8 JSON and leaves no temp file behind."""
+    path = tmp_path / "config.json"
+    path.write_text("stale")
+    data = {"location": "/home/zoë/journal", "journals": DATA["journals"]}
+
+    jsonio.dump_file(data, path, indent=True)
+
+    assert json.loads(path.read_bytes()) == data
+    assert "zoë" in path.read_text(encoding="utf-8")
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
@@ -4,9 +4,17 @@ Unit tests for validation utilities.
 Tests framework and IDE validation functions.
 """
 
+from unittest.mock import patch
+
 import pytest
 
-from ai_journal_kit.core.validation import validate_framework, validate_ide
+from ai_journal_kit.core.validation import (
+    FRAMEWORK_DISPLAY_NAMES,
+    VALID_FRAMEWORKS,
+    validate_framework,
+    validate_ide,
+    validate_path,
+)
 
 
 @pytest.mark.unit
@@ -87,3 +95,37 @@ def test_validate_ide_case_insensitive():
 
     result = validate_ide("Windsurf")
     assert result == "windsurf"
+
+
+@pytest.mark.unit
+def test_validate_ide_error_lists_choices_in_order():
+    """Test validate_ide's error names every IDE in a stable order."""
+    with pytest.raises(ValueError) as exc_info:
+        validate_ide("emacs")
+
+    assert "Must be one of: cursor, windsurf, claude-code, copilot, all" in str(exc_info.value)
+
+
+@pytest.mark.unit
+def test_validate_path_trusts_known_parent_state(tmp_path):
+    """Test validate_path skips filesystem checks when the caller already made them."""
+    journal_path = tmp_path / "journal"
+
+    with patch("pathlib.Path.resolve") as resolve, patch("pathlib.Path.exists") as exists:
+        assert validate_path(journal_path, parent_exists=True) == journal_path
+
+    resolve.assert_not_called()
+    exists.assert_not_called()
+
+
+@pytest.mark.unit
+def test_validate_path_rejects_known_missing_parent(tmp_path):
+    """Test validate_path rejects a path whose parent the caller found missing."""
+    with pytest.raises(ValueError, match="Parent directory does not exist"):
+        validate_path(tmp_path / "missing" / "journal", parent_exists=False)
+
+
+@pytest.mark.unit
+def test_framework_display_names_cover_every_framework():
+    """Test every valid framework has a display name."""
+    assert FRAMEWORK_DISPLAY_NAMES.keys() == VALID_FRAMEWORKS